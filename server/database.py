@@ -7,14 +7,23 @@ Application code should never write SQL directly.
 
 import sqlite3
 import os
-from typing import List, Dict, Optional, Any, Tuple
+import math
+import hashlib
+from functools import lru_cache
+from typing import List, Dict, Optional, Any, Tuple, Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 
+from .geo import EARTH_RADIUS_M, bounding_box, filter_by_radius
+
 
 # Database configuration
 DB_PATH = Path(__file__).parent.parent / "reminders.db"
 
+# Per-connection PRAGMAs applied by get_connection() (read at call time, like
+# DB_PATH). Empty by default; the test suite sets e.g. "synchronous=NORMAL".
+CONNECTION_PRAGMAS: Tuple[str, ...] = ()
+
 # Allowed database columns for reminders table (prevents non-DB fields like 'distance' from being persisted)
 # This whitelist matches the actual columns in the reminders table schema
 ALLOWED_REMINDER_FIELDS = {
@@ -25,6 +34,125 @@ ALLOWED_REMINDER_FIELDS = {
 }
 
 
+# Set by _create_location_index() when init_db() builds the R*Tree geofence
+# index; reminder writes and proximity queries only use the index when True
+_location_index_enabled = False
+
+# Reminder columns that determine a reminder's geofence index entry
+LOCATION_FIELDS = frozenset({'location_lat', 'location_lng', 'location_radius'})
+
+
+def _location_key(reminder_id: str) -> int:
+    """
+    Integer R*Tree id for a reminder.
+
+    R*Tree ids must be integers and reminder ids are TEXT, so the key is a
+    64-bit hash of the id. Unlike the implicit reminders rowid, it cannot be
+    renumbered by VACUUM.
+
+    Args:
+        reminder_id: Reminder UUID
+
+    Returns:
+        Signed 64-bit key
+    """
+    digest = hashlib.blake2b(reminder_id.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def _reindex_locations(cursor: sqlite3.Cursor, reminder_ids: List[str]) -> None:
+    """
+    Rewrite the geofence index entries for reminders from their current rows.
+
+    Each entry is the reminder's location expanded by its trigger radius
+    (100m when unset) with geo.bounding_box(). Reminders that no longer exist
+    or have no location are dropped from the index. Boxes are computed here
+    rather than in SQL triggers, so the database file never depends on
+    SQLite's math functions.
+
+    Args:
+        cursor: Cursor inside the transaction that wrote the reminders
+        reminder_ids: IDs of reminders that were created, updated or deleted
+    """
+    if not _location_index_enabled or not reminder_ids:
+        return
+
+    cursor.executemany(
+        "DELETE FROM reminders_location_rtree WHERE id = ?",
+        [(_location_key(reminder_id),) for reminder_id in reminder_ids]
+    )
+    for start in range(0, len(reminder_ids), 500):
+        chunk = reminder_ids[start:start + 500]
+        placeholders = ", ".join(["?"] * len(chunk))
+        cursor.execute(f"""
+            SELECT id, location_lat, location_lng, location_radius
+            FROM reminders
+            WHERE id IN ({placeholders})
+              AND location_lat IS NOT NULL AND location_lng IS NOT NULL
+        """, tuple(chunk))
+        _insert_location_entries(cursor, cursor.fetchall())
+
+
+def _insert_location_entries(cursor: sqlite3.Cursor, rows: List[sqlite3.Row]) -> None:
+    """
+    Add geofence index entries for (id, lat, lng, radius) reminder rows.
+
+    Args:
+        cursor: Cursor inside the current transaction
+        rows: Located reminder rows
+    """
+    entries = []
+    for reminder_id, lat, lng, radius in rows:
+        box = bounding_box(lat, lng, 100 if radius is None else radius)
+        entries.append((_location_key(reminder_id), *box, reminder_id))
+    cursor.executemany(
+        "INSERT INTO reminders_location_rtree VALUES (?, ?, ?, ?, ?, ?)",
+        entries
+    )
+
+
+def _create_location_index(cursor: sqlite3.Cursor) -> None:
+    """
+    Create the R*Tree geofence index and fill it from the reminders table.
+
+    The index is rebuilt on every call. That backfills databases created
+    before the index existed and picks up reminders written by other clients
+    (which do not maintain the index). Entries carry the reminder id in an
+    auxiliary column and are written by this module's reminder writes (see
+    _reindex_locations). SQLite builds without the R*Tree module or math
+    functions (used by find_reminders_within) skip the index; proximity
+    queries then fall back to a scan.
+
+    Args:
+        cursor: Cursor inside init_db's transaction
+    """
+    global _location_index_enabled
+
+    # Earlier schemas kept the index in sync with triggers keyed on rowid
+    for trigger in ("insert", "update", "delete"):
+        cursor.execute(f"DROP TRIGGER IF EXISTS reminders_location_rtree_{trigger}")
+
+    try:
+        cursor.execute("SELECT COS(RADIANS(0))")
+        cursor.execute("DROP TABLE IF EXISTS reminders_location_rtree")
+        cursor.execute("""
+            CREATE VIRTUAL TABLE reminders_location_rtree
+            USING rtree(id, min_lat, max_lat, min_lng, max_lng, +reminder_id)
+        """)
+    except sqlite3.OperationalError as e:
+        print(f"WARNING: Location index unavailable ({e}); proximity queries will scan all reminders")
+        _location_index_enabled = False
+        return
+
+    cursor.execute("""
+        SELECT id, location_lat, location_lng, location_radius
+        FROM reminders
+        WHERE location_lat IS NOT NULL AND location_lng IS NOT NULL
+    """)
+    _insert_location_entries(cursor, cursor.fetchall())
+    _location_index_enabled = True
+
+
 def _get_default_db_path(override: Optional[str] = None) -> str:
     """
     Get the database path, with optional override.
@@ -41,19 +169,28 @@ def _get_default_db_path(override: Optional[str] = None) -> str:
     return override if override is not None else str(DB_PATH)
 
 
-def get_connection(db_path: Optional[str] = None) -> sqlite3.Connection:
+def get_connection(db_path: Optional[str] = None, check_same_thread: bool = True) -> sqlite3.Connection:
     """
     Get database connection with proper configuration.
 
     Args:
-        db_path: Path to SQLite database file
+        db_path: Path to SQLite database file, or a "file:" URI
+            (e.g. "file:name?mode=memory&cache=shared" for a shared in-memory DB)
+        check_same_thread: Set False for connections driven from a threadpool
+            (e.g. streaming generators resumed on different worker threads)
 
     Returns:
         Configured SQLite connection
     """
     db_path = _get_default_db_path(db_path)
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(
+        db_path,
+        check_same_thread=check_same_thread,
+        uri=db_path.startswith("file:")
+    )
     conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(f"PRAGMA {pragma}")
     return conn
 
 
@@ -74,6 +211,9 @@ def init_db(db_path: Optional[str] = None, force: bool = False) -> None:
             # Drop existing tables
             cursor.execute("DROP TABLE IF EXISTS reminders")
             cursor.execute("DROP TABLE IF EXISTS recurrence_patterns")
+            cursor.execute("DROP TABLE IF EXISTS reminders_location_rtree")
+            # DDL runs outside a transaction here, so the drops are already final
+            clear_recurrence_pattern_cache()
 
         # Create reminders table
         cursor.execute("""
@@ -161,6 +301,23 @@ def init_db(db_path: Optional[str] = None, force: bool = False) -> None:
             CREATE INDEX IF NOT EXISTS idx_reminders_location ON reminders(location_lat, location_lng)
         """)
 
+        # Composite index for the common "status + priority" list filter; created_at
+        # as the trailing column lets SQLite return rows already in list order
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_reminders_status_priority
+            ON reminders(status, priority, created_at)
+        """)
+
+        # Composite index for enumerating a pattern's instances; due_date as the
+        # trailing column serves "future instances of this pattern" range scans
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_reminders_recurrence
+            ON reminders(recurrence_id, due_date)
+        """)
+
+        # Spatial index for proximity queries (see _create_location_index)
+        _create_location_index(cursor)
+
         conn.commit()
         print(f"SUCCESS: Database initialized successfully at {db_path}")
 
@@ -197,6 +354,46 @@ def db_query(query: str, params: Tuple = (), db_path: Optional[str] = None) -> L
         conn.close()
 
 
+def db_iter(
+    query: str,
+    params: Tuple = (),
+    batch_size: int = 500,
+    db_path: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Execute SELECT query and yield rows one at a time.
+
+    Rows are pulled from the cursor in batches of ``batch_size`` so peak memory
+    stays bounded regardless of result size. The connection is closed when the
+    generator is exhausted or closed.
+
+    Args:
+        query: SQL SELECT statement
+        params: Query parameters (use ? placeholders)
+        batch_size: Number of rows fetched from SQLite per round trip
+        db_path: Database path
+
+    Yields:
+        Rows as dictionaries
+    """
+    db_path = _get_default_db_path(db_path)
+    conn = get_connection(db_path, check_same_thread=False)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute(query, params)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(row)
+    except sqlite3.Error as e:
+        raise Exception(f"Query failed: {e}")
+    finally:
+        conn.close()
+
+
 def db_execute(query: str, params: Tuple = (), db_path: Optional[str] = None) -> int:
     """
     Execute INSERT/UPDATE/DELETE and return affected row count.
@@ -251,6 +448,37 @@ def db_insert(query: str, params: Tuple = (), db_path: Optional[str] = None) ->
         conn.close()
 
 
+def _execute_reindexed(query: str, params: Tuple, reminder_ids: List[str]) -> int:
+    """
+    Execute a reminder write and refresh those reminders' geofence entries.
+
+    Same contract as db_execute(); the index update runs in the same
+    transaction, so a failed write never leaves the index out of step.
+
+    Args:
+        query: SQL statement
+        params: Query parameters (use ? placeholders)
+        reminder_ids: Reminders whose location may have changed (may be empty)
+
+    Returns:
+        Number of affected rows
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute(query, params)
+        affected = cursor.rowcount
+        _reindex_locations(cursor, reminder_ids)
+        conn.commit()
+        return affected
+    except sqlite3.Error as e:
+        conn.rollback()
+        raise Exception(f"Execute failed: {e}")
+    finally:
+        conn.close()
+
+
 # =============================================================================
 # Domain-Specific Functions (Application Interface)
 # =============================================================================
@@ -264,6 +492,41 @@ def get_reminder_by_id(reminder_id: str) -> Optional[Dict[str, Any]]:
     return results[0] if results else None
 
 
+def _reminder_filters(
+    status: Optional[str] = None,
+    category: Optional[str] = None,
+    priority: Optional[str] = None
+) -> Tuple[str, Tuple[Any, ...]]:
+    """
+    Build the WHERE clause shared by the reminder list/stream/count queries.
+
+    Args:
+        status: Filter by status
+        category: Filter by category
+        priority: Filter by priority
+
+    Returns:
+        Tuple of (" WHERE ..." clause or empty string, bound parameters)
+    """
+    conditions = []
+    params = []
+
+    if status:
+        conditions.append("status = ?")
+        params.append(status)
+
+    if category:
+        conditions.append("category = ?")
+        params.append(category)
+
+    if priority:
+        conditions.append("priority = ?")
+        params.append(priority)
+
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+    return where, tuple(params)
+
+
 def get_all_reminders(
     status: Optional[str] = None,
     category: Optional[str] = None,
@@ -284,25 +547,138 @@ def get_all_reminders(
     Returns:
         List of reminder dictionaries
     """
-    query = "SELECT * FROM reminders WHERE 1=1"
-    params = []
+    where, params = _reminder_filters(status, category, priority)
+    query = f"SELECT * FROM reminders{where} ORDER BY created_at DESC LIMIT ? OFFSET ?"
 
-    if status:
-        query += " AND status = ?"
-        params.append(status)
+    return db_query(query, params + (limit, offset))
 
-    if category:
-        query += " AND category = ?"
-        params.append(category)
 
-    if priority:
-        query += " AND priority = ?"
-        params.append(priority)
+def iter_reminders(
+    status: Optional[str] = None,
+    category: Optional[str] = None,
+    priority: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream all reminders matching the optional filters.
 
-    query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
-    params.extend([limit, offset])
+    Same filters and ordering as get_all_reminders(), but without pagination:
+    rows are yielded lazily via db_iter() instead of being buffered.
 
-    return db_query(query, tuple(params))
+    Args:
+        status: Filter by status ('pending', 'completed', 'snoozed')
+        category: Filter by category
+        priority: Filter by priority
+
+    Yields:
+        Reminder dictionaries
+    """
+    where, params = _reminder_filters(status, category, priority)
+    query = f"SELECT * FROM reminders{where} ORDER BY created_at DESC"
+
+    return db_iter(query, params)
+
+
+def get_reminder_locations() -> List[Tuple[str, float, float, int]]:
+    """
+    Get coordinates for every reminder that has a location.
+
+    Only the columns needed for distance filtering are read, so proximity
+    queries can discard far-away reminders before loading full rows. This is
+    the scan used by find_reminders_within() when the geofence index is
+    unavailable.
+
+    Returns:
+        List of (id, location_lat, location_lng, location_radius) tuples
+    """
+    rows = db_query("""
+        SELECT id, location_lat, location_lng, location_radius
+        FROM reminders
+        WHERE location_lat IS NOT NULL AND location_lng IS NOT NULL
+    """)
+    return [
+        (row["id"], row["location_lat"], row["location_lng"], row["location_radius"])
+        for row in rows
+    ]
+
+
+def find_reminders_within(lat: float, lng: float, radius: float) -> List[Tuple[str, float]]:
+    """
+    Find reminders within range of a search location, nearest first.
+
+    Same matching rule as geo.filter_by_radius(): a reminder matches when its
+    distance is within the search radius or its own radius (100m when unset),
+    whichever is larger. When init_db() built the R*Tree geofence index, SQLite prunes
+    candidates with it and evaluates the Haversine distance, filter and sort
+    itself (the index is only created when SQLite has math functions), so no
+    per-row Python math runs. Otherwise every located reminder is scanned in
+    Python.
+
+    Args:
+        lat: Latitude of search location (degrees)
+        lng: Longitude of search location (degrees)
+        radius: Search radius in meters
+
+    Returns:
+        (id, distance in meters) pairs for matching reminders
+    """
+    if not _location_index_enabled:
+        return filter_by_radius(get_reminder_locations(), lat, lng, radius)
+
+    min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius)
+    query = """
+        SELECT id, distance FROM (
+            SELECT
+                r.id AS id,
+                COALESCE(r.location_radius, 100) AS reminder_radius,
+                ? * ASIN(SQRT(MIN(1.0,
+                    POWER(SIN((RADIANS(r.location_lat) - ?) / 2), 2)
+                    + ? * COS(RADIANS(r.location_lat)) * POWER(SIN(RADIANS(r.location_lng - ?) / 2), 2)
+                ))) AS distance
+            FROM reminders_location_rtree AS box
+            JOIN reminders AS r ON r.id = box.reminder_id
+            WHERE box.max_lat >= ? AND box.min_lat <= ?
+              AND box.max_lng >= ? AND box.min_lng <= ?
+        )
+        WHERE distance <= MAX(?, reminder_radius)
+        ORDER BY distance
+    """
+    lat_rad = math.radians(lat)
+    params = (
+        2 * EARTH_RADIUS_M, lat_rad, math.cos(lat_rad), lng,
+        min_lat, max_lat, min_lng, max_lng,
+        radius
+    )
+    return [(row["id"], row["distance"]) for row in db_query(query, params)]
+
+
+def get_reminders_by_ids(
+    reminder_ids: List[str],
+    db_path: Optional[str] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Get full reminder rows for a set of IDs.
+
+    IDs are queried in chunks to stay under SQLite's bound-parameter limit.
+
+    Args:
+        reminder_ids: Reminder UUIDs
+        db_path: Optional database path override
+
+    Returns:
+        Dictionary mapping reminder ID to reminder dictionary (missing IDs are omitted)
+    """
+    reminders = {}
+    for start in range(0, len(reminder_ids), 500):
+        chunk = reminder_ids[start:start + 500]
+        placeholders = ", ".join(["?"] * len(chunk))
+        rows = db_query(
+            f"SELECT * FROM reminders WHERE id IN ({placeholders})",
+            tuple(chunk),
+            db_path=db_path
+        )
+        for row in rows:
+            reminders[row["id"]] = row
+    return reminders
 
 
 def create_reminder(reminder_data: Dict[str, Any]) -> str:
@@ -325,12 +701,58 @@ def create_reminder(reminder_data: Dict[str, Any]) -> str:
     values = tuple(filtered_data[field] for field in fields)
 
     query = f"INSERT INTO reminders ({field_names}) VALUES ({placeholders})"
-    db_execute(query, values)
+    located = filtered_data.get('location_lat') is not None and filtered_data.get('location_lng') is not None
+    _execute_reindexed(query, values, [filtered_data['id']] if located else [])
 
     # Return the ID from reminder_data (it's a TEXT PRIMARY KEY)
     return reminder_data['id']
 
 
+def bulk_create_reminders(reminders: List[Dict[str, Any]]) -> List[str]:
+    """
+    Create many reminders in a single transaction.
+
+    Reminders are grouped by the set of fields they carry, and each group is
+    written with one prepared INSERT via executemany. A field a reminder omits
+    is left out of its INSERT, so the column default applies.
+
+    Args:
+        reminders: List of reminder dictionaries
+
+    Returns:
+        List of reminder IDs, in input order
+    """
+    if not reminders:
+        return []
+
+    # Records built by the same code share a key set, so this is usually one group
+    groups: Dict[Tuple[str, ...], List[Tuple[Any, ...]]] = {}
+    for reminder in reminders:
+        fields = tuple(field for field in reminder if field in ALLOWED_REMINDER_FIELDS)
+        groups.setdefault(fields, []).append(tuple(reminder[field] for field in fields))
+
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        for fields, rows in groups.items():
+            placeholders = ", ".join(["?"] * len(fields))
+            field_names = ", ".join(fields)
+            query = f"INSERT INTO reminders ({field_names}) VALUES ({placeholders})"
+            cursor.executemany(query, rows)
+        _reindex_locations(cursor, [
+            r['id'] for r in reminders
+            if r.get('location_lat') is not None and r.get('location_lng') is not None
+        ])
+        conn.commit()
+        return [r['id'] for r in reminders]
+    except sqlite3.Error as e:
+        conn.rollback()
+        raise Exception(f"Bulk insert failed: {e}")
+    finally:
+        conn.close()
+
+
 def update_reminder(reminder_id: str, update_data: Dict[str, Any]) -> bool:
     """
     Update reminder fields.
@@ -357,16 +779,18 @@ def update_reminder(reminder_id: str, update_data: Dict[str, Any]) -> bool:
     values.append(reminder_id)
 
     query = f"UPDATE reminders SET {set_clause} WHERE id = ?"
-    affected = db_execute(query, tuple(values))
+    moved = not LOCATION_FIELDS.isdisjoint(filtered_data)
+    affected = _execute_reindexed(query, tuple(values), [reminder_id] if moved else [])
 
     return affected > 0
 
 
 def delete_reminder(reminder_id: str) -> bool:
     """Delete reminder by ID."""
-    affected = db_execute(
+    affected = _execute_reindexed(
         "DELETE FROM reminders WHERE id = ?",
-        (reminder_id,)
+        (reminder_id,),
+        [reminder_id]
     )
     return affected > 0
 
@@ -387,22 +811,8 @@ def count_reminders(
     Returns:
         Count of matching reminders
     """
-    query = "SELECT COUNT(*) as count FROM reminders WHERE 1=1"
-    params = []
-
-    if status:
-        query += " AND status = ?"
-        params.append(status)
-
-    if category:
-        query += " AND category = ?"
-        params.append(category)
-
-    if priority:
-        query += " AND priority = ?"
-        params.append(priority)
-
-    results = db_query(query, tuple(params))
+    where, params = _reminder_filters(status, category, priority)
+    results = db_query(f"SELECT COUNT(*) as count FROM reminders{where}", params)
     return results[0]['count'] if results else 0
 
 
@@ -493,6 +903,29 @@ def get_changes_since(last_sync: Optional[str] = None) -> List[Dict[str, Any]]:
         return db_query("SELECT * FROM reminders ORDER BY updated_at ASC")
 
 
+def iter_changes_since(last_sync: Optional[str] = None, batch_size: int = 256) -> Iterator[Dict[str, Any]]:
+    """
+    Stream reminders changed since last_sync timestamp.
+
+    Same rows and order as get_changes_since(), read through a forward-only
+    cursor instead of being loaded into one list.
+
+    Args:
+        last_sync: ISO 8601 timestamp of last sync (None = all reminders)
+        batch_size: Number of rows fetched from SQLite per round trip
+
+    Yields:
+        Reminder dictionaries changed since last_sync
+    """
+    if last_sync:
+        return db_iter(
+            "SELECT * FROM reminders WHERE updated_at > ? ORDER BY updated_at ASC",
+            (last_sync,),
+            batch_size=batch_size
+        )
+    return db_iter("SELECT * FROM reminders ORDER BY updated_at ASC", batch_size=batch_size)
+
+
 def apply_sync_change(change_id: str, action: str, data: Optional[Dict[str, Any]]) -> bool:
     """
     Apply a single sync change to local database.
@@ -565,13 +998,17 @@ def batch_update_synced_at(reminder_ids: List[str], synced_at: str) -> int:
     cursor = conn.cursor()
 
     try:
-        placeholders = ", ".join(["?"] * len(reminder_ids))
-        query = f"UPDATE reminders SET synced_at = ? WHERE id IN ({placeholders})"
-        params = [synced_at] + reminder_ids
+        # Chunk IDs to stay under SQLite's bound-parameter limit (one transaction)
+        updated = 0
+        for start in range(0, len(reminder_ids), 500):
+            chunk = reminder_ids[start:start + 500]
+            placeholders = ", ".join(["?"] * len(chunk))
+            query = f"UPDATE reminders SET synced_at = ? WHERE id IN ({placeholders})"
+            cursor.execute(query, [synced_at] + chunk)
+            updated += cursor.rowcount
 
-        cursor.execute(query, params)
         conn.commit()
-        return cursor.rowcount
+        return updated
     except sqlite3.Error as e:
         conn.rollback()
         raise Exception(f"Batch update failed: {e}")
@@ -583,6 +1020,16 @@ def batch_update_synced_at(reminder_ids: List[str], synced_at: str) -> int:
 # Recurrence Pattern Operations (Phase 7)
 # =============================================================================
 
+# Days per month (January first); February gains a day in leap years
+DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _days_in_month(year: int, month: int) -> int:
+    """Number of days in month (1-12) of year."""
+    leap_day = month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+    return DAYS_IN_MONTH[month - 1] + leap_day
+
+
 def create_recurrence_pattern(
     pattern_id: str,
     frequency: str,
@@ -634,6 +1081,7 @@ def create_recurrence_pattern(
         ))
 
         conn.commit()
+        clear_recurrence_pattern_cache()
         return pattern_id
     except sqlite3.Error as e:
         conn.rollback()
@@ -642,18 +1090,9 @@ def create_recurrence_pattern(
         conn.close()
 
 
-def get_recurrence_pattern(pattern_id: str, db_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
-    """
-    Get recurrence pattern by ID.
-
-    Args:
-        pattern_id: Pattern UUID
-        db_path: Path to database
-
-    Returns:
-        Pattern dictionary or None if not found
-    """
-    db_path = _get_default_db_path(db_path)
+@lru_cache(maxsize=1024)
+def _get_pattern_cached(pattern_id: str, db_path: str) -> Optional[Tuple[Tuple[str, Any], ...]]:
+    """Pattern row as an immutable tuple of (column, value) pairs, or None."""
     conn = get_connection(db_path)
     cursor = conn.cursor()
 
@@ -664,11 +1103,40 @@ def get_recurrence_pattern(pattern_id: str, db_path: Optional[str] = None) -> Op
         """, (pattern_id,))
 
         row = cursor.fetchone()
-        return dict(row) if row else None
+        return tuple(zip(row.keys(), row)) if row else None
     finally:
         conn.close()
 
 
+def clear_recurrence_pattern_cache() -> None:
+    """
+    Forget cached recurrence patterns.
+
+    Called by every pattern write in this module; call it after changing
+    recurrence_patterns with raw SQL.
+    """
+    _get_pattern_cached.cache_clear()
+
+
+def get_recurrence_pattern(pattern_id: str, db_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Get recurrence pattern by ID.
+
+    Patterns are read far more often than written (once per generation
+    run), so rows are memoized per (pattern_id, database) until the next
+    create/update/delete. Each call returns a fresh dict.
+
+    Args:
+        pattern_id: Pattern UUID
+        db_path: Path to database
+
+    Returns:
+        Pattern dictionary or None if not found
+    """
+    row = _get_pattern_cached(pattern_id, _get_default_db_path(db_path))
+    return dict(row) if row is not None else None
+
+
 def update_recurrence_pattern(
     pattern_id: str,
     frequency: Optional[str] = None,
@@ -740,6 +1208,7 @@ def update_recurrence_pattern(
 
         cursor.execute(query, params)
         conn.commit()
+        clear_recurrence_pattern_cache()
         return cursor.rowcount > 0
     except sqlite3.Error as e:
         conn.rollback()
@@ -778,6 +1247,7 @@ def delete_recurrence_pattern(pattern_id: str, db_path: Optional[str] = None) ->
         """, (pattern_id,))
 
         conn.commit()
+        clear_recurrence_pattern_cache()
         return cursor.rowcount > 0
     except sqlite3.Error as e:
         conn.rollback()
@@ -786,6 +1256,121 @@ def delete_recurrence_pattern(pattern_id: str, db_path: Optional[str] = None) ->
         conn.close()
 
 
+def _weekly_dates(pattern: Dict[str, Any], start_date, end_date) -> list:
+    """
+    Enumerate the due dates of a weekly pattern.
+
+    Walks whole weeks (Monday-based), stepping `interval` weeks at a time
+    from the start date's week, and emits the chosen weekdays of each week
+    in order, so an every-2-weeks pattern really skips the weeks between.
+
+    Args:
+        pattern: Recurrence pattern dictionary ('weekly')
+        start_date: First candidate date
+        end_date: Last date (inclusive) that may be generated
+
+    Returns:
+        Due dates in order, at most end_count of them
+    """
+    from datetime import date
+
+    end_count = pattern.get('end_count')
+    step = 7 * max(pattern.get('interval') or 1, 1)
+
+    # days_of_week is comma-separated: "0,2,4" for Mon, Wed, Fri. Without it
+    # the pattern repeats on the start date's weekday. Out-of-range numbers
+    # never match a weekday, so they are dropped.
+    if pattern.get('days_of_week'):
+        offsets = sorted({int(d) for d in pattern['days_of_week'].split(',')} & set(range(7)))
+    else:
+        offsets = [start_date.weekday()]
+    if not offsets:
+        return []
+
+    # Day arithmetic on proleptic ordinals; dates are built only when emitted
+    start_ord = start_date.toordinal()
+    end_ord = end_date.toordinal()
+    ordinals = []
+
+    for week_ord in range(start_ord - start_date.weekday(), end_ord + 1, step):
+        for offset in offsets:
+            day_ord = week_ord + offset
+            if day_ord < start_ord:
+                continue
+            if day_ord > end_ord or (end_count and len(ordinals) >= end_count):
+                return [date.fromordinal(o) for o in ordinals]
+            ordinals.append(day_ord)
+
+    return [date.fromordinal(o) for o in ordinals]
+
+
+def _recurrence_dates(pattern: Dict[str, Any], start_date, end_date) -> list:
+    """
+    Enumerate the due dates of a recurrence pattern.
+
+    Args:
+        pattern: Recurrence pattern dictionary
+        start_date: First candidate date
+        end_date: Last date (inclusive) that may be generated
+
+    Returns:
+        Due dates in order, at most end_count of them
+    """
+    from datetime import date
+
+    frequency = pattern['frequency']
+    interval = pattern.get('interval', 1)
+    end_count = pattern.get('end_count')
+
+    if frequency == 'weekly':
+        return _weekly_dates(pattern, start_date, end_date)
+
+    if frequency == 'daily':
+        # Evenly spaced: a range over proleptic ordinals, converted once
+        ordinals = range(start_date.toordinal(), end_date.toordinal() + 1, max(interval or 1, 1))
+        if end_count:
+            ordinals = ordinals[:end_count]
+        return [date.fromordinal(o) for o in ordinals]
+
+    day_of_month = pattern.get('day_of_month') if frequency == 'monthly' else None
+
+    dates = []
+    current_date = start_date
+
+    while current_date <= end_date:
+        # Check end_count limit
+        if end_count and len(dates) >= end_count:
+            break
+
+        # For monthly recurrence, jump to the next date on day_of_month: later
+        # this month if it has that day, else the 1st of next month
+        if day_of_month and current_date.day != day_of_month:
+            year, month = current_date.year, current_date.month
+            if current_date.day < day_of_month <= _days_in_month(year, month):
+                current_date = date(year, month, day_of_month)
+            else:
+                current_date = date(year + month // 12, month % 12 + 1, 1)
+            continue
+
+        dates.append(current_date)
+
+        # Advance to next occurrence
+        if frequency == 'monthly':
+            # Monthly: advance month by interval
+            months = current_date.year * 12 + current_date.month - 1 + interval
+            year, month = divmod(months, 12)
+            month += 1
+            # Clamp day overflow (e.g., Jan 31 -> Feb 28)
+            current_date = date(year, month, min(current_date.day, _days_in_month(year, month)))
+        elif frequency == 'yearly':
+            # Feb 29 falls back to Feb 28 in common years
+            year = current_date.year + interval
+            month = current_date.month
+            current_date = date(year, month, min(current_date.day, _days_in_month(year, month)))
+
+    return dates
+
+
 def generate_recurrence_instances(
     base_reminder: Dict[str, Any],
     pattern: Dict[str, Any],
@@ -795,6 +1380,9 @@ def generate_recurrence_instances(
     """
     Generate recurring reminder instances based on pattern.
 
+    Due dates are enumerated first (_recurrence_dates), then every instance
+    is written with a single executemany in one transaction.
+
     Args:
         base_reminder: The template reminder with all fields
         pattern: Recurrence pattern dictionary
@@ -810,13 +1398,9 @@ def generate_recurrence_instances(
     db_path = _get_default_db_path(db_path)
     conn = get_connection(db_path)
     cursor = conn.cursor()
-    generated_ids = []
 
     try:
-        frequency = pattern['frequency']
-        interval = pattern.get('interval', 1)
         end_date_str = pattern.get('end_date')
-        end_count = pattern.get('end_count')
 
         # Parse start date from base reminder's due_date or use today
         start_date_str = base_reminder.get('due_date')
@@ -836,102 +1420,46 @@ def generate_recurrence_instances(
         # Determine actual end date (whichever comes first)
         end_date = min(horizon_end, pattern_end) if pattern_end else horizon_end
 
-        # Generate instances
-        current_date = start_date
-        instance_count = 0
+        due_dates = _recurrence_dates(pattern, start_date, end_date)
+        generated_ids = [str(uuid.uuid4()) for _ in due_dates]
         now = datetime.now(timezone.utc).isoformat()
 
-        while current_date <= end_date:
-            # Check end_count limit
-            if end_count and instance_count >= end_count:
-                break
+        # Every column except id and due_date is the same for all instances
+        text = base_reminder['text']
+        shared_values = (
+            base_reminder.get('due_time'),
+            base_reminder.get('time_required', False),
+            base_reminder.get('location_name'),
+            base_reminder.get('location_address'),
+            base_reminder.get('location_lat'),
+            base_reminder.get('location_lng'),
+            base_reminder.get('location_radius', 100),
+            base_reminder.get('priority', 'chill'),
+            base_reminder.get('category'),
+            base_reminder.get('status', 'pending'),
+            base_reminder.get('completed_at'),
+            base_reminder.get('snoozed_until'),
+            base_reminder.get('recurrence_id'),
+            base_reminder.get('source', 'manual'),
+            now,
+            now
+        )
 
-            # For weekly recurrence, check if current day matches pattern
-            if frequency == 'weekly':
-                days_of_week = pattern.get('days_of_week')
-                if days_of_week:
-                    # days_of_week is comma-separated: "0,2,4" for Mon, Wed, Fri
-                    allowed_days = [int(d) for d in days_of_week.split(',')]
-                    if current_date.weekday() not in allowed_days:
-                        current_date += timedelta(days=1)
-                        continue
-
-            # For monthly recurrence, check day of month
-            if frequency == 'monthly':
-                day_of_month = pattern.get('day_of_month')
-                if day_of_month and current_date.day != day_of_month:
-                    current_date += timedelta(days=1)
-                    continue
-
-            # Create instance
-            instance_id = str(uuid.uuid4())
-            instance_data = base_reminder.copy()
-            instance_data['id'] = instance_id
-            instance_data['due_date'] = current_date.isoformat()
-            instance_data['created_at'] = now
-            instance_data['updated_at'] = now
-
-            # Insert instance
-            cursor.execute("""
-                INSERT INTO reminders (
-                    id, text, due_date, due_time, time_required,
-                    location_name, location_address, location_lat, location_lng, location_radius,
-                    priority, category, status, completed_at, snoozed_until,
-                    recurrence_id, source, created_at, updated_at
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                instance_data['id'],
-                instance_data['text'],
-                instance_data['due_date'],
-                instance_data.get('due_time'),
-                instance_data.get('time_required', False),
-                instance_data.get('location_name'),
-                instance_data.get('location_address'),
-                instance_data.get('location_lat'),
-                instance_data.get('location_lng'),
-                instance_data.get('location_radius', 100),
-                instance_data.get('priority', 'chill'),
-                instance_data.get('category'),
-                instance_data.get('status', 'pending'),
-                instance_data.get('completed_at'),
-                instance_data.get('snoozed_until'),
-                instance_data.get('recurrence_id'),
-                instance_data.get('source', 'manual'),
-                instance_data['created_at'],
-                instance_data['updated_at']
-            ))
-
-            generated_ids.append(instance_id)
-            instance_count += 1
-
-            # Advance to next occurrence
-            if frequency == 'daily':
-                current_date += timedelta(days=interval)
-            elif frequency == 'weekly':
-                # For weekly, advance day by day to check each day
-                current_date += timedelta(days=1)
-                # After checking 7 days, skip ahead by (interval-1) weeks
-                if current_date.weekday() == start_date.weekday():
-                    if interval > 1:
-                        current_date += timedelta(weeks=interval - 1)
-            elif frequency == 'monthly':
-                # Monthly: advance month by interval
-                month = current_date.month + interval
-                year = current_date.year
-                while month > 12:
-                    month -= 12
-                    year += 1
-                # Handle day overflow (e.g., Jan 31 -> Feb 28)
-                try:
-                    current_date = date(year, month, current_date.day)
-                except ValueError:
-                    # Day doesn't exist in target month, use last day
-                    import calendar
-                    last_day = calendar.monthrange(year, month)[1]
-                    current_date = date(year, month, last_day)
-            elif frequency == 'yearly':
-                current_date = date(current_date.year + interval, current_date.month, current_date.day)
+        cursor.executemany("""
+            INSERT INTO reminders (
+                id, text, due_date, due_time, time_required,
+                location_name, location_address, location_lat, location_lng, location_radius,
+                priority, category, status, completed_at, snoozed_until,
+                recurrence_id, source, created_at, updated_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            # Rows are built one at a time as sqlite3 consumes them
+            (instance_id, text, due_date.isoformat()) + shared_values
+            for instance_id, due_date in zip(generated_ids, due_dates)
+        ))
+        if base_reminder.get('location_lat') is not None and base_reminder.get('location_lng') is not None:
+            _reindex_locations(cursor, generated_ids)
 
         conn.commit()
         return generated_ids
@@ -0,0 +1,120 @@
+"""
+geo.py - Location math for proximity queries
+
+Distances are computed on plain (id, lat, lng, radius) tuples so that the
+location path can filter a whole column batch before any reminder rows or
+Pydantic models are built.
+"""
+
+import math
+from typing import Iterable, List, Tuple
+
+# Earth's radius in meters
+EARTH_RADIUS_M = 6371000
+
+# Meters per degree of latitude (and of longitude at the equator)
+METERS_PER_DEGREE = EARTH_RADIUS_M * math.pi / 180
+
+
+def haversine_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """
+    Calculate distance between two coordinates using Haversine formula.
+
+    Args:
+        lat1: Latitude of first point (degrees)
+        lng1: Longitude of first point (degrees)
+        lat2: Latitude of second point (degrees)
+        lng2: Longitude of second point (degrees)
+
+    Returns:
+        Distance in meters
+    """
+    # Convert degrees to radians
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    delta_lat = math.radians(lat2 - lat1)
+    delta_lng = math.radians(lng2 - lng1)
+
+    # Haversine formula
+    a = (math.sin(delta_lat / 2) ** 2 +
+         math.cos(lat1_rad) * math.cos(lat2_rad) *
+         math.sin(delta_lng / 2) ** 2)
+    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+    return EARTH_RADIUS_M * c
+
+
+def filter_by_radius(
+    points: Iterable[Tuple[str, float, float, int]],
+    lat: float,
+    lng: float,
+    radius: float
+) -> List[Tuple[str, float]]:
+    """
+    Find points within range of a search location.
+
+    A point matches when its distance is within the search radius or its own
+    radius, whichever is larger (same rule as the reminder geofence).
+    Terms that depend only on the search location are computed once.
+
+    Args:
+        points: (id, lat, lng, radius) tuples; radius may be None (defaults to 100m)
+        lat: Latitude of search location (degrees)
+        lng: Longitude of search location (degrees)
+        radius: Search radius in meters
+
+    Returns:
+        (id, distance) pairs for matching points, nearest first
+    """
+    radians = math.radians
+    sin = math.sin
+    cos = math.cos
+    asin = math.asin
+    sqrt = math.sqrt
+
+    lat_rad = radians(lat)
+    cos_lat = cos(lat_rad)
+    diameter = 2 * EARTH_RADIUS_M
+
+    matches = []
+    for point_id, point_lat, point_lng, point_radius in points:
+        point_lat_rad = radians(point_lat)
+        half_dlat = sin((point_lat_rad - lat_rad) / 2)
+        half_dlng = sin(radians(point_lng - lng) / 2)
+        a = half_dlat * half_dlat + cos_lat * cos(point_lat_rad) * half_dlng * half_dlng
+        distance = diameter * asin(sqrt(min(1.0, a)))
+
+        effective_radius = max(radius, point_radius if point_radius is not None else 100)
+        if distance <= effective_radius:
+            matches.append((point_id, distance))
+
+    matches.sort(key=lambda match: match[1])
+    return matches
+
+
+def bounding_box(lat: float, lng: float, radius: float) -> Tuple[float, float, float, float]:
+    """
+    Degree box that contains every point within radius meters of (lat, lng).
+
+    Boxes that would cross the antimeridian (or get close to a pole, where a
+    meter of longitude spans many degrees) cover the full longitude range
+    instead of wrapping, so callers only ever need one range query. The
+    geofence index stores these boxes too (database._reindex_locations()).
+
+    Args:
+        lat: Latitude of center (degrees)
+        lng: Longitude of center (degrees)
+        radius: Radius in meters
+
+    Returns:
+        (min_lat, max_lat, min_lng, max_lng)
+    """
+    delta_lat = radius / METERS_PER_DEGREE
+    delta_lng = radius / (METERS_PER_DEGREE * max(math.cos(math.radians(lat)), 0.0001))
+
+    min_lng = lng - delta_lng
+    max_lng = lng + delta_lng
+    if min_lng < -180 or max_lng > 180:
+        min_lng, max_lng = -180.0, 180.0
+
+    return lat - delta_lat, lat + delta_lat, min_lng, max_lng
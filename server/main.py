@@ -5,37 +5,44 @@ ADHD-Friendly Voice Reminders System
 Phase 1: Core Backend REST API
 """
 
-from fastapi import FastAPI, Depends, HTTPException, Header, Query, File, UploadFile, Request
+from fastapi import FastAPI, Body, Depends, HTTPException, Header, Query, File, UploadFile, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from fastapi.routing import APIRoute
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from typing import Optional, List
+from typing import Annotated, Optional, List, Tuple
 import uuid
-import math
 import os
+import sys
 import tempfile
 
+import orjson
+
 from . import config
 from . import database as db
+from .geo import haversine_distance
 from .models import (
     ReminderCreate,
     ReminderUpdate,
     ReminderResponse,
     ReminderListResponse,
-    PaginationMetadata,
     HealthResponse,
     ErrorResponse,
     SyncRequest,
     SyncResponse,
     SyncChange,
-    ConflictInfo,
+    SyncAction,
+    ReminderPatch,
     RecurrencePatternCreate,
     RecurrencePatternResponse,
     VoiceTranscriptionResponse,
     ReminderParseRequest,
-    ReminderParseResponse
+    ReminderParseResponse,
+    CONFLICTS_ADAPTER
 )
 
 
@@ -43,13 +50,61 @@ from .models import (
 # FastAPI App Initialization
 # =============================================================================
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application startup/shutdown hook.
+
+    Builds the OpenAPI schema once at startup. FastAPI caches it on the app,
+    but otherwise the first /docs or /openapi.json hit pays for generating
+    schemas for every model. On shutdown, closes the parsers' shared clients.
+    """
+    app.openapi()
+    yield
+
+    # Close the voice parsers' shared HTTP clients, if a parse ever ran
+    voice_parser = sys.modules.get("server.voice.parser")
+    if voice_parser is not None:
+        await voice_parser.close_shared_clients()
+
+
+class ORJSONRequest(Request):
+    """
+    Request whose JSON body is decoded with orjson instead of the stdlib.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so FastAPI still
+    turns malformed bodies into its usual 422 json_invalid response.
+    """
+
+    async def json(self):
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """Route class that hands endpoints an ORJSONRequest (large sync batches)."""
+
+    def get_route_handler(self):
+        original_route_handler = super().get_route_handler()
+
+        async def route_handler(request: Request):
+            return await original_route_handler(ORJSONRequest(request.scope, request.receive))
+
+        return route_handler
+
+
 app = FastAPI(
     title="ADHD-Friendly Reminders API",
     description="Offline-first reminders system with voice input support",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
+# Must be set before any routes are registered
+app.router.route_class = ORJSONRoute
 
 # Add CORS middleware
 app.add_middleware(
@@ -89,7 +144,9 @@ async def verify_token(authorization: str = Header(None)) -> str:
             detail="Missing or invalid authorization header. Use: Bearer YOUR_TOKEN"
         )
 
-    token = authorization.replace("Bearer ", "")
+    # Slice off the prefix rather than str.replace(), which rescans the whole
+    # header and would also strip "Bearer " occurring inside the token
+    token = authorization[len("Bearer "):]
 
     if not config.API_TOKEN:
         raise HTTPException(
@@ -120,35 +177,96 @@ def generate_uuid() -> str:
     return str(uuid.uuid4())
 
 
-def haversine_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+def build_reminder_record(
+    reminder: ReminderCreate,
+    reminder_id: str,
+    recurrence_id: Optional[str],
+    current_time: str
+) -> dict:
+    """
+    Build the reminders-table row for a validated create request.
+
+    Args:
+        reminder: Validated reminder data
+        reminder_id: ID to assign
+        recurrence_id: Recurrence pattern ID (if any)
+        current_time: Timestamp used for created_at/updated_at
+
+    Returns:
+        Dictionary of reminder columns
+    """
+    return {
+        "id": reminder_id,
+        "text": reminder.text,
+        "due_date": reminder.due_date,
+        "due_time": reminder.due_time,
+        "time_required": 1 if reminder.time_required else 0,
+        "location_name": reminder.location_name,
+        "location_address": reminder.location_address,
+        "location_lat": reminder.location_lat,
+        "location_lng": reminder.location_lng,
+        "location_radius": reminder.location_radius,
+        "priority": reminder.priority,
+        "category": reminder.category,
+        "status": reminder.status,
+        "completed_at": None,
+        "snoozed_until": reminder.snoozed_until,
+        "recurrence_id": recurrence_id,
+        "source": reminder.source,
+        "created_at": current_time,
+        "updated_at": current_time,
+        "synced_at": None
+    }
+
+
+def apply_client_change(change: SyncChange, current_time: str) -> Tuple[bool, Optional[dict]]:
     """
-    Calculate distance between two coordinates using Haversine formula.
+    Apply one client change to the server database (last-write-wins).
+
+    An update to a reminder that also has a server timestamp is a conflict:
+    the newer timestamp wins, and the client change is skipped when the
+    server copy is newer.
 
     Args:
-        lat1: Latitude of first point (degrees)
-        lng1: Longitude of first point (degrees)
-        lat2: Latitude of second point (degrees)
-        lng2: Longitude of second point (degrees)
+        change: Validated client change
+        current_time: Timestamp recorded as synced_at for applied changes
 
     Returns:
-        Distance in meters
+        (applied, conflict) where conflict is a ConflictInfo-shaped dict or None
     """
-    # Earth's radius in meters
-    R = 6371000
+    conflict = None
 
-    # Convert degrees to radians
-    lat1_rad = math.radians(lat1)
-    lat2_rad = math.radians(lat2)
-    delta_lat = math.radians(lat2 - lat1)
-    delta_lng = math.radians(lng2 - lng1)
+    # Check if reminder exists on server
+    existing = db.get_reminder_by_id(change.id)
 
-    # Haversine formula
-    a = (math.sin(delta_lat / 2) ** 2 +
-         math.cos(lat1_rad) * math.cos(lat2_rad) *
-         math.sin(delta_lng / 2) ** 2)
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    # Detect conflicts (both client and server modified same reminder)
+    if change.action == "update" and existing:
+        client_updated_at = change.updated_at
+        server_updated_at = existing.get("updated_at")
 
-    return R * c
+        # Conflict: both updated since last sync
+        if server_updated_at and client_updated_at:
+            conflict = {
+                "id": change.id,
+                "client_updated_at": client_updated_at,
+                "server_updated_at": server_updated_at,
+                "resolution": "client_wins"
+            }
+            # Last-write-wins: Compare timestamps
+            if server_updated_at > client_updated_at:
+                # Server wins - skip client change
+                conflict["resolution"] = "server_wins"
+                return False, conflict
+
+    # Apply the change
+    data = change.data.model_dump(exclude_unset=True) if change.data else None
+    success = db.apply_sync_change(change.id, change.action, data)
+
+    # Update synced_at for this reminder
+    if success and change.action != "delete":
+        db.update_synced_at(change.id, current_time)
+
+    return success, conflict
 
 
 # =============================================================================
@@ -236,28 +354,7 @@ async def create_reminder(request: Request, reminder: ReminderCreate):
             )
 
         # Build reminder data dictionary
-        reminder_data = {
-            "id": reminder_id,
-            "text": reminder.text,
-            "due_date": reminder.due_date,
-            "due_time": reminder.due_time,
-            "time_required": 1 if reminder.time_required else 0,
-            "location_name": reminder.location_name,
-            "location_address": reminder.location_address,
-            "location_lat": reminder.location_lat,
-            "location_lng": reminder.location_lng,
-            "location_radius": reminder.location_radius,
-            "priority": reminder.priority,
-            "category": reminder.category,
-            "status": reminder.status,
-            "completed_at": None,
-            "snoozed_until": reminder.snoozed_until,
-            "recurrence_id": pattern_id,
-            "source": reminder.source,
-            "created_at": current_time,
-            "updated_at": current_time,
-            "synced_at": None
-        }
+        reminder_data = build_reminder_record(reminder, reminder_id, pattern_id, current_time)
 
         # If recurrence pattern exists, generate instances instead of single reminder
         if reminder.recurrence_pattern and pattern_id:
@@ -274,16 +371,72 @@ async def create_reminder(request: Request, reminder: ReminderCreate):
                 if generated_ids:
                     first_instance = db.get_reminder_by_id(generated_ids[0])
                     if first_instance:
-                        return ReminderResponse(**first_instance)
+                        return ReminderResponse.from_row(first_instance)
 
         # No recurrence - create single reminder
         db.create_reminder(reminder_data)
-        return ReminderResponse(**reminder_data)
+        return ReminderResponse.from_row(reminder_data)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create reminder: {str(e)}")
 
 
+# Most reminders accepted by one POST /api/reminders/bulk request
+MAX_BULK_REMINDERS = 500
+
+
+@app.post(
+    "/api/reminders/bulk",
+    response_model=List[ReminderResponse],
+    status_code=201,
+    tags=["Reminders"],
+    summary="Create multiple reminders",
+    dependencies=[Depends(verify_token)]
+)
+@limiter.limit("10/minute")
+async def create_reminders_bulk(
+    request: Request,
+    reminders: Annotated[List[ReminderCreate], Body(max_length=MAX_BULK_REMINDERS)]
+):
+    """
+    Create several reminders in one request.
+
+    The list is validated as a whole and inserted in a single transaction, so
+    either every reminder is created or none is. Recurring reminders must be
+    created through POST /api/reminders, which generates their instances.
+
+    Requires authentication via Bearer token.
+
+    Args:
+        reminders: List of reminder data
+
+    Returns:
+        Created reminders, in request order
+
+    Raises:
+        400: If any reminder has a recurrence_pattern
+        422: If more than MAX_BULK_REMINDERS reminders are sent
+    """
+    if any(reminder.recurrence_pattern for reminder in reminders):
+        raise HTTPException(
+            status_code=400,
+            detail="Recurring reminders must be created individually via POST /api/reminders"
+        )
+
+    try:
+        current_time = get_current_timestamp()
+        records = [
+            build_reminder_record(reminder, generate_uuid(), reminder.recurrence_id, current_time)
+            for reminder in reminders
+        ]
+
+        db.bulk_create_reminders(records)
+        return records
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to create reminders: {str(e)}")
+
+
 @app.get(
     "/api/reminders",
     response_model=ReminderListResponse,
@@ -298,11 +451,16 @@ async def list_reminders(
     category: Optional[str] = Query(None, description="Filter by category"),
     priority: Optional[str] = Query(None, description="Filter by priority (chill, important, urgent)"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of results"),
-    offset: int = Query(0, ge=0, description="Number of results to skip")
+    offset: int = Query(0, ge=0, description="Number of results to skip"),
+    ids: Optional[str] = Query(None, description="Comma-separated reminder IDs to fetch in one request")
 ):
     """
     List reminders with optional filters and pagination.
 
+    With ids, only those reminders are returned (in the order given, unknown
+    IDs skipped), fetched in one IN query instead of one request per ID. The
+    other filters still apply.
+
     Requires authentication via Bearer token.
 
     Args:
@@ -311,11 +469,39 @@ async def list_reminders(
         priority: Filter by priority
         limit: Maximum results per page
         offset: Number of results to skip
+        ids: Comma-separated reminder IDs
 
     Returns:
         List of reminders with pagination metadata
     """
     try:
+        if ids is not None:
+            requested_ids = list(dict.fromkeys(i for i in ids.split(",") if i))
+            reminders_by_id = db.get_reminders_by_ids(requested_ids)
+            matches = []
+            for reminder_id in requested_ids:
+                reminder = reminders_by_id.get(reminder_id)
+                if reminder is None:
+                    continue
+                if status and reminder["status"] != status:
+                    continue
+                if category and reminder["category"] != category:
+                    continue
+                if priority and reminder["priority"] != priority:
+                    continue
+                matches.append(reminder)
+            reminders = matches[offset:offset + limit]
+
+            return {
+                "data": reminders,
+                "pagination": {
+                    "total": len(matches),
+                    "limit": limit,
+                    "offset": offset,
+                    "returned": len(reminders)
+                }
+            }
+
         # Get reminders from database
         reminders = db.get_all_reminders(
             status=status,
@@ -332,26 +518,61 @@ async def list_reminders(
             priority=priority
         )
 
-        # Convert to response models
-        reminder_responses = [ReminderResponse(**reminder) for reminder in reminders]
-
-        # Build pagination metadata
-        pagination = PaginationMetadata(
-            total=total_count,
-            limit=limit,
-            offset=offset,
-            returned=len(reminder_responses)
-        )
-
-        return ReminderListResponse(
-            data=reminder_responses,
-            pagination=pagination
-        )
+        # Rows are returned as-is: FastAPI validates and serializes them against
+        # response_model once, so building intermediate models here is pure overhead
+        return {
+            "data": reminders,
+            "pagination": {
+                "total": total_count,
+                "limit": limit,
+                "offset": offset,
+                "returned": len(reminders)
+            }
+        }
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list reminders: {str(e)}")
 
 
+@app.get(
+    "/api/reminders/stream",
+    tags=["Reminders"],
+    summary="Stream reminders as NDJSON",
+    response_class=StreamingResponse,
+    dependencies=[Depends(verify_token)]
+)
+@limiter.limit("60/minute")
+async def stream_reminders(
+    request: Request,
+    status: Optional[str] = Query(None, description="Filter by status (pending, completed, snoozed)"),
+    category: Optional[str] = Query(None, description="Filter by category"),
+    priority: Optional[str] = Query(None, description="Filter by priority (chill, important, urgent)")
+):
+    """
+    Stream all matching reminders as newline-delimited JSON.
+
+    Unlike GET /api/reminders, nothing is buffered: rows are read from SQLite in
+    batches and each one is serialized and sent as soon as it is fetched, so
+    memory stays flat and the first reminder arrives without waiting for the rest.
+
+    Requires authentication via Bearer token.
+
+    Args:
+        status: Filter by status
+        category: Filter by category
+        priority: Filter by priority
+
+    Returns:
+        application/x-ndjson stream, one reminder object per line
+    """
+    def generate():
+        for reminder in db.iter_reminders(status=status, category=category, priority=priority):
+            reminder["time_required"] = bool(reminder["time_required"])
+            yield orjson.dumps(reminder, option=orjson.OPT_APPEND_NEWLINE)
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 # =============================================================================
 # Location Endpoints (Phase 6)
 # =============================================================================
@@ -388,50 +609,29 @@ async def get_reminders_near_location(
         List of reminders within radius, sorted by distance
     """
     try:
-        # Get all reminders with location data
-        all_reminders = db.get_all_reminders(limit=10000)
-
-        # Filter reminders with valid location coordinates
-        reminders_with_location = [
-            r for r in all_reminders
-            if r.get('location_lat') is not None and r.get('location_lng') is not None
-        ]
+        # Distances are computed on coordinates only (in SQLite when the geofence
+        # index is available), then full rows are loaded for the matches
+        matches = db.find_reminders_within(lat, lng, radius)
+        reminders_by_id = db.get_reminders_by_ids([reminder_id for reminder_id, _ in matches])
 
-        # Calculate distances and filter by radius
+        # Add distance metadata (matches are already sorted nearest first)
         nearby_reminders = []
-        for reminder in reminders_with_location:
-            distance = haversine_distance(
-                lat, lng,
-                reminder['location_lat'], reminder['location_lng']
-            )
-
-            # Check if within reminder's configured radius (or search radius, whichever is larger)
-            reminder_radius = reminder.get('location_radius', 100)
-            effective_radius = max(radius, reminder_radius)
-
-            if distance <= effective_radius:
-                # Add distance metadata for sorting
+        for reminder_id, distance in matches:
+            reminder = reminders_by_id.get(reminder_id)
+            if reminder is not None:
                 reminder['distance'] = round(distance, 2)
                 nearby_reminders.append(reminder)
 
-        # Sort by distance (nearest first)
-        nearby_reminders.sort(key=lambda r: r['distance'])
-
-        # Convert to response models
-        reminder_responses = [ReminderResponse(**r) for r in nearby_reminders]
-
-        # Build pagination metadata
-        pagination = PaginationMetadata(
-            total=len(reminder_responses),
-            limit=len(reminder_responses),
-            offset=0,
-            returned=len(reminder_responses)
-        )
-
-        return ReminderListResponse(
-            data=reminder_responses,
-            pagination=pagination
-        )
+        # Returned as plain rows; FastAPI validates against response_model once
+        return {
+            "data": nearby_reminders,
+            "pagination": {
+                "total": len(nearby_reminders),
+                "limit": len(nearby_reminders),
+                "offset": 0,
+                "returned": len(nearby_reminders)
+            }
+        }
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to find nearby reminders: {str(e)}")
@@ -596,7 +796,7 @@ async def parse_reminder(
                 # Check if parse was successful (confidence > 0.2)
                 if result.get("confidence", 0.0) > 0.2:
                     print(f"[Parse] Local parse successful (confidence: {result['confidence']})")
-                    return ReminderParseResponse(**result)
+                    return ReminderParseResponse.model_validate(result)
                 else:
                     parse_errors.append(f"Local parse returned low confidence: {result.get('confidence', 0.0)}")
 
@@ -612,7 +812,7 @@ async def parse_reminder(
                 await cloud_parser.close()
 
                 print(f"[Parse] Cloud parse successful (confidence: {result['confidence']})")
-                return ReminderParseResponse(**result)
+                return ReminderParseResponse.model_validate(result)
 
             except Exception as e:
                 parse_errors.append(f"Cloud parse failed: {str(e)}")
@@ -637,14 +837,14 @@ async def parse_reminder(
             local_parser = LocalLLMParser()
             result = await local_parser.parse_reminder_text(parse_request.text)
             await local_parser.close()
-            return ReminderParseResponse(**result)
+            return ReminderParseResponse.model_validate(result)
 
         # CLOUD MODE ONLY
         elif parse_request.mode == "cloud":
             cloud_parser = CloudflareAIParser()
             result = await cloud_parser.parse_reminder_text(parse_request.text)
             await cloud_parser.close()
-            return ReminderParseResponse(**result)
+            return ReminderParseResponse.model_validate(result)
 
     except HTTPException:
         # Re-raise HTTP exceptions
@@ -689,7 +889,7 @@ async def get_reminder(request: Request, reminder_id: str):
         if not reminder:
             raise HTTPException(status_code=404, detail="Reminder not found")
 
-        return ReminderResponse(**reminder)
+        return ReminderResponse.from_row(reminder)
 
     except HTTPException:
         raise
@@ -750,7 +950,7 @@ async def update_reminder(request: Request, reminder_id: str, update: ReminderUp
 
         # Fetch and return updated reminder
         updated_reminder = db.get_reminder_by_id(reminder_id)
-        return ReminderResponse(**updated_reminder)
+        return ReminderResponse.from_row(updated_reminder)
 
     except HTTPException:
         raise
@@ -834,69 +1034,39 @@ async def sync_reminders(request: Request, sync_request: SyncRequest):
     """
     try:
         current_time = get_current_timestamp()
-        conflicts: List[ConflictInfo] = []
+        conflicts: List[dict] = []
         applied_count = 0
 
         # Step 1: Apply client changes to server
         for change in sync_request.changes:
             try:
-                # Check if reminder exists on server
-                existing = db.get_reminder_by_id(change.id)
-
-                # Detect conflicts (both client and server modified same reminder)
-                if change.action == "update" and existing:
-                    client_updated_at = change.updated_at
-                    server_updated_at = existing.get("updated_at")
-
-                    # Conflict: both updated since last sync
-                    if server_updated_at and client_updated_at:
-                        # Last-write-wins: Compare timestamps
-                        if server_updated_at > client_updated_at:
-                            # Server wins - skip client change
-                            conflicts.append(ConflictInfo(
-                                id=change.id,
-                                client_updated_at=client_updated_at,
-                                server_updated_at=server_updated_at,
-                                resolution="server_wins"
-                            ))
-                            continue
-                        else:
-                            # Client wins - apply change and log conflict
-                            conflicts.append(ConflictInfo(
-                                id=change.id,
-                                client_updated_at=client_updated_at,
-                                server_updated_at=server_updated_at,
-                                resolution="client_wins"
-                            ))
-
-                # Apply the change
-                success = db.apply_sync_change(change.id, change.action, change.data)
-                if success:
-                    applied_count += 1
-
-                    # Update synced_at for this reminder
-                    if change.action != "delete":
-                        db.update_synced_at(change.id, current_time)
-
+                applied, conflict = apply_client_change(change, current_time)
             except Exception as e:
                 # Log error but continue processing other changes
                 print(f"ERROR: Failed to apply change {change.id}: {e}")
                 continue
 
+            if conflict:
+                conflicts.append(conflict)
+            if applied:
+                applied_count += 1
+
         # Step 2: Get server changes since client's last sync
         server_reminders = db.get_changes_since(sync_request.last_sync)
 
-        # Convert server reminders to SyncChange objects
+        # Convert server reminders to SyncChange objects. Rows come from our own
+        # database, so they are constructed without re-validation; only the
+        # inbound client changes (SyncRequest) are validated.
         server_changes: List[SyncChange] = []
         for reminder in server_reminders:
             # Skip reminders that were just updated by this sync request
             if any(c.id == reminder["id"] for c in sync_request.changes):
                 continue
 
-            server_changes.append(SyncChange(
+            server_changes.append(SyncChange.model_construct(
                 id=reminder["id"],
-                action="update",  # Existing reminders are always updates
-                data=reminder,
+                action=SyncAction.UPDATE,  # Existing reminders are always updates
+                data=ReminderPatch.from_row(reminder),
                 updated_at=reminder["updated_at"]
             ))
 
@@ -905,10 +1075,13 @@ async def sync_reminders(request: Request, sync_request: SyncRequest):
         if reminder_ids:
             db.batch_update_synced_at(reminder_ids, current_time)
 
-        # Step 4: Return sync response
-        return SyncResponse(
+        # Step 4: Return sync response. Both lists are already typed (the cached
+        # CONFLICTS_ADAPTER and model_construct above), and FastAPI serializes
+        # through the route's response_model adapter, so the envelope itself
+        # is not validated again.
+        return SyncResponse.model_construct(
             server_changes=server_changes,
-            conflicts=conflicts,
+            conflicts=CONFLICTS_ADAPTER.validate_python(conflicts),
             last_sync=current_time,
             applied_count=applied_count
         )
@@ -917,6 +1090,176 @@ async def sync_reminders(request: Request, sync_request: SyncRequest):
         raise HTTPException(status_code=500, detail=f"Sync failed: {str(e)}")
 
 
+@app.get(
+    "/api/sync/changes",
+    tags=["Sync"],
+    summary="Stream server changes as NDJSON",
+    response_class=StreamingResponse,
+    dependencies=[Depends(verify_token)]
+)
+@limiter.limit("20/minute")
+async def stream_sync_changes(
+    request: Request,
+    last_sync: Optional[str] = Query(None, description="ISO 8601 timestamp of last sync (omit for full sync)")
+):
+    """
+    Stream server changes since last_sync as newline-delimited JSON.
+
+    Download-only counterpart to POST /api/sync for clients catching up after
+    a long time offline: each line is a SyncChange object, read from SQLite in
+    batches and written as soon as it is encoded, so memory use does not grow
+    with the number of changes. Client changes should still be pushed through
+    POST /api/sync.
+
+    The new sync timestamp is returned in the X-Sync-Timestamp header. Once the
+    stream finishes, synced_at is set on every reminder that was sent.
+
+    Requires authentication via Bearer token.
+
+    Args:
+        last_sync: ISO 8601 timestamp of last sync
+
+    Returns:
+        application/x-ndjson stream, one SyncChange per line
+    """
+    current_time = get_current_timestamp()
+
+    def generate():
+        sent_ids = []
+        for reminder in db.iter_changes_since(last_sync):
+            sent_ids.append(reminder["id"])
+            reminder["time_required"] = bool(reminder["time_required"])
+            yield orjson.dumps({
+                "id": reminder["id"],
+                "action": "update",  # Existing reminders are always updates
+                "data": reminder,
+                "updated_at": reminder["updated_at"]
+            }, option=orjson.OPT_APPEND_NEWLINE)
+
+        # Written after the read cursor is closed so it does not contend for the lock
+        if sent_ids:
+            db.batch_update_synced_at(sent_ids, current_time)
+
+    return StreamingResponse(
+        generate(),
+        media_type="application/x-ndjson",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+            "X-Sync-Timestamp": current_time
+        }
+    )
+
+
+# Longest NDJSON line accepted by POST /api/sync/stream
+MAX_SYNC_LINE_BYTES = 1024 * 1024
+
+
+@app.post(
+    "/api/sync/stream",
+    tags=["Sync"],
+    summary="Upload client changes as NDJSON",
+    response_class=Response,
+    dependencies=[Depends(verify_token)]
+)
+@limiter.limit("20/minute")
+async def stream_sync_upload(request: Request):
+    """
+    Apply client changes uploaded as newline-delimited JSON.
+
+    Upload-only counterpart to POST /api/sync for large offline queues: the
+    body (Content-Type: application/x-ndjson) holds one SyncChange per line.
+    Lines are validated and applied as they arrive, so processing starts
+    before the upload finishes and the full queue is never buffered. Changes
+    are applied in order with the same last-write-wins rules as POST
+    /api/sync, and a bad line does not stop the rest of the upload.
+
+    Server changes are not returned; fetch them from GET /api/sync/changes.
+
+    Requires authentication via Bearer token.
+
+    Returns:
+        application/x-ndjson body with one status object per input line:
+        {"id", "status": "applied" | "skipped" | "failed", "conflict"} or
+        {"line", "status": "invalid", "error"} for lines that fail validation
+        or are longer than MAX_SYNC_LINE_BYTES
+    """
+    current_time = get_current_timestamp()
+    results = []
+    line_number = 0
+
+    def report_invalid(error: str):
+        results.append(orjson.dumps({
+            "line": line_number,
+            "status": "invalid",
+            "error": error
+        }, option=orjson.OPT_APPEND_NEWLINE))
+
+    def process(line: bytes):
+        nonlocal line_number
+        line_number += 1
+        if not line.strip():
+            return
+
+        try:
+            change = SyncChange.model_validate_json(line)
+        except ValueError as e:
+            report_invalid(str(e))
+            return
+
+        try:
+            applied, conflict = apply_client_change(change, current_time)
+            status = "applied" if applied else "skipped"
+        except Exception as e:
+            # Log error but continue processing other changes
+            print(f"ERROR: Failed to apply change {change.id}: {e}")
+            status, conflict = "failed", None
+
+        results.append(orjson.dumps({
+            "id": change.id,
+            "status": status,
+            "conflict": conflict
+        }, option=orjson.OPT_APPEND_NEWLINE))
+
+    # Pieces of the current line seen so far; only each new chunk is scanned
+    # for newlines, and a line over the cap is dropped up to its newline
+    pending = []
+    pending_size = 0
+    oversized = False
+
+    def end_line(piece: bytes):
+        nonlocal line_number, pending_size, oversized
+        if oversized or pending_size + len(piece) > MAX_SYNC_LINE_BYTES:
+            line_number += 1
+            report_invalid(f"Line exceeds {MAX_SYNC_LINE_BYTES} bytes")
+        else:
+            process(b"".join(pending) + piece if pending else piece)
+        pending.clear()
+        pending_size = 0
+        oversized = False
+
+    async for chunk in request.stream():
+        start = 0
+        while (end := chunk.find(b"\n", start)) != -1:
+            end_line(chunk[start:end])
+            start = end + 1
+
+        if start < len(chunk) and not oversized:
+            pending_size += len(chunk) - start
+            if pending_size > MAX_SYNC_LINE_BYTES:
+                oversized = True
+                pending.clear()
+            else:
+                pending.append(chunk[start:])
+    end_line(b"")
+
+    return Response(
+        content=b"".join(results),
+        media_type="application/x-ndjson",
+        headers={"X-Sync-Timestamp": current_time}
+    )
+
+
 # =============================================================================
 # Config Endpoint (Phase 6)
 # =============================================================================
@@ -2,10 +2,113 @@
 models.py - Pydantic models for request/response validation
 """
 
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List, Literal
-from datetime import datetime
+from pydantic import AfterValidator, BaseModel, Field, TypeAdapter
+from typing import Annotated, Optional, List, Literal, get_args
+from datetime import date, datetime, time
 from pydantic import ConfigDict
+from enum import Enum
+
+
+# =============================================================================
+# Shared Field Types
+# =============================================================================
+
+# Shared Literal types so every model (and the voice parsers) validate against
+# one definition; PRIORITIES is for plain membership checks outside Pydantic
+Priority = Literal["someday", "chill", "important", "urgent", "waiting"]
+Status = Literal["pending", "completed", "snoozed"]
+Source = Literal["manual", "voice", "api"]
+Frequency = Literal["daily", "weekly", "monthly", "yearly"]
+
+# Score in [0.0, 1.0]; shared so every confidence field uses one constraint definition
+Confidence = Annotated[float, Field(ge=0.0, le=1.0)]
+
+PRIORITIES = frozenset(get_args(Priority))
+
+
+# str-valued enums for sets referenced from several models/endpoints; members
+# compare equal to their plain string values, so callers can keep using strings
+class SyncAction(str, Enum):
+    """Type of change carried by a sync record."""
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+
+
+class ConflictResolution(str, Enum):
+    """How a sync conflict was resolved."""
+    SERVER_WINS = "server_wins"
+    CLIENT_WINS = "client_wins"
+
+
+class ParseMode(str, Enum):
+    """Parsing mode for reminder text."""
+    LOCAL = "local"
+    CLOUD = "cloud"
+    AUTO = "auto"
+
+
+# =============================================================================
+# Base Model
+# =============================================================================
+
+class _Base(BaseModel):
+    """
+    Common base for all API models.
+
+    defer_build postpones building each model's validator/serializer until it
+    is first used, so importing this module (e.g. from the voice parsers for
+    the value sets above) does not pay for schemas it never touches.
+    """
+    model_config = ConfigDict(defer_build=True)
+
+
+# =============================================================================
+# Date/Time String Types
+# =============================================================================
+
+def _validate_iso_date(v: str) -> str:
+    """Validate v is an ISO 8601 date (YYYY-MM-DD) that represents a real date."""
+    # Fast path: canonical YYYY-MM-DD only needs a range check, not strptime
+    if len(v) == 10 and v[4] == "-" and v[7] == "-" and v[:4].isdigit() and v[5:7].isdigit() and v[8:].isdigit():
+        try:
+            date(int(v[:4]), int(v[5:7]), int(v[8:]))
+            return v
+        except ValueError:
+            pass
+
+    # Anything else goes through strptime, which decides acceptance as before
+    try:
+        datetime.strptime(v, "%Y-%m-%d")
+        return v
+    except ValueError as e:
+        raise ValueError(
+            f"due_date must be in ISO 8601 format (YYYY-MM-DD) and represent a valid date. "
+            f"Got: '{v}'"
+        ) from e
+
+
+def _validate_iso_time(v: str) -> str:
+    """Validate v is an ISO 8601 time (HH:MM:SS)."""
+    # Fast path: canonical HH:MM:SS only needs a range check, not strptime
+    if len(v) == 8 and v[2] == ":" and v[5] == ":" and v[:2].isdigit() and v[3:5].isdigit() and v[6:].isdigit():
+        try:
+            time(int(v[:2]), int(v[3:5]), int(v[6:]))
+            return v
+        except ValueError:
+            pass
+
+    try:
+        datetime.strptime(v, "%H:%M:%S")
+        return v
+    except ValueError as e:
+        raise ValueError(
+            f"due_time must be in ISO 8601 format (HH:MM:SS). Got: '{v}'"
+        ) from e
+
+
+ISODate = Annotated[str, AfterValidator(_validate_iso_date)]
+ISOTime = Annotated[str, AfterValidator(_validate_iso_time)]
 
 
 # =============================================================================
@@ -16,9 +119,9 @@ from pydantic import ConfigDict
 # Recurrence Pattern Models (Phase 7)
 # =============================================================================
 
-class RecurrencePatternCreate(BaseModel):
+class RecurrencePatternCreate(_Base):
     """Model for creating a recurrence pattern"""
-    frequency: Literal["daily", "weekly", "monthly", "yearly"] = Field(..., description="Recurrence frequency")
+    frequency: Frequency = Field(..., description="Recurrence frequency")
     interval: int = Field(1, ge=1, le=365, description="Repeat every N days/weeks/months/years")
 
     # Weekly constraints
@@ -34,8 +137,8 @@ class RecurrencePatternCreate(BaseModel):
     end_date: Optional[str] = Field(None, description="End date in ISO 8601 format (YYYY-MM-DD)")
     end_count: Optional[int] = Field(None, ge=1, description="Number of occurrences before stopping")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "frequency": "weekly",
                 "interval": 1,
@@ -43,33 +146,10 @@ class RecurrencePatternCreate(BaseModel):
                 "end_count": 10
             }
         }
-
-
-# =============================================================================
-# Voice Models (Phase 8)
-# =============================================================================
-
-
-class VoiceTranscriptionResponse(BaseModel):
-    """Response from voice transcription endpoint."""
-    text: str = Field(..., description="Transcribed text from audio")
-    model: str = Field(default="base.en", description="Whisper model used")
-    language: str = Field(default="en", description="Language detected/used")
-    file_size_bytes: int = Field(..., description="Size of uploaded audio file")
-
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "text": "Call mom about Thanksgiving",
-                "model": "base.en",
-                "language": "en",
-                "file_size_bytes": 87432
-            }
-        }
     )
 
 
-class RecurrencePatternResponse(BaseModel):
+class RecurrencePatternResponse(_Base):
     """Model for recurrence pattern response"""
     id: str
     frequency: str
@@ -81,9 +161,9 @@ class RecurrencePatternResponse(BaseModel):
     end_count: Optional[int] = None
     created_at: str
 
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "id": "550e8400-e29b-41d4-a716-446655440000",
                 "frequency": "weekly",
@@ -93,39 +173,16 @@ class RecurrencePatternResponse(BaseModel):
                 "created_at": "2025-11-03T10:00:00Z"
             }
         }
-
-
-# =============================================================================
-# Voice Models (Phase 8)
-# =============================================================================
-
-
-class VoiceTranscriptionResponse(BaseModel):
-    """Response from voice transcription endpoint."""
-    text: str = Field(..., description="Transcribed text from audio")
-    model: str = Field(default="base.en", description="Whisper model used")
-    language: str = Field(default="en", description="Language detected/used")
-    file_size_bytes: int = Field(..., description="Size of uploaded audio file")
-
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "text": "Call mom about Thanksgiving",
-                "model": "base.en",
-                "language": "en",
-                "file_size_bytes": 87432
-            }
-        }
     )
 
 
-class ReminderCreate(BaseModel):
+class ReminderCreate(_Base):
     """Model for creating a new reminder"""
     text: str = Field(..., min_length=1, max_length=1000, description="Reminder text")
 
     # Timing
-    due_date: Optional[str] = Field(None, description="Due date in ISO 8601 format (YYYY-MM-DD)")
-    due_time: Optional[str] = Field(None, description="Due time in ISO 8601 format (HH:MM:SS)")
+    due_date: Optional[ISODate] = Field(None, description="Due date in ISO 8601 format (YYYY-MM-DD)")
+    due_time: Optional[ISOTime] = Field(None, description="Due time in ISO 8601 format (HH:MM:SS)")
     time_required: Optional[bool] = Field(False, description="Must be done at specific time")
 
     # Location
@@ -136,11 +193,11 @@ class ReminderCreate(BaseModel):
     location_radius: Optional[int] = Field(100, ge=10, le=10000, description="Trigger radius in meters")
 
     # Organization
-    priority: Literal["someday", "chill", "important", "urgent", "waiting"] = Field("chill", description="Priority level")
+    priority: Priority = Field("chill", description="Priority level")
     category: Optional[str] = Field(None, max_length=100, description="Category tag")
 
     # Status
-    status: Literal["pending", "completed", "snoozed"] = Field("pending", description="Reminder status")
+    status: Status = Field("pending", description="Reminder status")
     snoozed_until: Optional[str] = Field(None, description="Snoozed until ISO 8601 timestamp")
 
     # Recurrence
@@ -148,42 +205,10 @@ class ReminderCreate(BaseModel):
     recurrence_pattern: Optional[RecurrencePatternCreate] = Field(None, description="Embedded recurrence pattern (creates pattern + instances)")
 
     # Metadata
-    source: Literal["manual", "voice", "api"] = Field("manual", description="Creation source")
-
-    @field_validator('due_date')
-    @classmethod
-    def validate_due_date(cls, v):
-        """Validate due_date is valid ISO 8601 format and represents a real date."""
-        if v is None:
-            return v
-
-        # Check format and parse to verify it's a real date
-        try:
-            datetime.strptime(v, "%Y-%m-%d")
-            return v
-        except ValueError as e:
-            raise ValueError(
-                f"due_date must be in ISO 8601 format (YYYY-MM-DD) and represent a valid date. "
-                f"Got: '{v}'"
-            ) from e
-
-    @field_validator('due_time')
-    @classmethod
-    def validate_due_time(cls, v):
-        """Validate due_time is valid ISO 8601 time format (HH:MM:SS)."""
-        if v is None:
-            return v
-
-        try:
-            datetime.strptime(v, "%H:%M:%S")
-            return v
-        except ValueError as e:
-            raise ValueError(
-                f"due_time must be in ISO 8601 format (HH:MM:SS). Got: '{v}'"
-            ) from e
+    source: Source = Field("manual", description="Creation source")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "text": "Call mom about Thanksgiving",
                 "due_date": "2025-11-03",
@@ -191,39 +216,16 @@ class ReminderCreate(BaseModel):
                 "category": "Calls"
             }
         }
-
-
-# =============================================================================
-# Voice Models (Phase 8)
-# =============================================================================
-
-
-class VoiceTranscriptionResponse(BaseModel):
-    """Response from voice transcription endpoint."""
-    text: str = Field(..., description="Transcribed text from audio")
-    model: str = Field(default="base.en", description="Whisper model used")
-    language: str = Field(default="en", description="Language detected/used")
-    file_size_bytes: int = Field(..., description="Size of uploaded audio file")
-
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "text": "Call mom about Thanksgiving",
-                "model": "base.en",
-                "language": "en",
-                "file_size_bytes": 87432
-            }
-        }
     )
 
 
-class ReminderUpdate(BaseModel):
+class ReminderUpdate(_Base):
     """Model for updating an existing reminder"""
     text: Optional[str] = Field(None, min_length=1, max_length=1000)
 
     # Timing
-    due_date: Optional[str] = None
-    due_time: Optional[str] = None
+    due_date: Optional[ISODate] = None
+    due_time: Optional[ISOTime] = None
     time_required: Optional[bool] = None
 
     # Location
@@ -234,77 +236,22 @@ class ReminderUpdate(BaseModel):
     location_radius: Optional[int] = Field(None, ge=10, le=10000)
 
     # Organization
-    priority: Optional[Literal["someday", "chill", "important", "urgent", "waiting"]] = None
+    priority: Optional[Priority] = None
     category: Optional[str] = Field(None, max_length=100)
 
     # Status
-    status: Optional[Literal["pending", "completed", "snoozed"]] = None
+    status: Optional[Status] = None
     completed_at: Optional[str] = None
     snoozed_until: Optional[str] = None
 
     # Recurrence
     recurrence_id: Optional[str] = None
 
-    @field_validator('due_date')
-    @classmethod
-    def validate_due_date(cls, v):
-        """Validate due_date is valid ISO 8601 format and represents a real date."""
-        if v is None:
-            return v
-
-        # Check format and parse to verify it's a real date
-        try:
-            datetime.strptime(v, "%Y-%m-%d")
-            return v
-        except ValueError as e:
-            raise ValueError(
-                f"due_date must be in ISO 8601 format (YYYY-MM-DD) and represent a valid date. "
-                f"Got: '{v}'"
-            ) from e
-
-    @field_validator('due_time')
-    @classmethod
-    def validate_due_time(cls, v):
-        """Validate due_time is valid ISO 8601 time format (HH:MM:SS)."""
-        if v is None:
-            return v
-
-        try:
-            datetime.strptime(v, "%H:%M:%S")
-            return v
-        except ValueError as e:
-            raise ValueError(
-                f"due_time must be in ISO 8601 format (HH:MM:SS). Got: '{v}'"
-            ) from e
-
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "status": "completed",
-                "completed_at": "2025-11-02T15:30:00Z"
-            }
-        }
-
-
-# =============================================================================
-# Voice Models (Phase 8)
-# =============================================================================
-
-
-class VoiceTranscriptionResponse(BaseModel):
-    """Response from voice transcription endpoint."""
-    text: str = Field(..., description="Transcribed text from audio")
-    model: str = Field(default="base.en", description="Whisper model used")
-    language: str = Field(default="en", description="Language detected/used")
-    file_size_bytes: int = Field(..., description="Size of uploaded audio file")
-
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
-                "text": "Call mom about Thanksgiving",
-                "model": "base.en",
-                "language": "en",
-                "file_size_bytes": 87432
+                "status": "completed",
+                "completed_at": "2025-11-02T15:30:00Z"
             }
         }
     )
@@ -314,7 +261,7 @@ class VoiceTranscriptionResponse(BaseModel):
 # Response Models
 # =============================================================================
 
-class ReminderResponse(BaseModel):
+class ReminderResponse(_Base):
     """Model for reminder response"""
     id: str
     text: str
@@ -350,9 +297,22 @@ class ReminderResponse(BaseModel):
     updated_at: str
     synced_at: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    @classmethod
+    def from_row(cls, row: dict) -> "ReminderResponse":
+        """
+        Build a response from a trusted reminders-table row without re-validating.
+
+        Rows come from our own schema (CHECK constraints, validated on write), so
+        field validation is skipped; only SQLite's 0/1 time_required is coerced.
+        Use the regular constructor for anything that did not come from the DB.
+        """
+        values = dict(row)
+        values["time_required"] = bool(values.get("time_required"))
+        return cls.model_construct(**values)
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "id": "550e8400-e29b-41d4-a716-446655440000",
                 "text": "Call mom about Thanksgiving",
@@ -365,33 +325,10 @@ class ReminderResponse(BaseModel):
                 "updated_at": "2025-11-02T10:00:00Z"
             }
         }
-
-
-# =============================================================================
-# Voice Models (Phase 8)
-# =============================================================================
-
-
-class VoiceTranscriptionResponse(BaseModel):
-    """Response from voice transcription endpoint."""
-    text: str = Field(..., description="Transcribed text from audio")
-    model: str = Field(default="base.en", description="Whisper model used")
-    language: str = Field(default="en", description="Language detected/used")
-    file_size_bytes: int = Field(..., description="Size of uploaded audio file")
-
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "text": "Call mom about Thanksgiving",
-                "model": "base.en",
-                "language": "en",
-                "file_size_bytes": 87432
-            }
-        }
     )
 
 
-class PaginationMetadata(BaseModel):
+class PaginationMetadata(_Base):
     """Pagination metadata"""
     total: int = Field(..., description="Total number of items")
     limit: int = Field(..., description="Items per page")
@@ -399,13 +336,13 @@ class PaginationMetadata(BaseModel):
     returned: int = Field(..., description="Number of items in current page")
 
 
-class ReminderListResponse(BaseModel):
+class ReminderListResponse(_Base):
     """Model for list of reminders with pagination"""
     data: List[ReminderResponse]
     pagination: PaginationMetadata
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "data": [
                     {
@@ -426,41 +363,18 @@ class ReminderListResponse(BaseModel):
                 }
             }
         }
-
-
-# =============================================================================
-# Voice Models (Phase 8)
-# =============================================================================
-
-
-class VoiceTranscriptionResponse(BaseModel):
-    """Response from voice transcription endpoint."""
-    text: str = Field(..., description="Transcribed text from audio")
-    model: str = Field(default="base.en", description="Whisper model used")
-    language: str = Field(default="en", description="Language detected/used")
-    file_size_bytes: int = Field(..., description="Size of uploaded audio file")
-
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "text": "Call mom about Thanksgiving",
-                "model": "base.en",
-                "language": "en",
-                "file_size_bytes": 87432
-            }
-        }
     )
 
 
-class HealthResponse(BaseModel):
+class HealthResponse(_Base):
     """Model for health check response"""
     status: Literal["ok", "error"] = "ok"
     version: str = "1.0.0"
     database: Literal["connected", "disconnected"] = "connected"
     timestamp: str
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "ok",
                 "version": "1.0.0",
@@ -468,85 +382,90 @@ class HealthResponse(BaseModel):
                 "timestamp": "2025-11-02T10:00:00Z"
             }
         }
+    )
 
 
 # =============================================================================
-# Voice Models (Phase 8)
+# Error Models
 # =============================================================================
 
-
-class VoiceTranscriptionResponse(BaseModel):
-    """Response from voice transcription endpoint."""
-    text: str = Field(..., description="Transcribed text from audio")
-    model: str = Field(default="base.en", description="Whisper model used")
-    language: str = Field(default="en", description="Language detected/used")
-    file_size_bytes: int = Field(..., description="Size of uploaded audio file")
+class ErrorResponse(_Base):
+    """Model for error responses"""
+    detail: str = Field(..., description="Error message")
 
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
-                "text": "Call mom about Thanksgiving",
-                "model": "base.en",
-                "language": "en",
-                "file_size_bytes": 87432
+                "detail": "Reminder not found"
             }
         }
     )
 
 
 # =============================================================================
-# Error Models
+# Sync Models (Phase 5)
 # =============================================================================
 
-class ErrorResponse(BaseModel):
-    """Model for error responses"""
-    detail: str = Field(..., description="Error message")
+class ReminderPatch(_Base):
+    """
+    Reminder fields carried by a sync change.
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "detail": "Reminder not found"
-            }
-        }
+    Every column is optional: updates send only the fields that changed,
+    creates and server changes send the full row. Unknown keys (e.g. UI-only
+    metadata such as 'distance') are dropped rather than rejected.
+    """
+    id: Optional[str] = None
+    text: Optional[str] = None
 
+    # Timing
+    due_date: Optional[str] = None
+    due_time: Optional[str] = None
+    time_required: Optional[bool] = None
 
-# =============================================================================
-# Voice Models (Phase 8)
-# =============================================================================
+    # Location
+    location_name: Optional[str] = None
+    location_address: Optional[str] = None
+    location_lat: Optional[float] = None
+    location_lng: Optional[float] = None
+    location_radius: Optional[int] = None
 
+    # Organization
+    priority: Optional[str] = None
+    category: Optional[str] = None
 
-class VoiceTranscriptionResponse(BaseModel):
-    """Response from voice transcription endpoint."""
-    text: str = Field(..., description="Transcribed text from audio")
-    model: str = Field(default="base.en", description="Whisper model used")
-    language: str = Field(default="en", description="Language detected/used")
-    file_size_bytes: int = Field(..., description="Size of uploaded audio file")
+    # Status
+    status: Optional[str] = None
+    completed_at: Optional[str] = None
+    snoozed_until: Optional[str] = None
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "text": "Call mom about Thanksgiving",
-                "model": "base.en",
-                "language": "en",
-                "file_size_bytes": 87432
-            }
-        }
-    )
+    # Recurrence
+    recurrence_id: Optional[str] = None
 
+    # Metadata
+    source: Optional[str] = None
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    synced_at: Optional[str] = None
 
-# =============================================================================
-# Sync Models (Phase 5)
-# =============================================================================
+    model_config = ConfigDict(extra="ignore")
+
+    @classmethod
+    def from_row(cls, row: dict) -> "ReminderPatch":
+        """Build a patch holding a full reminders-table row without re-validating."""
+        values = dict(row)
+        values["time_required"] = bool(values.get("time_required"))
+        return cls.model_construct(**values)
 
-class SyncChange(BaseModel):
+
+class SyncChange(_Base):
     """Model for a single sync change"""
     id: str = Field(..., description="Reminder UUID")
-    action: Literal["create", "update", "delete"] = Field(..., description="Type of change")
-    data: Optional[dict] = Field(None, description="Reminder data (null for delete)")
+    action: SyncAction = Field(..., description="Type of change")
+    data: Optional[ReminderPatch] = Field(None, description="Reminder data (null for delete)")
     updated_at: str = Field(..., description="ISO 8601 timestamp of change")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "550e8400-e29b-41d4-a716-446655440000",
                 "action": "update",
@@ -557,40 +476,17 @@ class SyncChange(BaseModel):
                 "updated_at": "2025-11-03T10:30:00Z"
             }
         }
-
-
-# =============================================================================
-# Voice Models (Phase 8)
-# =============================================================================
-
-
-class VoiceTranscriptionResponse(BaseModel):
-    """Response from voice transcription endpoint."""
-    text: str = Field(..., description="Transcribed text from audio")
-    model: str = Field(default="base.en", description="Whisper model used")
-    language: str = Field(default="en", description="Language detected/used")
-    file_size_bytes: int = Field(..., description="Size of uploaded audio file")
-
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "text": "Call mom about Thanksgiving",
-                "model": "base.en",
-                "language": "en",
-                "file_size_bytes": 87432
-            }
-        }
     )
 
 
-class SyncRequest(BaseModel):
+class SyncRequest(_Base):
     """Model for sync request from client"""
     client_id: str = Field(..., description="Unique device identifier (UUID)")
     last_sync: Optional[str] = Field(None, description="ISO 8601 timestamp of last successful sync")
     changes: List[SyncChange] = Field(default_factory=list, description="Local changes to push to server")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "client_id": "a1b2c3d4-e5f6-4789-a012-3456789abcde",
                 "last_sync": "2025-11-03T10:00:00Z",
@@ -607,41 +503,18 @@ class SyncRequest(BaseModel):
                 ]
             }
         }
-
-
-# =============================================================================
-# Voice Models (Phase 8)
-# =============================================================================
-
-
-class VoiceTranscriptionResponse(BaseModel):
-    """Response from voice transcription endpoint."""
-    text: str = Field(..., description="Transcribed text from audio")
-    model: str = Field(default="base.en", description="Whisper model used")
-    language: str = Field(default="en", description="Language detected/used")
-    file_size_bytes: int = Field(..., description="Size of uploaded audio file")
-
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "text": "Call mom about Thanksgiving",
-                "model": "base.en",
-                "language": "en",
-                "file_size_bytes": 87432
-            }
-        }
     )
 
 
-class ConflictInfo(BaseModel):
+class ConflictInfo(_Base):
     """Model for sync conflict information"""
     id: str = Field(..., description="Reminder UUID with conflict")
     client_updated_at: str = Field(..., description="Client's update timestamp")
     server_updated_at: str = Field(..., description="Server's update timestamp")
-    resolution: Literal["server_wins", "client_wins"] = Field(..., description="How conflict was resolved")
+    resolution: ConflictResolution = Field(..., description="How conflict was resolved")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "550e8400-e29b-41d4-a716-446655440000",
                 "client_updated_at": "2025-11-03T10:15:00Z",
@@ -649,41 +522,21 @@ class ConflictInfo(BaseModel):
                 "resolution": "server_wins"
             }
         }
-
-
-# =============================================================================
-# Voice Models (Phase 8)
-# =============================================================================
-
-
-class VoiceTranscriptionResponse(BaseModel):
-    """Response from voice transcription endpoint."""
-    text: str = Field(..., description="Transcribed text from audio")
-    model: str = Field(default="base.en", description="Whisper model used")
-    language: str = Field(default="en", description="Language detected/used")
-    file_size_bytes: int = Field(..., description="Size of uploaded audio file")
-
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "text": "Call mom about Thanksgiving",
-                "model": "base.en",
-                "language": "en",
-                "file_size_bytes": 87432
-            }
-        }
     )
 
+# Cached validator for lists of conflicts (built once at import, reused per request)
+CONFLICTS_ADAPTER = TypeAdapter(List[ConflictInfo])
+
 
-class SyncResponse(BaseModel):
+class SyncResponse(_Base):
     """Model for sync response from server"""
     server_changes: List[SyncChange] = Field(default_factory=list, description="Changes from server since last sync")
     conflicts: List[ConflictInfo] = Field(default_factory=list, description="Conflicts detected and resolved")
     last_sync: str = Field(..., description="ISO 8601 timestamp to use for next sync request")
     applied_count: int = Field(..., description="Number of client changes successfully applied")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "server_changes": [
                     {
@@ -704,6 +557,7 @@ class SyncResponse(BaseModel):
                 "applied_count": 1
             }
         }
+    )
 
 
 # =============================================================================
@@ -711,7 +565,7 @@ class SyncResponse(BaseModel):
 # =============================================================================
 
 
-class VoiceTranscriptionResponse(BaseModel):
+class VoiceTranscriptionResponse(_Base):
     """Response from voice transcription endpoint."""
     text: str = Field(..., description="Transcribed text from audio")
     model: str = Field(default="base.en", description="Whisper model used")
@@ -735,10 +589,10 @@ class VoiceTranscriptionResponse(BaseModel):
 # =============================================================================
 
 
-class ReminderParseRequest(BaseModel):
+class ReminderParseRequest(_Base):
     """Request for parsing natural language reminder text."""
     text: str = Field(..., min_length=1, max_length=1000, description="Reminder text to parse")
-    mode: Literal["auto", "local", "cloud"] = Field("auto", description="Parsing mode selection")
+    mode: ParseMode = Field(ParseMode.AUTO, description="Parsing mode selection")
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -750,7 +604,7 @@ class ReminderParseRequest(BaseModel):
     )
 
 
-class ReminderParseResponse(BaseModel):
+class ReminderParseResponse(_Base):
     """Response from reminder text parsing endpoint."""
     text: str = Field(..., description="Cleaned reminder text")
     due_date: Optional[str] = Field(None, description="Extracted due date (YYYY-MM-DD)")
@@ -759,7 +613,7 @@ class ReminderParseResponse(BaseModel):
     priority: Optional[str] = Field(None, description="Extracted priority level")
     category: Optional[str] = Field(None, description="Inferred category")
     location: Optional[str] = Field(None, description="Extracted location")
-    confidence: float = Field(..., ge=0.0, le=1.0, description="Overall confidence score (0.0-1.0)")
+    confidence: Confidence = Field(..., description="Overall confidence score (0.0-1.0)")
     parse_mode: Literal["local", "cloud"] = Field(..., description="Mode used for parsing")
 
     model_config = ConfigDict(
@@ -2,51 +2,224 @@
 Pytest configuration and fixtures for testing
 """
 
-import pytest
-import tempfile
+import asyncio
+import itertools
 import os
-from pathlib import Path
+import sys
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+import pytest_asyncio
+import uuid
 from fastapi.testclient import TestClient
 
+try:
+    import uvloop
+except ImportError:  # Optional: not available on Windows
+    uvloop = None
+
 # Import application modules
 from server import database as db
-from server.main import app
+from server import main
+from server.main import app, build_reminder_record
+from server.models import ReminderCreate
 from server import config
 
+# Built once at import; fixtures hand out the same dicts, so treat them as read-only
+_AUTH_HEADERS = {
+    "Authorization": f"Bearer {config.API_TOKEN}",
+    "Content-Type": "application/json"
+}
+_INVALID_AUTH_HEADERS = {
+    "Authorization": "Bearer invalid_token_12345",
+    "Content-Type": "application/json"
+}
 
-@pytest.fixture(scope="function")
-def test_db():
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """
+    Event loop policy for pytest-asyncio: uvloop when installed, like uvicorn.
+    """
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest.fixture(autouse=True)
+def clear_parse_cache():
+    """
+    Empty the process-wide LLM parse cache after each test.
+
+    Tests reuse the same reminder texts with different mocked LLM replies.
     """
-    Create a temporary test database for each test.
-    Automatically cleaned up after test completes.
+    yield
+    voice_parser = sys.modules.get("server.voice.parser")
+    if voice_parser is not None:
+        voice_parser.clear_parse_cache()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def worker_db(tmp_path_factory):
     """
-    # Create temporary database file
-    temp_db = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.db')
-    temp_db_path = temp_db.name
-    temp_db.close()
+    Point the API at a database file owned by this test process.
+
+    Under pytest-xdist (`pytest -n auto --dist=loadscope`) every worker gets
+    its own file, so parallel workers never contend for SQLite's write lock
+    and the repo's reminders.db is left untouched by test runs.
+
+    The file is throwaway, so it runs in WAL mode with synchronous=NORMAL:
+    commits append to the WAL instead of fsyncing the database on every
+    create/update/delete. A 20 MB page cache keeps bulk recurrence inserts
+    from spilling to disk mid-transaction.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    db_path = tmp_path_factory.mktemp("db") / f"test_{worker}.db"
+
+    original_db_path = db.DB_PATH
+    original_pragmas = db.CONNECTION_PRAGMAS
+    db.DB_PATH = db_path
+    db.CONNECTION_PRAGMAS = ("synchronous=NORMAL", "temp_store=MEMORY", "cache_size=-20000")
 
-    # Initialize test database
-    db.init_db(db_path=temp_db_path, force=True)
+    # journal_mode is persistent, so it only needs setting once per file
+    conn = db.get_connection()
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.close()
+    db.init_db()
 
-    yield temp_db_path
+    yield db_path
 
-    # Cleanup: Remove temporary database
+    db.DB_PATH = original_db_path
+    db.CONNECTION_PRAGMAS = original_pragmas
+
+
+@pytest.fixture(autouse=True)
+def clean_worker_db(worker_db):
+    """
+    Empty the worker database after each test.
+
+    The schema is created once per session by worker_db; deleting the rows is
+    far cheaper than dropping and recreating the tables, and keeps tests from
+    seeing each other's reminders.
+    """
+    yield
+
+    conn = db.get_connection(str(worker_db))
     try:
-        os.unlink(temp_db_path)
-    except OSError:
-        pass
+        conn.execute("DELETE FROM reminders")
+        conn.execute("DELETE FROM recurrence_patterns")
+        conn.commit()
+        db.clear_recurrence_pattern_cache()
+    finally:
+        conn.close()
+
+
+@pytest.fixture(scope="session")
+def schema_template_db():
+    """
+    In-memory database with the full schema, built once per session.
+
+    test_db clones it with the SQLite backup API, a page copy that is far
+    cheaper than running init_db's DDL (and R*Tree setup) for every test.
+    """
+    template_uri = f"file:template_{uuid.uuid4().hex}?mode=memory&cache=shared"
+    keeper = db.get_connection(template_uri)
+    db.init_db(db_path=template_uri, force=True)
+
+    yield keeper
+
+    keeper.close()
 
 
 @pytest.fixture(scope="function")
+def test_db(schema_template_db):
+    """
+    Create a fresh in-memory test database for each test.
+
+    Uses a uniquely named shared-cache memory URI so every connection the
+    database helpers open sees the same data. The database lives as long as
+    at least one connection is open, so a keeper connection is held for the
+    duration of the test and closing it discards the database. The schema is
+    copied from schema_template_db rather than created from scratch.
+    """
+    test_db_uri = f"file:test_{uuid.uuid4().hex}?mode=memory&cache=shared"
+    keeper = db.get_connection(test_db_uri)
+    schema_template_db.backup(keeper)
+
+    yield test_db_uri
+
+    keeper.close()
+
+
+@pytest.fixture(scope="session")
 def client():
     """
     FastAPI test client with authentication.
+
+    Session-scoped: app startup runs once for the whole suite. The client holds
+    no per-test state (the API reads the database path at request time).
     """
     with TestClient(app) as test_client:
         yield test_client
 
 
-@pytest.fixture(scope="function")
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_client():
+    """
+    Async HTTP client bound directly to the ASGI app.
+
+    Requests are awaited on the session event loop instead of being handed to
+    TestClient's background portal thread, which makes it the cheaper choice
+    for fixtures that only need to seed data.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """
+    Deterministic, strictly increasing server clock.
+
+    Replaces main.get_current_timestamp so each call returns a timestamp one
+    millisecond after the previous one, starting from the real time when the
+    test begins. Tests that need a later updated_at get it from the next call
+    instead of sleeping.
+    """
+    start = datetime.now(timezone.utc)
+    ticks = itertools.count(1)
+
+    def next_timestamp() -> str:
+        return (start + timedelta(milliseconds=next(ticks))).isoformat()
+
+    monkeypatch.setattr(main, "get_current_timestamp", next_timestamp)
+
+
+@pytest.fixture
+def seeded_reminders():
+    """
+    Factory that inserts reminders straight into the database.
+
+    Call it with a list of ReminderCreate-style dicts; rows are built exactly
+    as the create endpoint builds them and written with one executemany
+    (db.bulk_create_reminders). For tests that only need reminders to exist,
+    this skips the HTTP/ASGI round trip per row. Returns the inserted rows.
+    """
+    def _seed(specs):
+        now = main.get_current_timestamp()
+        records = [
+            build_reminder_record(ReminderCreate(**spec), str(uuid.uuid4()), None, now)
+            for spec in specs
+        ]
+        db.bulk_create_reminders(records)
+        return records
+
+    return _seed
+
+
+@pytest.fixture(scope="session")
 def test_token():
     """
     Valid API token for authentication.
@@ -54,26 +227,20 @@ def test_token():
     return config.API_TOKEN
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def auth_headers():
     """
     Valid authentication headers for API requests.
     """
-    return {
-        "Authorization": f"Bearer {config.API_TOKEN}",
-        "Content-Type": "application/json"
-    }
+    return _AUTH_HEADERS
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def invalid_auth_headers():
     """
     Invalid authentication headers for testing auth failures.
     """
-    return {
-        "Authorization": "Bearer invalid_token_12345",
-        "Content-Type": "application/json"
-    }
+    return _INVALID_AUTH_HEADERS
 
 
 @pytest.fixture(scope="function")
@@ -103,13 +270,13 @@ def sample_reminder_minimal():
     }
 
 
-@pytest.fixture(scope="function")
-def created_reminder(client, auth_headers, sample_reminder_data):
+@pytest_asyncio.fixture(loop_scope="session")
+async def created_reminder(async_client, auth_headers, sample_reminder_data):
     """
     Create a reminder and return its data.
     Useful for testing update/delete operations.
     """
-    response = client.post(
+    response = await async_client.post(
         "/api/reminders",
         headers=auth_headers,
         json=sample_reminder_data
@@ -118,8 +285,8 @@ def created_reminder(client, auth_headers, sample_reminder_data):
     return response.json()
 
 
-@pytest.fixture(scope="function")
-def multiple_reminders(client, auth_headers):
+@pytest_asyncio.fixture(loop_scope="session")
+async def multiple_reminders(async_client, auth_headers):
     """
     Create multiple reminders for testing list operations.
     """
@@ -131,14 +298,10 @@ def multiple_reminders(client, auth_headers):
         {"text": "Reminder 5", "priority": "important", "due_date": "2025-11-20"},
     ]
 
-    created = []
-    for data in reminders_data:
-        response = client.post(
-            "/api/reminders",
-            headers=auth_headers,
-            json=data
-        )
-        assert response.status_code == 201
-        created.append(response.json())
-
-    return created
+    response = await async_client.post(
+        "/api/reminders/bulk",
+        headers=auth_headers,
+        json=reminders_data
+    )
+    assert response.status_code == 201
+    return response.json()
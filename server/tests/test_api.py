@@ -3,6 +3,8 @@ API endpoint tests for the reminders system
 Tests all CRUD operations and authentication
 """
 
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -41,6 +43,27 @@ def test_health_check_no_auth_required(client):
     assert "database" in data
 
 
+@pytest.mark.api
+def test_openapi_schema_built_at_startup(client):
+    """Test OpenAPI schema is generated at startup and served from cache"""
+    from server.main import app
+
+    assert app.openapi_schema is not None
+
+    response = client.get("/openapi.json")
+    assert response.status_code == 200
+    assert "ReminderResponse" in response.json()["components"]["schemas"]
+
+
+@pytest.mark.api
+def test_parse_response_mode_excludes_auto(client):
+    """Test a parse response can only report the mode actually used"""
+    schemas = client.get("/openapi.json").json()["components"]["schemas"]
+
+    parse_mode = schemas["ReminderParseResponse"]["properties"]["parse_mode"]
+    assert parse_mode["enum"] == ["local", "cloud"]
+
+
 # =============================================================================
 # Create Operation Tests
 # =============================================================================
@@ -320,6 +343,70 @@ def test_list_reminders_pagination(client, auth_headers, multiple_reminders):
     assert data["pagination"]["offset"] == 1
 
 
+@pytest.mark.api
+def test_list_reminders_by_ids(client, auth_headers, multiple_reminders):
+    """Test fetching several reminders by ID in one request"""
+    ids = [multiple_reminders[2]["id"], "nonexistent-id", multiple_reminders[0]["id"]]
+    response = client.get(
+        f"/api/reminders?ids={','.join(ids)}",
+        headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+
+    # Requested order is kept and unknown IDs are skipped
+    assert [r["id"] for r in data["data"]] == [ids[0], ids[2]]
+    assert data["pagination"]["total"] == 2
+
+    # Other filters still apply
+    response = client.get(
+        f"/api/reminders?ids={','.join(ids)}&priority={multiple_reminders[0]['priority']}",
+        headers=auth_headers
+    )
+    assert [r["id"] for r in response.json()["data"]] == [ids[2]]
+
+
+@pytest.mark.api
+def test_stream_reminders(client, auth_headers, multiple_reminders):
+    """Test streaming reminders as NDJSON"""
+    response = client.get("/api/reminders/stream", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    lines = [line for line in response.text.splitlines() if line]
+    reminders = [json.loads(line) for line in lines]
+    ids = {reminder["id"] for reminder in reminders}
+
+    for created in multiple_reminders:
+        assert created["id"] in ids
+    for reminder in reminders:
+        assert isinstance(reminder["time_required"], bool)
+
+
+@pytest.mark.api
+def test_stream_reminders_filter_by_priority(client, auth_headers, multiple_reminders):
+    """Test filtering streamed reminders by priority"""
+    response = client.get(
+        "/api/reminders/stream?priority=urgent",
+        headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    reminders = [json.loads(line) for line in response.text.splitlines() if line]
+    assert len(reminders) >= 1
+    for reminder in reminders:
+        assert reminder["priority"] == "urgent"
+
+
+@pytest.mark.api
+def test_stream_reminders_requires_auth(client):
+    """Test streaming endpoint rejects unauthenticated requests"""
+    response = client.get("/api/reminders/stream")
+    assert response.status_code == 401
+
+
 # =============================================================================
 # Update Operation Tests
 # =============================================================================
@@ -417,3 +504,72 @@ def test_delete_nonexistent_reminder_returns_404(client, auth_headers):
     )
 
     assert response.status_code == 404
+
+
+# =============================================================================
+# Bulk Create Tests
+# =============================================================================
+
+@pytest.mark.api
+def test_bulk_create_reminders(client, auth_headers):
+    """Test creating several reminders in one request"""
+    reminders_data = [
+        {"text": "Bulk 1", "priority": "urgent"},
+        {"text": "Bulk 2", "due_date": "2025-11-20", "time_required": True},
+    ]
+
+    response = client.post(
+        "/api/reminders/bulk",
+        headers=auth_headers,
+        json=reminders_data
+    )
+
+    assert response.status_code == 201
+    data = response.json()
+    assert [r["text"] for r in data] == ["Bulk 1", "Bulk 2"]
+    assert data[1]["time_required"] is True
+    assert data[0]["id"] != data[1]["id"]
+
+    fetched = client.get(f"/api/reminders/{data[0]['id']}", headers=auth_headers)
+    assert fetched.status_code == 200
+    assert fetched.json()["priority"] == "urgent"
+
+
+@pytest.mark.api
+def test_bulk_create_rejects_invalid_item(client, auth_headers):
+    """Test one invalid reminder fails the whole bulk request"""
+    response = client.post(
+        "/api/reminders/bulk",
+        headers=auth_headers,
+        json=[{"text": "Valid"}, {"text": "Bad date", "due_date": "2025-13-45"}]
+    )
+
+    assert response.status_code == 422
+
+
+@pytest.mark.api
+def test_bulk_create_rejects_oversized_list(client, auth_headers):
+    """Test a bulk request over the size cap is rejected before anything is inserted"""
+    from server.main import MAX_BULK_REMINDERS
+
+    response = client.post(
+        "/api/reminders/bulk",
+        headers=auth_headers,
+        json=[{"text": f"Bulk {i}"} for i in range(MAX_BULK_REMINDERS + 1)]
+    )
+
+    assert response.status_code == 422
+    listed = client.get("/api/reminders", headers=auth_headers)
+    assert listed.json()["pagination"]["total"] == 0
+
+
+@pytest.mark.api
+def test_bulk_create_rejects_recurring_reminders(client, auth_headers):
+    """Test recurring reminders are not accepted by the bulk endpoint"""
+    response = client.post(
+        "/api/reminders/bulk",
+        headers=auth_headers,
+        json=[{"text": "Daily standup", "recurrence_pattern": {"frequency": "daily"}}]
+    )
+
+    assert response.status_code == 400
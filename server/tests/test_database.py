@@ -244,3 +244,65 @@ def test_count_reminders_with_filters(test_db):
         db_path=test_db
     )
     assert no_match_results[0]['count'] == 0
+
+
+def test_bulk_create_reminders_with_mixed_fields(worker_db):
+    """Verify fields missing from the first record are still stored for later ones."""
+    now = datetime.now(timezone.utc).isoformat()
+    first_id = str(uuid.uuid4())
+    second_id = str(uuid.uuid4())
+
+    ids = db.bulk_create_reminders([
+        {'id': first_id, 'text': 'First', 'priority': 'urgent',
+         'created_at': now, 'updated_at': now},
+        {'id': second_id, 'text': 'Second', 'category': 'Work', 'due_date': '2026-01-01',
+         'created_at': now, 'updated_at': now},
+    ])
+
+    assert ids == [first_id, second_id]
+    rows = db.get_reminders_by_ids(ids, db_path=str(worker_db))
+    assert rows[first_id]['priority'] == 'urgent'
+    assert rows[first_id]['category'] is None
+    assert rows[second_id]['category'] == 'Work'
+    assert rows[second_id]['due_date'] == '2026-01-01'
+    # Omitted fields fall back to the column default rather than NULL
+    assert rows[second_id]['priority'] == 'chill'
+
+
+def test_status_priority_filter_uses_composite_index(test_db):
+    """Verify combined status/priority filters are served by the composite index."""
+    plan = db.db_query(
+        """EXPLAIN QUERY PLAN
+           SELECT * FROM reminders WHERE status = ? AND priority = ?
+           ORDER BY created_at DESC""",
+        ('pending', 'urgent'),
+        db_path=test_db
+    )
+
+    details = " ".join(row['detail'] for row in plan)
+    assert 'idx_reminders_status_priority' in details
+    assert 'TEMP B-TREE' not in details
+
+
+def test_recurrence_instance_lookup_uses_composite_index(test_db):
+    """Verify enumerating a pattern's future instances is served by the recurrence index."""
+    plan = db.db_query(
+        """EXPLAIN QUERY PLAN
+           SELECT id FROM reminders WHERE recurrence_id = ? AND due_date >= ?""",
+        ('pattern-id', '2025-01-01'),
+        db_path=test_db
+    )
+
+    details = " ".join(row['detail'] for row in plan)
+    assert 'idx_reminders_recurrence' in details
+
+
+def test_get_connection_applies_connection_pragmas(test_db, monkeypatch):
+    """Verify PRAGMAs in CONNECTION_PRAGMAS are set on every new connection."""
+    monkeypatch.setattr(db, "CONNECTION_PRAGMAS", ("synchronous=OFF",))
+
+    conn = db.get_connection(test_db)
+    try:
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+    finally:
+        conn.close()
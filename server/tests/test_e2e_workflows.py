@@ -3,23 +3,50 @@ End-to-End Integration Tests for Complete User Workflows
 Tests multi-feature interactions from creation through completion
 """
 
+import orjson
 import pytest
+import uuid
 from datetime import datetime, timezone, timedelta, date
-import time
 
 
 # =============================================================================
 # Helper Functions
 # =============================================================================
 
-def get_iso_timestamp(offset_seconds: int = 0) -> str:
-    """Generate ISO 8601 timestamp with optional offset"""
-    dt = datetime.now(timezone.utc)
+def get_iso_timestamp(offset_seconds: int = 0, base: datetime = None) -> str:
+    """
+    Generate ISO 8601 timestamp with optional offset.
+
+    Pass a fixed base to derive several timestamps from one clock reading,
+    so their order is exactly their offsets' order.
+    """
+    dt = base if base is not None else datetime.now(timezone.utc)
     if offset_seconds:
         dt = dt + timedelta(seconds=offset_seconds)
     return dt.isoformat()
 
 
+def _json(response):
+    """Decode a response body with orjson (faster than response.json())"""
+    return orjson.loads(response.content)
+
+
+def _patch_each(client, reminder_ids, changes, headers):
+    """
+    PATCH the same changes onto several reminders.
+
+    The body is serialized and the headers merged once, then each request is
+    built and sent directly instead of going through client.patch().
+    """
+    content = orjson.dumps(changes)
+    headers = {**headers, "Content-Type": "application/json"}
+    for reminder_id in reminder_ids:
+        request = client.build_request(
+            "PATCH", f"/api/reminders/{reminder_id}", content=content, headers=headers
+        )
+        yield client.send(request)
+
+
 # =============================================================================
 # Complete CRUD Workflows (3 tests)
 # =============================================================================
@@ -34,13 +61,13 @@ def test_create_read_update_complete_delete_reminder_flow(client, auth_headers):
         headers=auth_headers
     )
     assert create_response.status_code == 201
-    reminder_id = create_response.json()["id"]
+    reminder_id = _json(create_response)["id"]
     assert reminder_id is not None
 
     # Step 2: Read reminder
     get_response = client.get(f"/api/reminders/{reminder_id}", headers=auth_headers)
     assert get_response.status_code == 200
-    reminder = get_response.json()
+    reminder = _json(get_response)
     assert reminder["text"] == "E2E Test Reminder"
     assert reminder["priority"] == "important"
     assert reminder["status"] == "pending"
@@ -52,7 +79,7 @@ def test_create_read_update_complete_delete_reminder_flow(client, auth_headers):
         headers=auth_headers
     )
     assert update_response.status_code == 200
-    updated = update_response.json()
+    updated = _json(update_response)
     assert updated["text"] == "Updated E2E Test"
     assert updated["priority"] == "urgent"
 
@@ -63,7 +90,7 @@ def test_create_read_update_complete_delete_reminder_flow(client, auth_headers):
         headers=auth_headers
     )
     assert complete_response.status_code == 200
-    completed = complete_response.json()
+    completed = _json(complete_response)
     assert completed["status"] == "completed"
     assert completed["completed_at"] is not None
 
@@ -77,54 +104,58 @@ def test_create_read_update_complete_delete_reminder_flow(client, auth_headers):
 
 
 @pytest.mark.e2e
-def test_create_multiple_list_filter_update_workflow(client, auth_headers):
+@pytest.mark.slow
+@pytest.mark.timeout(10)
+def test_create_multiple_list_filter_update_workflow(client, auth_headers, seeded_reminders):
     """Test creating multiple reminders, listing, filtering, and updating."""
     # Step 1: Create multiple reminders with different priorities
-    reminders = []
     priorities = ["chill", "important", "urgent", "chill", "important"]
-    for i, priority in enumerate(priorities):
-        response = client.post(
-            "/api/reminders",
-            json={"text": f"Reminder {i+1}", "priority": priority},
-            headers=auth_headers
-        )
-        assert response.status_code == 201
-        reminders.append(response.json())
+    reminders = seeded_reminders(
+        [{"text": f"Reminder {i+1}", "priority": priority} for i, priority in enumerate(priorities)]
+    )
+
+    # Only this test's reminders are checked, so rows created by other tests
+    # in the same database do not affect the assertions
+    created_ids = {reminder["id"] for reminder in reminders}
 
     # Step 2: List all reminders
-    list_response = client.get("/api/reminders", headers=auth_headers)
+    list_response = client.get("/api/reminders?limit=1000", headers=auth_headers)
     assert list_response.status_code == 200
-    all_reminders = list_response.json()
-    assert len(all_reminders["data"]) >= 5
+    all_reminders = _json(list_response)
+    assert created_ids <= {r["id"] for r in all_reminders["data"]}
 
     # Step 3: Filter by priority (chill)
-    filter_response = client.get("/api/reminders?priority=chill", headers=auth_headers)
+    filter_response = client.get("/api/reminders?priority=chill&limit=1000", headers=auth_headers)
     assert filter_response.status_code == 200
-    chill_reminders = filter_response.json()
-    assert len(chill_reminders["data"]) >= 2
+    chill_reminders = _json(filter_response)
     for reminder in chill_reminders["data"]:
         assert reminder["priority"] == "chill"
+    chill_ids = [r["id"] for r in chill_reminders["data"] if r["id"] in created_ids]
+    assert len(chill_ids) == 2
 
     # Step 4: Update one reminder from chill to urgent
-    chill_id = chill_reminders["data"][0]["id"]
+    chill_id = chill_ids[0]
     update_response = client.patch(
         f"/api/reminders/{chill_id}",
         json={"priority": "urgent"},
         headers=auth_headers
     )
     assert update_response.status_code == 200
-    assert update_response.json()["priority"] == "urgent"
+    assert _json(update_response)["priority"] == "urgent"
 
     # Step 5: Verify filter updated
-    new_filter = client.get("/api/reminders?priority=chill", headers=auth_headers)
+    new_filter = client.get("/api/reminders?priority=chill&limit=1000", headers=auth_headers)
     assert new_filter.status_code == 200
     # Should have one less chill reminder now
-    assert len(new_filter.json()["data"]) == len(chill_reminders["data"]) - 1
+    new_chill_ids = [r["id"] for r in _json(new_filter)["data"] if r["id"] in created_ids]
+    assert new_chill_ids == chill_ids[1:]
 
 
 @pytest.mark.e2e
 def test_reminder_status_transitions(client, auth_headers):
     """Test reminder status transitions: pending → snoozed → completed."""
+    from server import database as db
+
     # Create reminder
     response = client.post(
         "/api/reminders",
@@ -132,11 +163,10 @@ def test_reminder_status_transitions(client, auth_headers):
         headers=auth_headers
     )
     assert response.status_code == 201
-    reminder_id = response.json()["id"]
+    reminder_id = _json(response)["id"]
 
-    # Verify initial status is pending
-    get_response = client.get(f"/api/reminders/{reminder_id}", headers=auth_headers)
-    assert get_response.json()["status"] == "pending"
+    # Verify initial status is pending (stored state only, so read the DB directly)
+    assert db.get_reminder_by_id(reminder_id)["status"] == "pending"
 
     # Transition to snoozed
     update1 = client.patch(
@@ -145,8 +175,8 @@ def test_reminder_status_transitions(client, auth_headers):
         headers=auth_headers
     )
     assert update1.status_code == 200
-    assert update1.json()["status"] == "snoozed"
-    assert update1.json()["completed_at"] is None
+    assert _json(update1)["status"] == "snoozed"
+    assert _json(update1)["completed_at"] is None
 
     # Transition back to pending
     update2 = client.patch(
@@ -155,7 +185,7 @@ def test_reminder_status_transitions(client, auth_headers):
         headers=auth_headers
     )
     assert update2.status_code == 200
-    assert update2.json()["status"] == "pending"
+    assert _json(update2)["status"] == "pending"
 
     # Transition to completed
     update3 = client.patch(
@@ -164,8 +194,8 @@ def test_reminder_status_transitions(client, auth_headers):
         headers=auth_headers
     )
     assert update3.status_code == 200
-    assert update3.json()["status"] == "completed"
-    assert update3.json()["completed_at"] is not None
+    assert _json(update3)["status"] == "completed"
+    assert _json(update3)["completed_at"] is not None
 
 
 # =============================================================================
@@ -191,7 +221,7 @@ def test_create_with_location_search_near_location(client, auth_headers):
         headers=auth_headers
     )
     assert create_response.status_code == 201
-    reminder = create_response.json()
+    reminder = _json(create_response)
     assert reminder["location_name"] == "Whole Foods SF"
 
     # Step 2: Search near the location (within 500m)
@@ -200,14 +230,14 @@ def test_create_with_location_search_near_location(client, auth_headers):
         headers=auth_headers
     )
     assert search_response.status_code == 200
-    nearby = search_response.json()
+    nearby = _json(search_response)
 
     # Step 3: Verify reminder was found
-    found_ids = [r["id"] for r in nearby["data"]]
-    assert reminder["id"] in found_ids
+    found_by_id = {r["id"]: r for r in nearby["data"]}
+    assert reminder["id"] in found_by_id
 
     # Step 4: Verify distance metadata is present
-    found_reminder = next(r for r in nearby["data"] if r["id"] == reminder["id"])
+    found_reminder = found_by_id[reminder["id"]]
     assert "distance" in found_reminder
     assert found_reminder["distance"] < 500  # Within search radius
 
@@ -216,45 +246,41 @@ def test_create_with_location_search_near_location(client, auth_headers):
 def test_create_multiple_reminders_complete_workflow(client, auth_headers):
     """Test creating multiple reminders with different attributes and completing them."""
     # Create 3 reminders with different priorities and categories
-    reminders = []
     configs = [
         {"text": "Buy groceries", "priority": "important", "category": "Personal"},
         {"text": "Team meeting", "priority": "urgent", "category": "Work"},
         {"text": "Call dentist", "priority": "chill", "category": "Health"}
     ]
 
-    for config in configs:
-        response = client.post("/api/reminders", json=config, headers=auth_headers)
-        assert response.status_code == 201
-        reminders.append(response.json())
+    response = client.post("/api/reminders/bulk", json=configs, headers=auth_headers)
+    assert response.status_code == 201
+    reminders = _json(response)
 
     # Verify all created
-    for reminder in reminders:
-        get_response = client.get(f"/api/reminders/{reminder['id']}", headers=auth_headers)
-        assert get_response.status_code == 200
-        assert get_response.json()["status"] == "pending"
+    ids = ",".join(reminder["id"] for reminder in reminders)
+    get_response = client.get(f"/api/reminders?ids={ids}", headers=auth_headers)
+    assert get_response.status_code == 200
+    fetched = _json(get_response)["data"]
+    assert [r["id"] for r in fetched] == [reminder["id"] for reminder in reminders]
+    assert all(r["status"] == "pending" for r in fetched)
 
     # Filter by category
     work_filter = client.get("/api/reminders?category=Work", headers=auth_headers)
     assert work_filter.status_code == 200
-    work_reminders = work_filter.json()["data"]
+    work_reminders = _json(work_filter)["data"]
     assert len(work_reminders) >= 1
     assert any(r["text"] == "Team meeting" for r in work_reminders)
 
     # Complete all reminders
-    for reminder in reminders:
-        complete = client.patch(
-            f"/api/reminders/{reminder['id']}",
-            json={"status": "completed"},
-            headers=auth_headers
-        )
+    reminder_ids = [reminder["id"] for reminder in reminders]
+    for complete in _patch_each(client, reminder_ids, {"status": "completed"}, auth_headers):
         assert complete.status_code == 200
-        assert complete.json()["status"] == "completed"
+        assert _json(complete)["status"] == "completed"
 
     # Verify all completed
     completed_filter = client.get("/api/reminders?status=completed", headers=auth_headers)
     assert completed_filter.status_code == 200
-    completed_ids = [r["id"] for r in completed_filter.json()["data"]]
+    completed_ids = {r["id"] for r in _json(completed_filter)["data"]}
     for reminder in reminders:
         assert reminder["id"] in completed_ids
 
@@ -278,7 +304,7 @@ def test_location_based_reminder_triggers_at_location(client, auth_headers):
         headers=auth_headers
     )
     assert create_response.status_code == 201
-    reminder_id = create_response.json()["id"]
+    reminder_id = _json(create_response)["id"]
 
     # Query nearby location (simulate being near Home Depot)
     nearby_response = client.get(
@@ -286,10 +312,10 @@ def test_location_based_reminder_triggers_at_location(client, auth_headers):
         headers=auth_headers
     )
     assert nearby_response.status_code == 200
-    nearby = nearby_response.json()
+    nearby = _json(nearby_response)
 
     # Verify reminder appears in results
-    found_ids = [r["id"] for r in nearby["data"]]
+    found_ids = {r["id"] for r in nearby["data"]}
     assert reminder_id in found_ids
 
     # Query far location (should not appear)
@@ -299,10 +325,10 @@ def test_location_based_reminder_triggers_at_location(client, auth_headers):
         headers=auth_headers
     )
     assert far_response.status_code == 200
-    far = far_response.json()
+    far = _json(far_response)
 
     # Verify reminder does NOT appear in far results
-    far_ids = [r["id"] for r in far["data"]]
+    far_ids = {r["id"] for r in far["data"]}
     assert reminder_id not in far_ids
 
 
@@ -331,7 +357,7 @@ def test_create_reminder_with_all_features_complete_workflow(client, auth_header
         headers=auth_headers
     )
     assert create_response.status_code == 201
-    reminder = create_response.json()
+    reminder = _json(create_response)
 
     # Verify all fields
     assert reminder["text"] == "Team meeting at office"
@@ -350,7 +376,7 @@ def test_create_reminder_with_all_features_complete_workflow(client, auth_header
         headers=auth_headers
     )
     assert update_response.status_code == 200
-    updated = update_response.json()
+    updated = _json(update_response)
     assert updated["priority"] == "urgent"
     assert updated["due_time"] == "09:30:00"
     assert updated["category"] == "Work"  # Unchanged
@@ -372,7 +398,7 @@ def test_create_local_sync_verify_cloud(client, auth_headers):
         headers=auth_headers
     )
     assert create_response.status_code == 201
-    reminder = create_response.json()
+    reminder = _json(create_response)
 
     # Verify initial synced_at is None
     initial = db.get_reminder_by_id(reminder["id"])
@@ -386,9 +412,9 @@ def test_create_local_sync_verify_cloud(client, auth_headers):
         "changes": []  # Just pulling server changes
     }
 
-    sync_response = client.post("/api/sync", json=sync_request, headers=auth_headers)
+    sync_response = client.post("/api/sync", content=orjson.dumps(sync_request), headers=auth_headers)
     assert sync_response.status_code == 200
-    sync_data = sync_response.json()
+    sync_data = _json(sync_response)
 
     # Step 3: Verify synced_at timestamp was updated
     after_sync = db.get_reminder_by_id(reminder["id"])
@@ -404,13 +430,14 @@ def test_create_local_sync_verify_cloud(client, auth_headers):
 @pytest.mark.e2e
 def test_offline_create_multiple_sync_when_online(client, auth_headers):
     """Test creating multiple reminders offline, then syncing all at once."""
-    base_time = get_iso_timestamp(-120)
+    now = datetime.now(timezone.utc)
+    base_time = get_iso_timestamp(-120, now)
 
     # Simulate 3 offline creations
     offline_changes = []
     for i in range(3):
-        change_time = get_iso_timestamp(-90 + i * 30)
-        reminder_id = f"offline-reminder-{i}-{int(time.time())}"
+        change_time = get_iso_timestamp(-90 + i * 30, now)
+        reminder_id = f"offline-reminder-{uuid.uuid4()}"
         offline_changes.append({
             "id": reminder_id,
             "action": "create",
@@ -432,23 +459,24 @@ def test_offline_create_multiple_sync_when_online(client, auth_headers):
         "changes": offline_changes
     }
 
-    sync_response = client.post("/api/sync", json=sync_request, headers=auth_headers)
+    sync_response = client.post("/api/sync", content=orjson.dumps(sync_request), headers=auth_headers)
     assert sync_response.status_code == 200
-    sync_data = sync_response.json()
+    sync_data = _json(sync_response)
 
     # Verify all 3 were applied
     assert sync_data["applied_count"] == 3
 
     # Verify all reminders exist on server
+    ids = ",".join(change["id"] for change in offline_changes)
+    get_response = client.get(f"/api/reminders?ids={ids}", headers=auth_headers)
+    assert get_response.status_code == 200
+    server_reminders = {r["id"]: r for r in _json(get_response)["data"]}
     for change in offline_changes:
-        get_response = client.get(f"/api/reminders/{change['id']}", headers=auth_headers)
-        assert get_response.status_code == 200
-        reminder = get_response.json()
-        assert reminder["text"] == change["data"]["text"]
+        assert server_reminders[change["id"]]["text"] == change["data"]["text"]
 
 
 @pytest.mark.e2e
-def test_conflict_resolution_last_write_wins_e2e(client, auth_headers):
+def test_conflict_resolution_last_write_wins_e2e(client, auth_headers, fake_clock):
     """Test conflict resolution with last-write-wins strategy."""
     from server import database as db
 
@@ -459,18 +487,19 @@ def test_conflict_resolution_last_write_wins_e2e(client, auth_headers):
         headers=auth_headers
     )
     assert create_response.status_code == 201
-    reminder_id = create_response.json()["id"]
+    reminder_id = _json(create_response)["id"]
+    created_at = _json(create_response)["updated_at"]
 
-    # Step 2: Update on server with recent timestamp
-    time.sleep(0.01)
+    # Step 2: Update on server with recent timestamp (next fake clock tick)
     server_update = client.patch(
         f"/api/reminders/{reminder_id}",
         json={"text": "Server updated text", "priority": "urgent"},
         headers=auth_headers
     )
     assert server_update.status_code == 200
-    server_version = server_update.json()
+    server_version = _json(server_update)
     server_timestamp = server_version["updated_at"]
+    assert server_timestamp > created_at
 
     # Step 3: Client tries to sync with older timestamp (conflict)
     old_client_time = get_iso_timestamp(-10)
@@ -487,9 +516,9 @@ def test_conflict_resolution_last_write_wins_e2e(client, auth_headers):
         ]
     }
 
-    sync_response = client.post("/api/sync", json=sync_request, headers=auth_headers)
+    sync_response = client.post("/api/sync", content=orjson.dumps(sync_request), headers=auth_headers)
     assert sync_response.status_code == 200
-    sync_data = sync_response.json()
+    sync_data = _json(sync_response)
 
     # Step 4: Verify conflict was detected
     assert len(sync_data["conflicts"]) == 1
@@ -500,8 +529,8 @@ def test_conflict_resolution_last_write_wins_e2e(client, auth_headers):
     # Step 5: Verify server version was preserved
     final = client.get(f"/api/reminders/{reminder_id}", headers=auth_headers)
     assert final.status_code == 200
-    assert final.json()["text"] == "Server updated text"
-    assert final.json()["priority"] == "urgent"
+    assert _json(final)["text"] == "Server updated text"
+    assert _json(final)["priority"] == "urgent"
 
 
 # =============================================================================
@@ -518,16 +547,16 @@ def test_create_urgent_update_to_chill_workflow(client, auth_headers):
         headers=auth_headers
     )
     assert create_response.status_code == 201
-    reminder_id = create_response.json()["id"]
+    reminder_id = _json(create_response)["id"]
 
     # Verify it's urgent
     get_response = client.get(f"/api/reminders/{reminder_id}", headers=auth_headers)
-    assert get_response.json()["priority"] == "urgent"
+    assert _json(get_response)["priority"] == "urgent"
 
     # Filter by urgent
     urgent_filter = client.get("/api/reminders?priority=urgent", headers=auth_headers)
     assert urgent_filter.status_code == 200
-    urgent_ids = [r["id"] for r in urgent_filter.json()["data"]]
+    urgent_ids = {r["id"] for r in _json(urgent_filter)["data"]}
     assert reminder_id in urgent_ids
 
     # Update to chill
@@ -537,44 +566,41 @@ def test_create_urgent_update_to_chill_workflow(client, auth_headers):
         headers=auth_headers
     )
     assert update_response.status_code == 200
-    assert update_response.json()["priority"] == "chill"
+    assert _json(update_response)["priority"] == "chill"
 
     # Filter by chill (should appear)
     chill_filter = client.get("/api/reminders?priority=chill", headers=auth_headers)
     assert chill_filter.status_code == 200
-    chill_ids = [r["id"] for r in chill_filter.json()["data"]]
+    chill_ids = {r["id"] for r in _json(chill_filter)["data"]}
     assert reminder_id in chill_ids
 
     # Filter by urgent (should NOT appear)
     new_urgent_filter = client.get("/api/reminders?priority=urgent", headers=auth_headers)
-    new_urgent_ids = [r["id"] for r in new_urgent_filter.json()["data"]]
+    new_urgent_ids = {r["id"] for r in _json(new_urgent_filter)["data"]}
     assert reminder_id not in new_urgent_ids
 
 
 @pytest.mark.e2e
-def test_filter_by_priority_update_verify_filter(client, auth_headers):
+@pytest.mark.slow
+@pytest.mark.timeout(10)
+def test_filter_by_priority_update_verify_filter(client, auth_headers, seeded_reminders):
     """Test creating reminders with different priorities, filtering, and updating."""
     # Create reminders with all priorities
     priorities = ["chill", "important", "urgent", "someday", "waiting"]
-    created_ids = {}
 
-    for priority in priorities:
-        response = client.post(
-            "/api/reminders",
-            json={"text": f"{priority.capitalize()} reminder", "priority": priority},
-            headers=auth_headers
-        )
-        assert response.status_code == 201
-        created_ids[priority] = response.json()["id"]
+    reminders = seeded_reminders(
+        [{"text": f"{priority.capitalize()} reminder", "priority": priority} for priority in priorities]
+    )
+    created_ids = {reminder["priority"]: reminder["id"] for reminder in reminders}
 
     # Filter by each priority
     for priority in priorities:
         filter_response = client.get(f"/api/reminders?priority={priority}", headers=auth_headers)
         assert filter_response.status_code == 200
-        filtered = filter_response.json()["data"]
+        filtered = _json(filter_response)["data"]
 
         # Verify our reminder appears
-        filtered_ids = [r["id"] for r in filtered]
+        filtered_ids = {r["id"] for r in filtered}
         assert created_ids[priority] in filtered_ids
 
         # Verify all filtered reminders have correct priority
@@ -591,11 +617,11 @@ def test_filter_by_priority_update_verify_filter(client, auth_headers):
 
     # Verify it moved from someday to urgent
     someday_check = client.get("/api/reminders?priority=someday", headers=auth_headers)
-    someday_ids = [r["id"] for r in someday_check.json()["data"]]
+    someday_ids = {r["id"] for r in _json(someday_check)["data"]}
     assert created_ids["someday"] not in someday_ids
 
     urgent_check = client.get("/api/reminders?priority=urgent", headers=auth_headers)
-    urgent_ids = [r["id"] for r in urgent_check.json()["data"]]
+    urgent_ids = {r["id"] for r in _json(urgent_check)["data"]}
     assert created_ids["someday"] in urgent_ids
 
 
@@ -606,7 +632,14 @@ def test_filter_by_priority_update_verify_filter(client, auth_headers):
 @pytest.mark.e2e
 def test_sync_continues_after_partial_error(client, auth_headers):
     """Test sync continues processing after encountering invalid changes."""
-    base_time = get_iso_timestamp(-60)
+    from server import database as db
+
+    now = datetime.now(timezone.utc)
+    base_time = get_iso_timestamp(-60, now)
+    first_time = get_iso_timestamp(-30, now)
+    invalid_time = get_iso_timestamp(-20, now)
+    second_time = get_iso_timestamp(-10, now)
+    valid_ids = [f"valid-1-{uuid.uuid4()}", f"valid-2-{uuid.uuid4()}"]
 
     sync_request = {
         "client_id": "device-error-test",
@@ -614,101 +647,91 @@ def test_sync_continues_after_partial_error(client, auth_headers):
         "changes": [
             # Valid change 1
             {
-                "id": f"valid-1-{int(time.time())}",
+                "id": valid_ids[0],
                 "action": "create",
                 "data": {
-                    "id": f"valid-1-{int(time.time())}",
+                    "id": valid_ids[0],
                     "text": "Valid reminder 1",
                     "priority": "chill",
                     "status": "pending",
-                    "created_at": get_iso_timestamp(-30),
-                    "updated_at": get_iso_timestamp(-30)
+                    "created_at": first_time,
+                    "updated_at": first_time
                 },
-                "updated_at": get_iso_timestamp(-30)
+                "updated_at": first_time
             },
             # Invalid change (missing data)
             {
                 "id": "invalid-change",
                 "action": "update",
                 "data": None,  # Invalid
-                "updated_at": get_iso_timestamp(-20)
+                "updated_at": invalid_time
             },
             # Valid change 2
             {
-                "id": f"valid-2-{int(time.time())}",
+                "id": valid_ids[1],
                 "action": "create",
                 "data": {
-                    "id": f"valid-2-{int(time.time())}",
+                    "id": valid_ids[1],
                     "text": "Valid reminder 2",
                     "priority": "important",
                     "status": "pending",
-                    "created_at": get_iso_timestamp(-10),
-                    "updated_at": get_iso_timestamp(-10)
+                    "created_at": second_time,
+                    "updated_at": second_time
                 },
-                "updated_at": get_iso_timestamp(-10)
+                "updated_at": second_time
             }
         ]
     }
 
-    response = client.post("/api/sync", json=sync_request, headers=auth_headers)
+    response = client.post("/api/sync", content=orjson.dumps(sync_request), headers=auth_headers)
     assert response.status_code == 200
-    sync_data = response.json()
+    sync_data = _json(response)
 
     # Should apply 2 out of 3 (invalid one skipped)
     assert sync_data["applied_count"] == 2
 
-    # Verify valid reminders were created
+    # Verify valid reminders were created (stored state only, so read the DB directly)
     changes = sync_request["changes"]
-    get1 = client.get(f"/api/reminders/{changes[0]['id']}", headers=auth_headers)
-    assert get1.status_code == 200
-
-    get2 = client.get(f"/api/reminders/{changes[2]['id']}", headers=auth_headers)
-    assert get2.status_code == 200
+    assert db.get_reminder_by_id(changes[0]["id"]) is not None
+    assert db.get_reminder_by_id(changes[2]["id"]) is not None
 
 
 @pytest.mark.e2e
-def test_bulk_operations_workflow(client, auth_headers):
+@pytest.mark.slow
+@pytest.mark.timeout(10)
+def test_bulk_operations_workflow(client, auth_headers, seeded_reminders):
     """Test bulk operations: create multiple, filter, batch update, batch delete."""
     # Step 1: Create 10 reminders
-    reminder_ids = []
-    for i in range(10):
-        priority = ["chill", "important", "urgent"][i % 3]
-        response = client.post(
-            "/api/reminders",
-            json={"text": f"Task {i+1}", "priority": priority},
-            headers=auth_headers
-        )
-        assert response.status_code == 201
-        reminder_ids.append(response.json()["id"])
+    reminders = seeded_reminders([
+        {"text": f"Task {i+1}", "priority": ["chill", "important", "urgent"][i % 3]}
+        for i in range(10)
+    ])
+    reminder_ids = [reminder["id"] for reminder in reminders]
 
     # Step 2: Verify all exist
     list_response = client.get("/api/reminders?limit=20", headers=auth_headers)
     assert list_response.status_code == 200
-    all_reminders = list_response.json()["data"]
+    all_reminders = _json(list_response)["data"]
     assert len(all_reminders) >= 10
 
     # Step 3: Filter by urgent priority
-    urgent_response = client.get("/api/reminders?priority=urgent", headers=auth_headers)
-    urgent_reminders = urgent_response.json()["data"]
-    urgent_ids = [r["id"] for r in urgent_reminders if r["id"] in reminder_ids]
+    urgent_response = client.get("/api/reminders?priority=urgent&limit=1000", headers=auth_headers)
+    urgent_reminders = _json(urgent_response)["data"]
+    seeded_ids = set(reminder_ids)
+    urgent_ids = [r["id"] for r in urgent_reminders if r["id"] in seeded_ids]
     assert len(urgent_ids) >= 3  # Should have at least 3 urgent (10/3)
 
     # Step 4: Complete all urgent reminders
-    for urgent_id in urgent_ids:
-        complete = client.patch(
-            f"/api/reminders/{urgent_id}",
-            json={"status": "completed"},
-            headers=auth_headers
-        )
+    for complete in _patch_each(client, urgent_ids, {"status": "completed"}, auth_headers):
         assert complete.status_code == 200
 
     # Step 5: Verify urgent reminders are completed
-    for urgent_id in urgent_ids:
-        get_response = client.get(f"/api/reminders/{urgent_id}", headers=auth_headers)
-        assert get_response.json()["status"] == "completed"
+    get_response = client.get(f"/api/reminders?ids={','.join(urgent_ids)}", headers=auth_headers)
+    assert [r["status"] for r in _json(get_response)["data"]] == ["completed"] * len(urgent_ids)
 
     # Step 6: Delete half of remaining reminders
-    remaining_ids = [rid for rid in reminder_ids if rid not in urgent_ids]
+    completed_ids = set(urgent_ids)
+    remaining_ids = [rid for rid in reminder_ids if rid not in completed_ids]
     to_delete = remaining_ids[:len(remaining_ids)//2]
 
     for rid in to_delete:
@@ -716,6 +739,5 @@ def test_bulk_operations_workflow(client, auth_headers):
         assert delete_response.status_code == 204
 
     # Step 7: Verify deleted reminders are gone
-    for rid in to_delete:
-        get_response = client.get(f"/api/reminders/{rid}", headers=auth_headers)
-        assert get_response.status_code == 404
+    get_response = client.get(f"/api/reminders?ids={','.join(to_delete)}", headers=auth_headers)
+    assert _json(get_response)["data"] == []
@@ -9,10 +9,83 @@ Tests cover:
 - Location validation errors
 - Sync error scenarios
 - Recurrence validation errors
+
+Every test here makes one or two requests, so they use async_client: the app
+runs in-process on the session event loop instead of behind TestClient's
+portal thread.
 """
 
+import orjson
 import pytest
-import json
+from fastapi import Header
+
+from server.main import app, verify_token
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+async def _send_json(client, method, url, payload=None, headers=None):
+    """Send a request with an orjson-encoded body (payload=None sends no body)."""
+    if payload is None:
+        return await client.request(method, url, headers=headers)
+    return await client.request(
+        method,
+        url,
+        content=orjson.dumps(payload),
+        headers={**(headers or {}), "Content-Type": "application/json"}
+    )
+
+
+def _json(response):
+    """Decode a response body with orjson (faster than response.json())"""
+    return orjson.loads(response.content)
+
+
+# Over-long request bodies, serialized once at import
+_OVERLONG_PAYLOADS = {
+    field: orjson.dumps({"text": "Test reminder", "priority": "chill", field: "a" * length})
+    for field, length in [
+        ("text", 1500),  # Exceeds max_length=1000
+        ("category", 150),  # Exceeds max_length=100
+        ("location_name", 600),  # Exceeds max_length=500
+    ]
+}
+
+# Invalid create payloads: (payload, expected status)
+INVALID_PAYLOADS = [
+    # Field validation
+    pytest.param({"text": "Test reminder", "priority": "INVALID_PRIORITY"}, 422, id="invalid_priority"),
+    pytest.param({"text": "", "priority": "chill"}, 422, id="empty_text"),  # Fails min_length
+    pytest.param({"text": None, "priority": "chill"}, 422, id="null_text"),
+    pytest.param({"text": "Test reminder", "status": "in_progress"}, 422, id="invalid_status"),
+    # Location validation
+    pytest.param({"text": "Test reminder", "location_lat": 95.0, "location_lng": 0.0}, 422, id="lat_above_90"),
+    pytest.param({"text": "Test reminder", "location_lat": 0.0, "location_lng": 190.0}, 422, id="lng_above_180"),
+    pytest.param(
+        {"text": "Test reminder", "location_lat": 40.7128, "location_lng": -74.0060, "location_radius": 60000},
+        422, id="radius_above_max"
+    ),
+    pytest.param(
+        {"text": "Test reminder", "location_lat": 40.7128, "location_lng": -74.0060, "location_radius": 5},
+        422, id="radius_below_min"
+    ),
+    # Recurrence validation
+    pytest.param(
+        {"text": "Recurring reminder", "recurrence_pattern": {"frequency": "INVALID_FREQUENCY", "interval": 1}},
+        422, id="invalid_frequency"
+    ),
+    pytest.param(
+        {"text": "Recurring reminder", "recurrence_pattern": {"frequency": "daily", "interval": 1, "end_count": -5}},
+        422, id="negative_end_count"
+    ),
+    pytest.param(
+        {"text": "Recurring reminder", "recurrence_pattern": {"frequency": "weekly", "interval": 0}},
+        422, id="zero_interval"
+    ),
+    pytest.param(
+        {"text": "Recurring reminder", "recurrence_pattern": {"frequency": "yearly", "interval": 500}},
+        422, id="interval_above_max"
+    ),
+]
 
 
 # =============================================================================
@@ -20,39 +93,35 @@ import json
 # =============================================================================
 
 @pytest.mark.api
-def test_create_reminder_missing_text_returns_422(client, auth_headers):
+async def test_create_reminder_missing_text_returns_422(async_client, auth_headers):
     """Test that creating a reminder without text returns 422 validation error."""
-    response = client.post(
+    response = await _send_json(
+        async_client, "post",
         "/api/reminders",
-        json={"priority": "important"},  # Missing required 'text' field
+        payload={"priority": "important"},  # Missing required 'text' field
         headers=auth_headers
     )
     assert response.status_code == 422
     # Verify error message mentions 'text' field
-    error_detail = str(response.json().get("detail", "")).lower()
+    error_detail = str(_json(response).get("detail", "")).lower()
     assert "text" in error_detail
 
 
 @pytest.mark.api
-def test_create_reminder_invalid_priority_returns_422(client, auth_headers):
-    """Test that creating a reminder with invalid priority returns 422."""
-    response = client.post(
-        "/api/reminders",
-        json={
-            "text": "Test reminder",
-            "priority": "INVALID_PRIORITY"  # Not in allowed list
-        },
-        headers=auth_headers
-    )
-    assert response.status_code == 422
+@pytest.mark.parametrize("payload,expected", INVALID_PAYLOADS)
+async def test_create_reminder_validation(async_client, auth_headers, payload, expected):
+    """Test that invalid field values, locations and recurrence patterns are rejected."""
+    response = await _send_json(async_client, "post", "/api/reminders", payload=payload, headers=auth_headers)
+    assert response.status_code == expected
 
 
 @pytest.mark.api
-def test_create_reminder_invalid_date_format_accepted_as_string(client, auth_headers):
+async def test_create_reminder_invalid_date_format_accepted_as_string(async_client, auth_headers):
     """Test that creating a reminder with invalid date format is accepted (stored as-is)."""
-    response = client.post(
+    response = await _send_json(
+        async_client, "post",
         "/api/reminders",
-        json={
+        payload={
             "text": "Test reminder",
             "due_date": "not-a-date"  # Invalid format but accepted as string
         },
@@ -60,32 +129,19 @@ def test_create_reminder_invalid_date_format_accepted_as_string(client, auth_hea
     )
     # API currently accepts any string for dates (no strict validation)
     assert response.status_code == 201
-    data = response.json()
+    data = _json(response)
     assert data["due_date"] == "not-a-date"
 
 
 @pytest.mark.api
-def test_create_reminder_empty_text_returns_422(client, auth_headers):
-    """Test that creating a reminder with empty text returns 422."""
-    response = client.post(
-        "/api/reminders",
-        json={
-            "text": "",  # Empty string should fail min_length validation
-            "priority": "chill"
-        },
-        headers=auth_headers
-    )
-    assert response.status_code == 422
-
-
-@pytest.mark.api
-def test_update_reminder_invalid_status_returns_422(client, auth_headers, created_reminder):
+async def test_update_reminder_invalid_status_returns_422(async_client, auth_headers, created_reminder):
     """Test that updating a reminder with invalid status returns 422."""
     reminder_id = created_reminder["id"]
 
-    response = client.patch(
+    response = await _send_json(
+        async_client, "patch",
         f"/api/reminders/{reminder_id}",
-        json={"status": "INVALID_STATUS"},  # Not in allowed list
+        payload={"status": "INVALID_STATUS"},  # Not in allowed list
         headers=auth_headers
     )
     assert response.status_code == 422
@@ -96,41 +152,27 @@ def test_update_reminder_invalid_status_returns_422(client, auth_headers, create
 # =============================================================================
 
 @pytest.mark.api
-def test_get_nonexistent_reminder_returns_404(client, auth_headers):
-    """Test that GET /api/reminders/{invalid-id} returns 404."""
+@pytest.mark.parametrize(
+    "method,path_tmpl,body",
+    [
+        ("get", "/api/reminders/{id}", None),
+        ("patch", "/api/reminders/{id}", {"text": "Updated text"}),
+        ("delete", "/api/reminders/{id}", None),
+    ],
+)
+async def test_nonexistent_reminder_returns_404(async_client, auth_headers, method, path_tmpl, body):
+    """Test that GET/PATCH/DELETE /api/reminders/{invalid-id} return 404."""
     fake_id = "550e8400-e29b-41d4-a716-446655440999"
 
-    response = client.get(
-        f"/api/reminders/{fake_id}",
-        headers=auth_headers
-    )
-    assert response.status_code == 404
-    assert "detail" in response.json()
-
-
-@pytest.mark.api
-def test_update_nonexistent_reminder_returns_404(client, auth_headers):
-    """Test that PUT /api/reminders/{invalid-id} returns 404."""
-    fake_id = "550e8400-e29b-41d4-a716-446655440999"
-
-    response = client.patch(
-        f"/api/reminders/{fake_id}",
-        json={"text": "Updated text"},
-        headers=auth_headers
-    )
-    assert response.status_code == 404
-
-
-@pytest.mark.api
-def test_delete_nonexistent_reminder_returns_404(client, auth_headers):
-    """Test that DELETE /api/reminders/{invalid-id} returns 404."""
-    fake_id = "550e8400-e29b-41d4-a716-446655440999"
-
-    response = client.delete(
-        f"/api/reminders/{fake_id}",
+    response = await _send_json(
+        async_client,
+        method,
+        path_tmpl.format(id=fake_id),
+        payload=body,
         headers=auth_headers
     )
     assert response.status_code == 404
+    assert "detail" in _json(response)
 
 
 # =============================================================================
@@ -138,35 +180,48 @@ def test_delete_nonexistent_reminder_returns_404(client, auth_headers):
 # =============================================================================
 
 @pytest.mark.api
-def test_create_reminder_no_auth_returns_401(client):
-    """Test that creating a reminder without Authorization header returns 401."""
-    response = client.post(
-        "/api/reminders",
-        json={"text": "Test reminder", "priority": "chill"}
+@pytest.mark.parametrize(
+    "method,path,body,headers,detail",
+    [
         # No headers - missing auth
-    )
+        ("post", "/api/reminders", {"text": "Test reminder", "priority": "chill"}, None, "authorization"),
+        ("post", "/api/reminders", {"text": "Test reminder", "priority": "chill"},
+         {"Authorization": "Bearer INVALID_TOKEN_12345"}, "invalid api token"),
+        # Missing 'Bearer ' prefix
+        ("post", "/api/reminders", {"text": "Test reminder"}, {"Authorization": "INVALID_FORMAT"}, "authorization"),
+        ("get", "/api/reminders", None, None, "authorization"),
+    ],
+    ids=["no_auth", "invalid_token", "malformed_bearer", "list_no_auth"],
+)
+async def test_unauthenticated_request_returns_401(async_client, method, path, body, headers, detail):
+    """Test that missing, invalid or malformed Authorization headers return 401."""
+    response = await _send_json(async_client, method, path, payload=body, headers=headers)
     assert response.status_code == 401
-    error_data = response.json()
+    error_data = _json(response)
     assert "detail" in error_data
-    assert "authorization" in error_data["detail"].lower()
+    assert detail in error_data["detail"].lower()
 
 
 @pytest.mark.api
-def test_create_reminder_invalid_token_returns_401(client):
-    """Test that creating a reminder with invalid Bearer token returns 401."""
-    response = client.post(
-        "/api/reminders",
-        json={"text": "Test reminder", "priority": "chill"},
-        headers={"Authorization": "Bearer INVALID_TOKEN_12345"}
-    )
-    assert response.status_code == 401
-
-
-@pytest.mark.api
-def test_list_reminders_without_auth_returns_401(client):
-    """Test that listing reminders requires authentication."""
-    response = client.get("/api/reminders")
-    assert response.status_code == 401
+async def test_failing_auth_runs_verify_token_once(async_client):
+    """Test that a rejected request evaluates verify_token exactly once."""
+    calls = []
+
+    async def counting_verify_token(authorization: str = Header(None)) -> str:
+        calls.append(authorization)
+        return await verify_token(authorization)
+
+    app.dependency_overrides[verify_token] = counting_verify_token
+    try:
+        for headers in (None, {"Authorization": "Bearer INVALID_TOKEN_12345"}):
+            calls.clear()
+            response = await _send_json(
+                async_client, "post", "/api/reminders", payload={"text": "Test reminder"}, headers=headers
+            )
+            assert response.status_code == 401
+            assert len(calls) == 1
+    finally:
+        app.dependency_overrides.pop(verify_token, None)
 
 
 # =============================================================================
@@ -174,11 +229,11 @@ def test_list_reminders_without_auth_returns_401(client):
 # =============================================================================
 
 @pytest.mark.api
-def test_invalid_uuid_format_returns_400_or_422(client, auth_headers):
+async def test_invalid_uuid_format_returns_400_or_422(async_client, auth_headers):
     """Test that malformed UUID in path returns error."""
     invalid_uuid = "not-a-uuid"
 
-    response = client.get(
+    response = await async_client.get(
         f"/api/reminders/{invalid_uuid}",
         headers=auth_headers
     )
@@ -188,27 +243,24 @@ def test_invalid_uuid_format_returns_400_or_422(client, auth_headers):
 
 
 @pytest.mark.api
-def test_text_exceeds_max_length_handled(client, auth_headers):
-    """Test that very long text (1000+ chars) is handled appropriately."""
-    long_text = "a" * 1500  # Exceeds max_length=1000
-
-    response = client.post(
+@pytest.mark.parametrize("field", list(_OVERLONG_PAYLOADS))
+async def test_field_exceeds_max_length_returns_422(async_client, auth_headers, field):
+    """Test that over-long text, category and location_name return 422."""
+    response = await async_client.post(
         "/api/reminders",
-        json={
-            "text": long_text,
-            "priority": "chill"
-        },
-        headers=auth_headers
+        content=_OVERLONG_PAYLOADS[field],
+        headers={**auth_headers, "Content-Type": "application/json"}
     )
     assert response.status_code == 422  # Validation error
 
 
 @pytest.mark.api
-def test_past_date_accepted_for_overdue(client, auth_headers):
+async def test_past_date_accepted_for_overdue(async_client, auth_headers):
     """Test that past dates are allowed (become overdue reminders)."""
-    response = client.post(
+    response = await _send_json(
+        async_client, "post",
         "/api/reminders",
-        json={
+        payload={
             "text": "Overdue reminder",
             "due_date": "2020-01-01",  # Past date
             "priority": "chill"
@@ -220,11 +272,11 @@ def test_past_date_accepted_for_overdue(client, auth_headers):
 
 
 @pytest.mark.api
-def test_malformed_json_returns_422(client, auth_headers):
+async def test_malformed_json_returns_422(async_client, auth_headers):
     """Test that invalid JSON payload returns 422."""
-    response = client.post(
+    response = await async_client.post(
         "/api/reminders",
-        data="{invalid json syntax}",  # Malformed JSON
+        content="{invalid json syntax}",  # Malformed JSON
         headers={
             "Authorization": auth_headers["Authorization"],
             "Content-Type": "application/json"
@@ -233,100 +285,17 @@ def test_malformed_json_returns_422(client, auth_headers):
     assert response.status_code == 422
 
 
-@pytest.mark.api
-def test_text_field_null_returns_422(client, auth_headers):
-    """Test that null text field returns validation error."""
-    response = client.post(
-        "/api/reminders",
-        json={
-            "text": None,  # Null instead of string
-            "priority": "chill"
-        },
-        headers=auth_headers
-    )
-    assert response.status_code == 422
-
-
-# =============================================================================
-# Location Validation Errors
-# =============================================================================
-
-@pytest.mark.api
-def test_invalid_latitude_returns_422(client, auth_headers):
-    """Test that latitude outside -90 to 90 range returns 422."""
-    response = client.post(
-        "/api/reminders",
-        json={
-            "text": "Test reminder",
-            "location_name": "North Pole",
-            "location_lat": 95.0,  # Invalid: > 90
-            "location_lng": 0.0
-        },
-        headers=auth_headers
-    )
-    assert response.status_code == 422
-
-
-@pytest.mark.api
-def test_invalid_longitude_returns_422(client, auth_headers):
-    """Test that longitude outside -180 to 180 range returns 422."""
-    response = client.post(
-        "/api/reminders",
-        json={
-            "text": "Test reminder",
-            "location_name": "International Date Line",
-            "location_lat": 0.0,
-            "location_lng": 190.0  # Invalid: > 180
-        },
-        headers=auth_headers
-    )
-    assert response.status_code == 422
-
-
-@pytest.mark.api
-def test_radius_exceeds_max_returns_422(client, auth_headers):
-    """Test that radius > 10km (10000m) returns 422."""
-    response = client.post(
-        "/api/reminders",
-        json={
-            "text": "Test reminder",
-            "location_name": "Wide area",
-            "location_lat": 40.7128,
-            "location_lng": -74.0060,
-            "location_radius": 60000  # 60km - exceeds max
-        },
-        headers=auth_headers
-    )
-    assert response.status_code == 422
-
-
-@pytest.mark.api
-def test_radius_below_min_returns_422(client, auth_headers):
-    """Test that radius < 10m returns 422."""
-    response = client.post(
-        "/api/reminders",
-        json={
-            "text": "Test reminder",
-            "location_name": "Tiny area",
-            "location_lat": 40.7128,
-            "location_lng": -74.0060,
-            "location_radius": 5  # 5m - below min
-        },
-        headers=auth_headers
-    )
-    assert response.status_code == 422
-
-
 # =============================================================================
 # Sync Error Scenarios
 # =============================================================================
 
 @pytest.mark.api
-def test_sync_with_invalid_changes_format_returns_422(client, auth_headers):
+async def test_sync_with_invalid_changes_format_returns_422(async_client, auth_headers):
     """Test that sync with malformed changes array returns 422."""
-    response = client.post(
+    response = await _send_json(
+        async_client, "post",
         "/api/sync",
-        json={
+        payload={
             "client_id": "550e8400-e29b-41d4-a716-446655440000",
             "last_sync": None,
             "changes": "not-an-array"  # Should be list
@@ -337,11 +306,12 @@ def test_sync_with_invalid_changes_format_returns_422(client, auth_headers):
 
 
 @pytest.mark.api
-def test_sync_with_missing_client_id_returns_422(client, auth_headers):
+async def test_sync_with_missing_client_id_returns_422(async_client, auth_headers):
     """Test that sync without client_id returns 422."""
-    response = client.post(
+    response = await _send_json(
+        async_client, "post",
         "/api/sync",
-        json={
+        payload={
             # Missing client_id
             "last_sync": None,
             "changes": []
@@ -351,148 +321,19 @@ def test_sync_with_missing_client_id_returns_422(client, auth_headers):
     assert response.status_code == 422
 
 
-# =============================================================================
-# Recurrence Validation Errors
-# =============================================================================
-
-@pytest.mark.api
-def test_invalid_recurrence_frequency_returns_422(client, auth_headers):
-    """Test that invalid recurrence frequency returns 422."""
-    response = client.post(
-        "/api/reminders",
-        json={
-            "text": "Recurring reminder",
-            "recurrence_pattern": {
-                "frequency": "INVALID_FREQUENCY",  # Not in allowed list
-                "interval": 1
-            }
-        },
-        headers=auth_headers
-    )
-    assert response.status_code == 422
-
-
-@pytest.mark.api
-def test_recurrence_end_count_negative_returns_422(client, auth_headers):
-    """Test that negative end_count returns 422."""
-    response = client.post(
-        "/api/reminders",
-        json={
-            "text": "Recurring reminder",
-            "recurrence_pattern": {
-                "frequency": "daily",
-                "interval": 1,
-                "end_count": -5  # Negative count invalid
-            }
-        },
-        headers=auth_headers
-    )
-    assert response.status_code == 422
-
-
-@pytest.mark.api
-def test_recurrence_interval_zero_returns_422(client, auth_headers):
-    """Test that interval of 0 returns 422."""
-    response = client.post(
-        "/api/reminders",
-        json={
-            "text": "Recurring reminder",
-            "recurrence_pattern": {
-                "frequency": "weekly",
-                "interval": 0  # Zero interval invalid
-            }
-        },
-        headers=auth_headers
-    )
-    assert response.status_code == 422
-
-
-@pytest.mark.api
-def test_recurrence_interval_exceeds_max_returns_422(client, auth_headers):
-    """Test that interval > 365 returns 422."""
-    response = client.post(
-        "/api/reminders",
-        json={
-            "text": "Recurring reminder",
-            "recurrence_pattern": {
-                "frequency": "yearly",
-                "interval": 500  # Exceeds max of 365
-            }
-        },
-        headers=auth_headers
-    )
-    assert response.status_code == 422
-
-
 # =============================================================================
 # Additional Edge Cases
 # =============================================================================
 
 @pytest.mark.api
-def test_update_reminder_with_invalid_priority_returns_422(client, auth_headers, created_reminder):
+async def test_update_reminder_with_invalid_priority_returns_422(async_client, auth_headers, created_reminder):
     """Test that updating with numeric priority (instead of string) returns 422."""
     reminder_id = created_reminder["id"]
 
-    response = client.patch(
+    response = await _send_json(
+        async_client, "patch",
         f"/api/reminders/{reminder_id}",
-        json={"priority": 123},  # Number instead of string
-        headers=auth_headers
-    )
-    assert response.status_code == 422
-
-
-@pytest.mark.api
-def test_create_reminder_with_invalid_status_returns_422(client, auth_headers):
-    """Test that creating a reminder with invalid status returns 422."""
-    response = client.post(
-        "/api/reminders",
-        json={
-            "text": "Test reminder",
-            "status": "in_progress"  # Not in allowed list
-        },
-        headers=auth_headers
-    )
-    assert response.status_code == 422
-
-
-@pytest.mark.api
-def test_malformed_bearer_token_format_returns_401(client):
-    """Test that malformed Authorization header (missing 'Bearer ') returns 401."""
-    response = client.post(
-        "/api/reminders",
-        json={"text": "Test reminder"},
-        headers={"Authorization": "INVALID_FORMAT"}  # Missing 'Bearer ' prefix
-    )
-    assert response.status_code == 401
-
-
-@pytest.mark.api
-def test_category_exceeds_max_length_returns_422(client, auth_headers):
-    """Test that category exceeding max_length=100 returns 422."""
-    long_category = "a" * 150  # Exceeds max
-
-    response = client.post(
-        "/api/reminders",
-        json={
-            "text": "Test reminder",
-            "category": long_category
-        },
-        headers=auth_headers
-    )
-    assert response.status_code == 422
-
-
-@pytest.mark.api
-def test_location_name_exceeds_max_length_returns_422(client, auth_headers):
-    """Test that location_name exceeding max_length=500 returns 422."""
-    long_location = "a" * 600  # Exceeds max
-
-    response = client.post(
-        "/api/reminders",
-        json={
-            "text": "Test reminder",
-            "location_name": long_location
-        },
+        payload={"priority": 123},  # Number instead of string
         headers=auth_headers
     )
     assert response.status_code == 422
@@ -6,6 +6,7 @@ Tests Haversine distance calculations, geofencing queries, and edge cases
 import pytest
 import math
 from server.main import haversine_distance
+from server.geo import filter_by_radius
 
 
 # Known city coordinates for validation tests
@@ -126,6 +127,176 @@ def test_distance_handles_dateline_crossing():
         f"Tokyo to LA: Expected ~{expected_km}km, got {actual_km:.1f}km"
 
 
+@pytest.mark.location
+def test_filter_by_radius_matches_haversine():
+    """Test batch radius filter agrees with scalar Haversine and sorts nearest first"""
+    origin = (37.7749, -122.4194)  # San Francisco
+    points = [
+        ("far", 37.8044, -122.2712, 100),     # Oakland (~13km)
+        ("near", 37.7750, -122.4195, 100),    # ~14m away
+        ("mid", 37.7800, -122.4194, 100),     # ~570m away
+    ]
+
+    matches = filter_by_radius(points, origin[0], origin[1], 1000)
+
+    assert [point_id for point_id, _ in matches] == ["near", "mid"]
+    for point_id, distance in matches:
+        point = next(p for p in points if p[0] == point_id)
+        expected = haversine_distance(origin[0], origin[1], point[1], point[2])
+        assert abs(distance - expected) < 0.01
+
+
+@pytest.mark.location
+def test_filter_by_radius_uses_larger_reminder_radius():
+    """Test a reminder's own radius widens the match when larger than the search radius"""
+    origin = (0.0, 0.0)
+    points = [
+        ("wide", 0.0, 0.01, 5000),   # ~1.1km away, 5km geofence
+        ("narrow", 0.0, 0.01, 100),  # ~1.1km away, 100m geofence
+        ("default", 0.0, 0.01, None),
+    ]
+
+    matches = filter_by_radius(points, origin[0], origin[1], 500)
+
+    assert [point_id for point_id, _ in matches] == ["wide"]
+
+
+def _insert_located_reminder(reminder_id, lat, lng, radius=None):
+    """Insert a reminder with a location directly into the database"""
+    from server import database as db
+    now = "2025-01-01T00:00:00+00:00"
+    db.create_reminder({
+        "id": reminder_id,
+        "text": f"Reminder {reminder_id}",
+        "location_lat": lat,
+        "location_lng": lng,
+        "location_radius": radius,
+        "created_at": now,
+        "updated_at": now
+    })
+
+
+@pytest.mark.location
+@pytest.mark.database
+def test_location_index_matches_full_scan():
+    """Test R*Tree candidates give the same matches as scanning every reminder"""
+    from server import database as db
+
+    _insert_located_reminder("sf", 37.7749, -122.4194, 100)
+    _insert_located_reminder("sf-near", 37.7800, -122.4194, 100)
+    _insert_located_reminder("oakland-wide", 37.8044, -122.2712, 15000)
+    _insert_located_reminder("oakland", 37.8044, -122.2712, None)
+    _insert_located_reminder("dateline-east", 0.0, 179.999, 1000)
+    _insert_located_reminder("dateline-west", 0.0, -179.999, 100)
+    _insert_located_reminder("arctic", 89.99, 45.0, 500)
+
+    searches = [
+        (37.7749, -122.4194, 1000),
+        (37.7749, -122.4194, 50),
+        (0.0, -179.9995, 10),
+        (0.0, 179.9995, 300),
+        (89.99, -135.0, 10),
+        (51.5074, -0.1278, 50000),
+    ]
+    for lat, lng, radius in searches:
+        scanned = filter_by_radius(db.get_reminder_locations(), lat, lng, radius)
+
+        # Indexed SQL-side Haversine agrees with the Python scan on ids, order and distance
+        indexed = db.find_reminders_within(lat, lng, radius)
+        assert [point_id for point_id, _ in indexed] == [point_id for point_id, _ in scanned], (lat, lng, radius)
+        for (_, sql_distance), (_, py_distance) in zip(indexed, scanned):
+            assert sql_distance == pytest.approx(py_distance, abs=1e-3)
+
+    # The 15km geofence (~13km away) reaches San Francisco even for a 1km search
+    sf_matches = db.find_reminders_within(37.7749, -122.4194, 1000)
+    assert {point_id for point_id, _ in sf_matches} == {"sf", "sf-near", "oakland-wide"}
+
+
+@pytest.mark.location
+@pytest.mark.database
+def test_location_index_follows_updates_and_deletes():
+    """Test the R*Tree index is kept in sync by reminder updates and deletes"""
+    from server import database as db
+
+    _insert_located_reminder("moving", 37.7749, -122.4194)
+    _insert_located_reminder("deleted", 37.7749, -122.4194)
+
+    db.update_reminder("moving", {"location_lat": 51.5074, "location_lng": -0.1278})
+    db.delete_reminder("deleted")
+
+    assert db.find_reminders_within(37.7749, -122.4194, 1000) == []
+    london = db.find_reminders_within(51.5074, -0.1278, 1000)
+    assert [point_id for point_id, _ in london] == ["moving"]
+
+
+@pytest.mark.location
+@pytest.mark.database
+def test_find_reminders_within_scans_without_index(monkeypatch):
+    """Test proximity queries fall back to a Python scan when init_db found no index support"""
+    from server import database as db
+
+    _insert_located_reminder("sf", 37.7749, -122.4194)
+    _insert_located_reminder("london", 51.5074, -0.1278)
+    monkeypatch.setattr(db, "_location_index_enabled", False)
+
+    matches = db.find_reminders_within(37.7749, -122.4194, 1000)
+
+    assert [point_id for point_id, _ in matches] == ["sf"]
+
+
+@pytest.mark.location
+@pytest.mark.database
+def test_location_index_covers_bulk_and_recurring_writes():
+    """Test bulk-created reminders and recurrence instances are added to the index"""
+    import uuid
+    from server import database as db
+
+    now = "2025-01-01T00:00:00+00:00"
+    db.bulk_create_reminders([
+        {"id": "bulk-sf", "text": "Bulk", "location_lat": 37.7749, "location_lng": -122.4194,
+         "created_at": now, "updated_at": now},
+        {"id": "bulk-plain", "text": "No location", "created_at": now, "updated_at": now},
+    ])
+
+    pattern_id = str(uuid.uuid4())
+    db.create_recurrence_pattern(pattern_id=pattern_id, frequency='daily', end_count=2)
+    instance_ids = db.generate_recurrence_instances(
+        base_reminder={"text": "Recurring", "location_lat": 37.7749, "location_lng": -122.4194,
+                       "recurrence_id": pattern_id},
+        pattern=db.get_recurrence_pattern(pattern_id)
+    )
+
+    matches = {point_id for point_id, _ in db.find_reminders_within(37.7749, -122.4194, 1000)}
+    assert matches == {"bulk-sf", *instance_ids}
+
+
+@pytest.mark.location
+@pytest.mark.database
+def test_location_index_schema_needs_no_math_functions():
+    """Test no schema object stored in the database calls SQLite math functions"""
+    from server import database as db
+
+    math_objects = db.db_query(
+        "SELECT name FROM sqlite_master WHERE sql LIKE '%COS(%' OR sql LIKE '%RADIANS(%'"
+    )
+
+    assert math_objects == []
+
+
+@pytest.mark.location
+@pytest.mark.database
+def test_location_index_survives_rowid_renumbering():
+    """Test index entries still point at the right reminders when rowids change (VACUUM, table rebuilds)"""
+    from server import database as db
+
+    _insert_located_reminder("london", 51.5074, -0.1278)
+    _insert_located_reminder("sf", 37.7749, -122.4194)
+    db.db_execute("UPDATE reminders SET rowid = rowid + 1000")
+
+    assert [point_id for point_id, _ in db.find_reminders_within(37.7749, -122.4194, 1000)] == ["sf"]
+    assert [point_id for point_id, _ in db.find_reminders_within(51.5074, -0.1278, 1000)] == ["london"]
+
+
 # =============================================================================
 # Geofencing Query Tests (API Endpoint)
 # =============================================================================
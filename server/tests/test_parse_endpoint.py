@@ -1,46 +1,133 @@
-import pytest
 import json
-from pathlib import Path
+import pytest
+import httpx
+from functools import partial
 from fastapi.testclient import TestClient
 from unittest.mock import AsyncMock, patch
-from server.main import app
 from server.models import ReminderParseResponse
+from server.voice.parser import LocalLLMParser
+
+
+def _lm_studio_completion(parsed):
+    """LM Studio (OpenAI-compatible) chat completion whose content is the parsed JSON."""
+    return {
+        'choices': [{
+            'index': 0,
+            'message': {'role': 'assistant', 'content': json.dumps(parsed)},
+            'finish_reason': 'stop'
+        }]
+    }
+
+class _LMStudioStub:
+    """
+    Mocked LM Studio server for httpx.MockTransport.
+
+    Answers /v1/chat/completions with the configured reply, or raises the
+    configured transport error, so the real LocalLLMParser request and error
+    handling code runs against it.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.status = 503
+        self.parsed = None
+        self.error = None
 
-# Load test token from secrets (using relative path from project root)
-project_root = Path(__file__).parent.parent.parent
-secrets_path = project_root / 'secrets.json'
-with open(secrets_path, 'r') as f:
-    secrets = json.load(f)
-    TEST_API_TOKEN = secrets['api_token']
+    def respond(self, parsed=None, status=200):
+        self.status = status
+        self.parsed = parsed
+
+    def handler(self, request):
+        if self.error is not None:
+            raise self.error
+        if request.url.path != "/v1/chat/completions":
+            return httpx.Response(404)
+        body = _lm_studio_completion(self.parsed) if self.parsed is not None else None
+        return httpx.Response(self.status, json=body)
+
+@pytest.fixture(scope="module")
+def _parser_patches():
+    """
+    Install the parser mocks once for the whole module.
+
+    LocalLLMParser is built with an httpx.MockTransport backed by an
+    _LMStudioStub, so only LM Studio's HTTP responses are simulated. The
+    CloudflareAIParser class is replaced with a MagicMock (so no credentials
+    are needed to construct it). Tests get them through lm_studio and
+    mock_cloud_parse, which reset them first.
+    """
+    stub = _LMStudioStub()
+    local_patcher = patch(
+        'server.voice.parser.LocalLLMParser',
+        partial(LocalLLMParser, transport=httpx.MockTransport(stub.handler))
+    )
+    cloud_patcher = patch('server.voice.cloudflare_parser.CloudflareAIParser')
+    local_patcher.start()
+    mock_cloud_class = cloud_patcher.start()
+    yield stub, mock_cloud_class
+    cloud_patcher.stop()
+    local_patcher.stop()
 
 @pytest.fixture
-def client():
-    """Create test client for the FastAPI application."""
-    return TestClient(app)
+def lm_studio(_parser_patches):
+    """Mocked LM Studio server, reset for this test."""
+    stub, _ = _parser_patches
+    stub.reset()
+    return stub
+
+@pytest.fixture
+def mock_cloud_parse(_parser_patches):
+    """parse_reminder_text of a fresh mock CloudflareAIParser instance."""
+    _, mock_cloud_class = _parser_patches
+    mock_cloud_class.reset_mock(return_value=True, side_effect=True)
+    mock_cloud_class.return_value = AsyncMock()
+    return mock_cloud_class.return_value.parse_reminder_text
+
+@pytest.fixture
+def parser_replies(request, lm_studio, mock_cloud_parse):
+    """
+    Set both parsers' "Buy milk" replies from an indirect parametrize dict.
+
+    request.param holds local_conf and cloud_conf, the confidence each parser
+    reports. The module-wide mocks are reused; only their replies change.
+    """
+    lm_studio.respond({
+        'text': 'Buy milk',
+        'confidence': request.param['local_conf'],
+        'due_date': '2025-12-01',
+        'priority': 'important'
+    })
+    mock_cloud_parse.return_value = {
+        'text': 'Buy milk',
+        'confidence': request.param['cloud_conf'],
+        'due_date': '2025-12-01',
+        'priority': 'chill',
+        'parse_mode': 'cloud'
+    }
+    return lm_studio, mock_cloud_parse
 
 @pytest.mark.asyncio
-@patch('server.voice.parser.LocalLLMParser.parse_reminder_text', new_callable=AsyncMock)
-@patch('server.voice.cloudflare_parser.CloudflareAIParser.parse_reminder_text', new_callable=AsyncMock)
 async def test_parse_endpoint_authentication(
-    mock_cloud_parse, 
-    mock_local_parse, 
-    client: TestClient
+    lm_studio,
+    client: TestClient,
+    auth_headers: dict
 ):
     """Test authentication scenarios for the parse endpoint."""
-    # Setup mock parser results
-    mock_local_parse.return_value = {
+    # Setup LM Studio reply
+    lm_studio.respond({
         'text': 'Test reminder',
         'confidence': 0.9,
         'due_date': '2025-12-01',
-        'priority': 'important',
-        'parse_mode': 'local'
-    }
+        'priority': 'important'
+    })
 
     # Test valid token
     response = client.post(
         "/api/voice/parse", 
         json={"text": "Buy milk", "mode": "local"},
-        headers={"Authorization": f"Bearer {TEST_API_TOKEN}"}
+        headers=auth_headers
     )
     assert response.status_code == 200
     assert "text" in response.json()
@@ -61,77 +148,42 @@ async def test_parse_endpoint_authentication(
     assert response.status_code == 401
 
 @pytest.mark.asyncio
-@patch('server.voice.cloudflare_parser.CloudflareAIParser')
-@patch('server.voice.parser.LocalLLMParser.parse_reminder_text', new_callable=AsyncMock)
+@pytest.mark.parametrize("parser_replies,mode,expected_confidence,expected_mode", [
+    pytest.param({'local_conf': 0.9, 'cloud_conf': 0.8}, "auto", 0.9, "local", id="auto_local_succeeds"),
+    pytest.param({'local_conf': 0.1, 'cloud_conf': 0.8}, "auto", 0.8, "cloud", id="auto_low_confidence_fallback"),
+    pytest.param({'local_conf': 0.9, 'cloud_conf': 0.8}, "local", 0.9, "local", id="local"),
+    pytest.param({'local_conf': 0.9, 'cloud_conf': 0.8}, "cloud", 0.8, "cloud", id="cloud"),
+], indirect=["parser_replies"])
 async def test_parse_endpoint_mode_selection(
-    mock_local_parse,
-    mock_cf_parser_class,
-    client: TestClient
+    parser_replies,
+    mode: str,
+    expected_confidence: float,
+    expected_mode: str,
+    client: TestClient,
+    auth_headers: dict
 ):
     """Test different parsing modes."""
-    # Setup CloudflareAIParser mock instance
-    mock_cf_parser = AsyncMock()
-    mock_cf_parser.parse_reminder_text.return_value = {
-        'text': 'Buy milk',
-        'confidence': 0.8,
-        'due_date': '2025-12-01',
-        'priority': 'chill',
-        'parse_mode': 'cloud'
-    }
-    mock_cf_parser_class.return_value = mock_cf_parser
-
-    # Successful local parse
-    mock_local_parse.return_value = {
-        'text': 'Buy milk',
-        'confidence': 0.9,
-        'due_date': '2025-12-01',
-        'priority': 'important',
-        'parse_mode': 'local'
-    }
-
-    # Auto Mode: Local succeeds
-    response = client.post(
-        "/api/voice/parse", 
-        json={"text": "Buy milk", "mode": "auto"},
-        headers={"Authorization": f"Bearer {TEST_API_TOKEN}"}
-    )
-    assert response.status_code == 200
-    result = response.json()
-    assert result['confidence'] == 0.9
-    assert result['parse_mode'] == 'local'
-
-    # Local Mode
-    response = client.post(
-        "/api/voice/parse", 
-        json={"text": "Buy milk", "mode": "local"},
-        headers={"Authorization": f"Bearer {TEST_API_TOKEN}"}
-    )
-    assert response.status_code == 200
-    result = response.json()
-    assert result['confidence'] == 0.9
-    assert result['parse_mode'] == 'local'
-
-    # Cloud Mode
     response = client.post(
-        "/api/voice/parse", 
-        json={"text": "Buy milk", "mode": "cloud"},
-        headers={"Authorization": f"Bearer {TEST_API_TOKEN}"}
+        "/api/voice/parse",
+        json={"text": "Buy milk", "mode": mode},
+        headers=auth_headers
     )
     assert response.status_code == 200
     result = response.json()
-    assert result['confidence'] == 0.8
-    assert result['parse_mode'] == 'cloud'
+    assert result['confidence'] == expected_confidence
+    assert result['parse_mode'] == expected_mode
 
 @pytest.mark.asyncio
 async def test_parse_endpoint_request_validation(
-    client: TestClient
+    client: TestClient,
+    auth_headers: dict
 ):
     """Test request validation for parse endpoint."""
     # Empty text (should raise 422)
     response = client.post(
         "/api/voice/parse", 
         json={"text": "", "mode": "local"},
-        headers={"Authorization": f"Bearer {TEST_API_TOKEN}"}
+        headers=auth_headers
     )
     assert response.status_code == 422
 
@@ -140,7 +192,7 @@ async def test_parse_endpoint_request_validation(
     response = client.post(
         "/api/voice/parse", 
         json={"text": long_text, "mode": "local"},
-        headers={"Authorization": f"Bearer {TEST_API_TOKEN}"}
+        headers=auth_headers
     )
     assert response.status_code == 422
 
@@ -148,43 +200,35 @@ async def test_parse_endpoint_request_validation(
     response = client.post(
         "/api/voice/parse", 
         json={"text": "Buy milk", "mode": "invalid"},
-        headers={"Authorization": f"Bearer {TEST_API_TOKEN}"}
+        headers=auth_headers
     )
     assert response.status_code == 422
 
 @pytest.mark.asyncio
-@patch('server.voice.cloudflare_parser.CloudflareAIParser')
-@patch('server.voice.parser.LocalLLMParser.parse_reminder_text', new_callable=AsyncMock)
 async def test_parse_endpoint_fallback_logic(
-    mock_local_parse,
-    mock_cf_parser_class,
-    client: TestClient
+    lm_studio,
+    mock_cloud_parse,
+    client: TestClient,
+    auth_headers: dict
 ):
     """Test fallback parsing logic."""
-    # Setup CloudflareAIParser mock instance
-    mock_cf_parser = AsyncMock()
-    mock_cf_parser.parse_reminder_text.return_value = {
+    # Setup CloudflareAIParser mock result
+    mock_cloud_parse.return_value = {
         'text': 'Buy milk',
         'confidence': 0.7,
         'due_date': '2025-12-01',
         'priority': 'important',
         'parse_mode': 'cloud'
     }
-    mock_cf_parser_class.return_value = mock_cf_parser
 
-    # Local with low confidence
-    mock_local_parse.return_value = {
-        'text': 'Buy milk',
-        'confidence': 0.1,
-        'due_date': None,
-        'priority': None
-    }
+    # LM Studio server error: local parse degrades to low confidence
+    lm_studio.respond(status=500)
 
     # Auto mode should fallback to cloud
     response = client.post(
         "/api/voice/parse",
         json={"text": "Buy milk", "mode": "auto"},
-        headers={"Authorization": f"Bearer {TEST_API_TOKEN}"}
+        headers=auth_headers
     )
     assert response.status_code == 200
     result = response.json()
@@ -192,55 +236,54 @@ async def test_parse_endpoint_fallback_logic(
     assert result['parse_mode'] == 'cloud'
 
     # Test both parsers failing
-    mock_local_parse.side_effect = Exception("Local parse failed")
-    mock_cf_parser.parse_reminder_text.side_effect = Exception("Cloud parse failed")
+    lm_studio.error = httpx.ConnectError("Connection refused")
+    mock_cloud_parse.side_effect = Exception("Cloud parse failed")
 
     # Auto mode with both parsers failing
     response = client.post(
         "/api/voice/parse", 
         json={"text": "Buy milk", "mode": "auto"},
-        headers={"Authorization": f"Bearer {TEST_API_TOKEN}"}
+        headers=auth_headers
     )
     assert response.status_code == 200
     result = response.json()
     assert result['confidence'] == 0.0
     assert result['text'] == 'Buy milk'
 
+def _local_parse_result(text):
+    """Consistent LM Studio output for the given text."""
+    return {
+        'text': text,
+        'confidence': 0.8,
+        'due_date': '2025-12-01',
+        'priority': 'chill'
+    }
+
 @pytest.mark.asyncio
-@patch('server.voice.parser.LocalLLMParser.parse_reminder_text', new_callable=AsyncMock)
-@patch('server.voice.cloudflare_parser.CloudflareAIParser.parse_reminder_text', new_callable=AsyncMock)
+@pytest.mark.parametrize("text", [
+    pytest.param("Buy milk", id="short"),
+    pytest.param("Doctor appointment tomorrow", id="relative_date"),
+    pytest.param("Meeting at 3pm", id="time"),
+    pytest.param("Call mom urgent", id="priority"),
+    pytest.param("Dentist next Tuesday at 2pm, important", id="date_time_priority"),
+    pytest.param("Sometime soon maybe", id="vague"),
+])
 async def test_parse_endpoint_input_variety(
-    mock_cloud_parse, 
-    mock_local_parse, 
-    client: TestClient
+    lm_studio,
+    text: str,
+    client: TestClient,
+    auth_headers: dict
 ):
     """Test parsing various input styles."""
-    test_inputs = [
-        "Buy milk",
-        "Doctor appointment tomorrow",
-        "Meeting at 3pm",
-        "Call mom urgent",
-        "Dentist next Tuesday at 2pm, important",
-        "Sometime soon maybe"
-    ]
-
-    for text in test_inputs:
-        # Setup consistent mock result
-        mock_local_parse.return_value = {
-            'text': text, 
-            'confidence': 0.8, 
-            'due_date': '2025-12-01', 
-            'priority': 'chill',
-            'parse_mode': 'local'
-        }
-
-        response = client.post(
-            "/api/voice/parse", 
-            json={"text": text, "mode": "local"},
-            headers={"Authorization": f"Bearer {TEST_API_TOKEN}"}
-        )
-        assert response.status_code == 200
-        result = response.json()
-        assert isinstance(result, dict)
-        assert ReminderParseResponse(**result)  # Validate model
-        assert result['text'] == text
+    lm_studio.respond(_local_parse_result(text))
+
+    response = client.post(
+        "/api/voice/parse",
+        json={"text": text, "mode": "local"},
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    result = response.json()
+    assert isinstance(result, dict)
+    assert ReminderParseResponse.model_validate(result) is not None  # Validate model
+    assert result['text'] == text
@@ -19,7 +19,7 @@ from server import database as db
 
 
 # =============================================================================
-# Pattern Creation Tests (5 tests)
+# Pattern Creation Tests (7 tests)
 # =============================================================================
 
 def test_create_daily_pattern(test_db):
@@ -121,6 +121,48 @@ def test_create_pattern_returns_uuid(test_db):
     uuid.UUID(result_id)
 
 
+
+def test_pattern_cache_tracks_writes(test_db):
+    """Test cached pattern reads see creates/updates/deletes and stay isolated."""
+    pattern_id = str(uuid.uuid4())
+    assert db.get_recurrence_pattern(pattern_id, db_path=test_db) is None
+
+    db.create_recurrence_pattern(
+        pattern_id=pattern_id,
+        frequency='daily',
+        interval=1,
+        db_path=test_db
+    )
+    pattern = db.get_recurrence_pattern(pattern_id, db_path=test_db)
+    assert pattern['interval'] == 1
+
+    # Callers get their own dict
+    pattern['interval'] = 99
+    assert db.get_recurrence_pattern(pattern_id, db_path=test_db)['interval'] == 1
+
+    db.update_recurrence_pattern(pattern_id, interval=3, db_path=test_db)
+    assert db.get_recurrence_pattern(pattern_id, db_path=test_db)['interval'] == 3
+
+    db.delete_recurrence_pattern(pattern_id, db_path=test_db)
+    assert db.get_recurrence_pattern(pattern_id, db_path=test_db) is None
+
+
+def test_pattern_cache_cleared_by_forced_init(test_db):
+    """Test init_db(force=True) drops cached patterns along with the table."""
+    pattern_id = str(uuid.uuid4())
+    db.create_recurrence_pattern(
+        pattern_id=pattern_id,
+        frequency='daily',
+        interval=1,
+        db_path=test_db
+    )
+    assert db.get_recurrence_pattern(pattern_id, db_path=test_db) is not None
+
+    db.init_db(db_path=test_db, force=True)
+
+    assert db.get_recurrence_pattern(pattern_id, db_path=test_db) is None
+
+
 # =============================================================================
 # Instance Generation Tests (5 tests)
 # =============================================================================
@@ -169,8 +211,7 @@ def test_generate_weekly_instances_correct_count(test_db):
 
     # Start from a Monday
     start_date = date.today()
-    while start_date.weekday() != 0:  # 0 = Monday
-        start_date += timedelta(days=1)
+    start_date += timedelta(days=-start_date.weekday() % 7)  # 0 = Monday
 
     base_reminder = {
         'text': 'Weekly Monday reminder',
@@ -221,10 +262,10 @@ def test_generate_monthly_instances_respects_day(test_db):
     )
 
     # Verify all generated instances are on the 15th
-    for reminder_id in generated_ids:
-        results = db.db_query("SELECT due_date FROM reminders WHERE id = ?", (reminder_id,), db_path=test_db)
-        due_date = date.fromisoformat(results[0]['due_date'])
-        assert due_date.day == 15
+    instances = db.get_reminders_by_ids(generated_ids, db_path=test_db)
+    assert len(instances) == len(generated_ids)
+    for instance in instances.values():
+        assert instance['due_date'][-3:] == '-15'  # YYYY-MM-DD
 
 
 def test_generate_yearly_instances_one_per_year(test_db):
@@ -287,11 +328,12 @@ def test_instance_generation_respects_horizon(test_db):
     )
 
     # Verify no instances beyond 90 days
-    horizon_end = date.today() + timedelta(days=90)
-    for reminder_id in generated_ids:
-        results = db.db_query("SELECT due_date FROM reminders WHERE id = ?", (reminder_id,), db_path=test_db)
-        due_date = date.fromisoformat(results[0]['due_date'])
-        assert due_date <= horizon_end
+    # ISO dates order the same as strings, so compare without parsing
+    horizon_end = (date.today() + timedelta(days=90)).isoformat()
+    instances = db.get_reminders_by_ids(generated_ids, db_path=test_db)
+    assert len(instances) == len(generated_ids)
+    for instance in instances.values():
+        assert instance['due_date'] <= horizon_end
 
 
 # =============================================================================
@@ -456,11 +498,12 @@ def test_end_date_excludes_instances_after(test_db):
         db_path=test_db
     )
 
-    # Verify no instances after end_date
-    for reminder_id in generated_ids:
-        results = db.db_query("SELECT due_date FROM reminders WHERE id = ?", (reminder_id,), db_path=test_db)
-        due_date = date.fromisoformat(results[0]['due_date'])
-        assert due_date <= end_date
+    # Verify no instances after end_date (ISO strings compare chronologically)
+    end_iso = end_date.isoformat()
+    instances = db.get_reminders_by_ids(generated_ids, db_path=test_db)
+    assert len(instances) == len(generated_ids)
+    for instance in instances.values():
+        assert instance['due_date'] <= end_iso
 
 
 # =============================================================================
@@ -481,8 +524,7 @@ def test_biweekly_pattern_every_2_weeks(test_db):
 
     # Start from a Monday
     start_date = date.today()
-    while start_date.weekday() != 0:
-        start_date += timedelta(days=1)
+    start_date += timedelta(days=-start_date.weekday() % 7)  # 0 = Monday
 
     base_reminder = {
         'text': 'Bi-weekly reminder',
@@ -500,11 +542,50 @@ def test_biweekly_pattern_every_2_weeks(test_db):
         db_path=test_db
     )
 
-    # Note: Current implementation advances day-by-day for weekly, so it generates more instances
-    # 90 days / 14 days ≈ 6-7 instances would be ideal, but current logic may generate ~13 Mondays
-    # This is acceptable behavior for now - test verifies it doesn't crash
-    assert len(generated_ids) >= 6
-    assert len(generated_ids) <= 14  # More lenient to account for implementation
+    # 90 days / 14 days: Mondays in weeks 0, 2, 4, ... 12
+    assert len(generated_ids) == 7
+
+    instances = db.get_reminders_by_ids(generated_ids, db_path=test_db)
+    due_dates = sorted(date.fromisoformat(r['due_date']) for r in instances.values())
+    assert due_dates[0] == start_date
+    assert all((b - a).days == 14 for a, b in zip(due_dates, due_dates[1:]))
+
+
+def test_biweekly_multiple_days_skip_alternate_weeks(test_db):
+    """Test every-2-weeks patterns on several weekdays skip the weeks between."""
+    pattern_id = str(uuid.uuid4())
+
+    db.create_recurrence_pattern(
+        pattern_id=pattern_id,
+        frequency='weekly',
+        interval=2,
+        days_of_week='3,0',  # Thursdays and Mondays, in any order
+        end_count=5,
+        db_path=test_db
+    )
+
+    base_reminder = {
+        'text': 'Alternate weeks',
+        'priority': 'chill',
+        'due_date': date(2025, 1, 8).isoformat(),  # A Wednesday
+        'recurrence_id': pattern_id,
+        'status': 'pending'
+    }
+
+    pattern = db.get_recurrence_pattern(pattern_id, db_path=test_db)
+    generated_ids = db.generate_recurrence_instances(
+        base_reminder=base_reminder,
+        pattern=pattern,
+        horizon_days=3650,
+        db_path=test_db
+    )
+
+    instances = db.get_reminders_by_ids(generated_ids, db_path=test_db)
+    assert sorted(r['due_date'] for r in instances.values()) == [
+        '2025-01-09',  # Thursday of the start week (Monday already passed)
+        '2025-01-20', '2025-01-23',
+        '2025-02-03', '2025-02-06',
+    ]
 
 
 def test_first_monday_of_each_month(test_db):
@@ -608,6 +689,37 @@ def test_every_weekday_monday_to_friday(test_db):
     assert len(generated_ids) <= 70
 
 
+def test_weekly_out_of_range_days_generate_nothing(test_db):
+    """Test weekly day numbers outside 0-6 match no dates (and terminate)."""
+    pattern_id = str(uuid.uuid4())
+
+    db.create_recurrence_pattern(
+        pattern_id=pattern_id,
+        frequency='weekly',
+        interval=1,
+        days_of_week='7',
+        db_path=test_db
+    )
+
+    base_reminder = {
+        'text': 'Never',
+        'priority': 'chill',
+        'due_date': date.today().isoformat(),
+        'recurrence_id': pattern_id,
+        'status': 'pending'
+    }
+
+    pattern = db.get_recurrence_pattern(pattern_id, db_path=test_db)
+    generated_ids = db.generate_recurrence_instances(
+        base_reminder=base_reminder,
+        pattern=pattern,
+        horizon_days=90,
+        db_path=test_db
+    )
+
+    assert generated_ids == []
+
+
 # =============================================================================
 # Critical Edge Cases Tests (8 tests)
 # =============================================================================
@@ -642,9 +754,10 @@ def test_feb_30_becomes_feb_28_non_leap_year(test_db):
     )
 
     # Find the February instance
-    for reminder_id in generated_ids:
-        results = db.db_query("SELECT due_date FROM reminders WHERE id = ?", (reminder_id,), db_path=test_db)
-        due_date = date.fromisoformat(results[0]['due_date'])
+    instances = db.get_reminders_by_ids(generated_ids, db_path=test_db)
+    assert len(instances) == len(generated_ids)
+    for instance in instances.values():
+        due_date = date.fromisoformat(instance['due_date'])
         if due_date.month == 2 and due_date.year == 2025:
             # Should be Feb 28 (last day of February in non-leap year)
             assert due_date.day == 28
@@ -681,9 +794,10 @@ def test_feb_30_becomes_feb_29_leap_year(test_db):
     )
 
     # Find the February instance
-    for reminder_id in generated_ids:
-        results = db.db_query("SELECT due_date FROM reminders WHERE id = ?", (reminder_id,), db_path=test_db)
-        due_date = date.fromisoformat(results[0]['due_date'])
+    instances = db.get_reminders_by_ids(generated_ids, db_path=test_db)
+    assert len(instances) == len(generated_ids)
+    for instance in instances.values():
+        due_date = date.fromisoformat(instance['due_date'])
         if due_date.month == 2 and due_date.year == 2024:
             # Should be Feb 29 (last day of February in leap year)
             assert due_date.day == 29
@@ -720,9 +834,10 @@ def test_monthly_day_31_skips_april(test_db):
     )
 
     # Check April instance (only has 30 days)
-    for reminder_id in generated_ids:
-        results = db.db_query("SELECT due_date FROM reminders WHERE id = ?", (reminder_id,), db_path=test_db)
-        due_date = date.fromisoformat(results[0]['due_date'])
+    instances = db.get_reminders_by_ids(generated_ids, db_path=test_db)
+    assert len(instances) == len(generated_ids)
+    for instance in instances.values():
+        due_date = date.fromisoformat(instance['due_date'])
         if due_date.month == 4 and due_date.year == 2025:
             # Should be April 30 (last day of April)
             assert due_date.day == 30
@@ -799,15 +914,48 @@ def test_leap_year_feb_29_pattern(test_db):
     assert len(generated_ids) >= 1
 
     # Check if February instance adjusted correctly
-    for reminder_id in generated_ids:
-        results = db.db_query("SELECT due_date FROM reminders WHERE id = ?", (reminder_id,), db_path=test_db)
-        due_date = date.fromisoformat(results[0]['due_date'])
+    instances = db.get_reminders_by_ids(generated_ids, db_path=test_db)
+    assert len(instances) == len(generated_ids)
+    for instance in instances.values():
+        due_date = date.fromisoformat(instance['due_date'])
         if due_date.month == 2 and due_date.year == 2025:
             # Should be Feb 28 (last day of February in non-leap year)
             assert due_date.day == 28
             break
 
 
+def test_yearly_feb_29_falls_back_to_feb_28(test_db):
+    """Test yearly pattern from Feb 29 lands on Feb 28 in common years."""
+    pattern_id = str(uuid.uuid4())
+
+    db.create_recurrence_pattern(
+        pattern_id=pattern_id,
+        frequency='yearly',
+        interval=1,
+        end_count=2,
+        db_path=test_db
+    )
+
+    base_reminder = {
+        'text': 'Leap day anniversary',
+        'priority': 'chill',
+        'due_date': date(2024, 2, 29).isoformat(),
+        'recurrence_id': pattern_id,
+        'status': 'pending'
+    }
+
+    pattern = db.get_recurrence_pattern(pattern_id, db_path=test_db)
+    generated_ids = db.generate_recurrence_instances(
+        base_reminder=base_reminder,
+        pattern=pattern,
+        horizon_days=3650,
+        db_path=test_db
+    )
+
+    instances = db.get_reminders_by_ids(generated_ids, db_path=test_db)
+    assert sorted(r['due_date'] for r in instances.values()) == ['2024-02-29', '2025-02-28']
+
+
 def test_delete_pattern_unlinks_all_instances(test_db):
     """Test deleting a pattern unlinks it from all reminders."""
     pattern_id = str(uuid.uuid4())
@@ -847,13 +995,10 @@ def test_delete_pattern_unlinks_all_instances(test_db):
     assert pattern is None
 
     # Verify reminders still exist but have NULL recurrence_id
-    for reminder_id in generated_ids:
-        results = db.db_query(
-            "SELECT recurrence_id FROM reminders WHERE id = ?",
-            (reminder_id,),
-            db_path=test_db
-        )
-        assert results[0]['recurrence_id'] is None
+    instances = db.get_reminders_by_ids(generated_ids, db_path=test_db)
+    assert len(instances) == len(generated_ids)
+    for instance in instances.values():
+        assert instance['recurrence_id'] is None
 
 
 def test_pattern_with_invalid_day_of_month(test_db):
@@ -929,14 +1074,11 @@ def test_timezone_handling_in_recurrence(test_db):
     )
 
     # Verify all instances have created_at timestamps
-    for reminder_id in generated_ids:
-        results = db.db_query(
-            "SELECT created_at, updated_at FROM reminders WHERE id = ?",
-            (reminder_id,),
-            db_path=test_db
-        )
-        assert results[0]['created_at'] is not None
-        assert results[0]['updated_at'] is not None
+    instances = db.get_reminders_by_ids(generated_ids, db_path=test_db)
+    assert len(instances) == len(generated_ids)
+    for instance in instances.values():
+        assert instance['created_at'] is not None
+        assert instance['updated_at'] is not None
 
 
 # =============================================================================
@@ -978,11 +1120,11 @@ def test_create_reminder_with_recurrence_generates_instances(test_db):
     assert len(generated_ids) == 7
 
     # Verify all instances exist
-    for reminder_id in generated_ids:
-        results = db.db_query("SELECT * FROM reminders WHERE id = ?", (reminder_id,), db_path=test_db)
-        assert len(results) == 1
-        assert results[0]['text'] == 'Integration test reminder'
-        assert results[0]['recurrence_id'] == pattern_id
+    instances = db.get_reminders_by_ids(generated_ids, db_path=test_db)
+    assert len(instances) == len(generated_ids)
+    for instance in instances.values():
+        assert instance['text'] == 'Integration test reminder'
+        assert instance['recurrence_id'] == pattern_id
 
 
 def test_update_pattern_regenerates_instances(test_db):
@@ -1044,12 +1186,9 @@ def test_pattern_with_interval_2_skips_correctly(test_db):
     assert len(generated_ids) == 10
 
     # Verify spacing is 2 days apart
-    dates = []
-    for reminder_id in generated_ids:
-        results = db.db_query("SELECT due_date FROM reminders WHERE id = ?", (reminder_id,), db_path=test_db)
-        dates.append(date.fromisoformat(results[0]['due_date']))
-
-    dates.sort()
+    instances = db.get_reminders_by_ids(generated_ids, db_path=test_db)
+    dates = sorted(date.fromisoformat(instance['due_date']) for instance in instances.values())
+    assert len(dates) == len(generated_ids)
     for i in range(1, len(dates)):
         diff = (dates[i] - dates[i-1]).days
         assert diff == 2
@@ -1096,6 +1235,7 @@ def test_complete_instance_does_not_affect_pattern(test_db):
     assert pattern is not None
 
     # Verify other instances are still pending
-    for reminder_id in generated_ids[1:]:
-        results = db.db_query("SELECT status FROM reminders WHERE id = ?", (reminder_id,), db_path=test_db)
-        assert results[0]['status'] == 'pending'
+    instances = db.get_reminders_by_ids(generated_ids[1:], db_path=test_db)
+    assert len(instances) == len(generated_ids) - 1
+    for instance in instances.values():
+        assert instance['status'] == 'pending'
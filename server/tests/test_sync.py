@@ -625,6 +625,15 @@ def test_sync_invalid_changes_missing_required_fields(client, auth_headers):
         assert response.status_code in [400, 422, 500]
 
 
+@pytest.mark.sync
+def test_sync_malformed_json_body(client, auth_headers):
+    """Test malformed JSON is rejected with a 422 json_invalid error"""
+    response = client.post("/api/sync", headers=auth_headers, content=b'{"client_id": ')
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["type"] == "json_invalid"
+
+
 @pytest.mark.sync
 def test_sync_without_authentication(client):
     """Test sync endpoint requires authentication"""
@@ -775,3 +784,210 @@ def test_sync_skips_changes_already_in_server_response(client, auth_headers):
     # Server should NOT echo back the reminder client just created
     change_ids = [c["id"] for c in server_changes]
     assert new_id not in change_ids
+
+
+@pytest.mark.sync
+def test_stream_sync_changes_ndjson(client, auth_headers):
+    """Test streaming server changes as NDJSON marks them as synced"""
+    import json
+    import uuid
+    from server import database as db
+
+    # Insert directly so this test does not depend on the create endpoint's rate limit
+    last_sync = get_iso_timestamp(-5)
+    now = get_iso_timestamp()
+    reminder = {
+        "id": str(uuid.uuid4()),
+        "text": "Streamed change",
+        "created_at": now,
+        "updated_at": now
+    }
+    db.create_reminder(reminder)
+
+    response = client.get(
+        "/api/sync/changes",
+        headers=auth_headers,
+        params={"last_sync": last_sync}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert response.headers["x-sync-timestamp"]
+
+    changes = [json.loads(line) for line in response.text.splitlines() if line]
+    streamed = [c for c in changes if c["id"] == reminder["id"]]
+    assert len(streamed) == 1
+    assert streamed[0]["action"] == "update"
+    assert streamed[0]["data"]["text"] == "Streamed change"
+
+    synced = db.get_reminder_by_id(reminder["id"])
+    assert synced["synced_at"] == response.headers["x-sync-timestamp"]
+
+
+@pytest.mark.sync
+def test_stream_sync_changes_without_authentication(client):
+    """Test streaming sync endpoint requires authentication"""
+    response = client.get("/api/sync/changes")
+    assert response.status_code == 401
+
+
+@pytest.mark.sync
+def test_stream_sync_upload_ndjson(client, auth_headers):
+    """Test NDJSON upload applies each change and reports a status per line"""
+    import json
+    import uuid
+    from server import database as db
+
+    create_id = str(uuid.uuid4())
+    delete_id = str(uuid.uuid4())
+    now = get_iso_timestamp()
+    db.create_reminder({"id": delete_id, "text": "Delete me", "created_at": now, "updated_at": now})
+
+    lines = [
+        {"id": create_id, "action": "create", "updated_at": now,
+         "data": {"id": create_id, "text": "Uploaded offline", "priority": "chill",
+                  "created_at": now, "updated_at": now}},
+        {"id": create_id, "action": "update", "updated_at": get_iso_timestamp(5),
+         "data": {"text": "Edited offline"}},
+        {"id": delete_id, "action": "delete", "updated_at": now},
+    ]
+    body = "\n".join(json.dumps(line) for line in lines) + "\n"
+
+    response = client.post(
+        "/api/sync/stream",
+        headers={**auth_headers, "Content-Type": "application/x-ndjson"},
+        content=body
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    results = [json.loads(line) for line in response.text.splitlines()]
+    assert [r["status"] for r in results] == ["applied", "applied", "applied"]
+    assert results[1]["conflict"]["resolution"] == "client_wins"
+
+    assert db.get_reminder_by_id(create_id)["text"] == "Edited offline"
+    assert db.get_reminder_by_id(delete_id) is None
+
+
+@pytest.mark.sync
+def test_stream_sync_upload_invalid_line_continues(client, auth_headers):
+    """Test an invalid NDJSON line is reported without stopping the upload"""
+    import json
+    import uuid
+    from server import database as db
+
+    reminder_id = str(uuid.uuid4())
+    now = get_iso_timestamp()
+    valid = {"id": reminder_id, "action": "create", "updated_at": now,
+             "data": {"id": reminder_id, "text": "After bad line", "created_at": now, "updated_at": now}}
+    body = '{"id": "x", "action": "rename"}\n' + json.dumps(valid)
+
+    response = client.post(
+        "/api/sync/stream",
+        headers={**auth_headers, "Content-Type": "application/x-ndjson"},
+        content=body
+    )
+
+    assert response.status_code == 200
+    results = [json.loads(line) for line in response.text.splitlines()]
+    assert results[0]["status"] == "invalid"
+    assert results[0]["line"] == 1
+    assert results[1] == {"id": reminder_id, "status": "applied", "conflict": None}
+    assert db.get_reminder_by_id(reminder_id)["text"] == "After bad line"
+
+
+@pytest.mark.sync
+@pytest.mark.asyncio(loop_scope="session")
+async def test_stream_sync_upload_rejects_overlong_line(async_client, auth_headers, monkeypatch):
+    """Test a line over the size cap is reported invalid and later lines still apply"""
+    import json
+    import uuid
+    from server import database as db
+    from server import main
+
+    monkeypatch.setattr(main, "MAX_SYNC_LINE_BYTES", 512)
+    reminder_id = str(uuid.uuid4())
+    now = get_iso_timestamp()
+    valid = json.dumps({"id": reminder_id, "action": "create", "updated_at": now,
+                        "data": {"id": reminder_id, "text": "After long line",
+                                 "created_at": now, "updated_at": now}}).encode()
+
+    # The long line and the valid line both arrive split across chunks
+    async def chunks():
+        for chunk in (b"x" * 300, b"x" * 300, b"x" * 300 + b"\n" + valid[:50], valid[50:] + b"\n"):
+            yield chunk
+
+    response = await async_client.post(
+        "/api/sync/stream",
+        headers={**auth_headers, "Content-Type": "application/x-ndjson"},
+        content=chunks()
+    )
+
+    assert response.status_code == 200
+    results = [json.loads(line) for line in response.text.splitlines()]
+    assert results[0]["status"] == "invalid"
+    assert results[0]["line"] == 1
+    assert "512" in results[0]["error"]
+    assert results[1] == {"id": reminder_id, "status": "applied", "conflict": None}
+    assert db.get_reminder_by_id(reminder_id)["text"] == "After long line"
+
+
+@pytest.mark.sync
+def test_stream_sync_upload_without_authentication(client):
+    """Test NDJSON upload endpoint requires authentication"""
+    response = client.post("/api/sync/stream", content=b"")
+    assert response.status_code == 401
+
+
+@pytest.mark.sync
+def test_sync_change_data_ignores_unknown_fields(client, auth_headers):
+    """Test client change data with UI-only fields is applied without them"""
+    import uuid
+    from server import database as db
+
+    reminder_id = str(uuid.uuid4())
+    now = get_iso_timestamp()
+    sync_request = {
+        "client_id": "test-device-123",
+        "last_sync": now,
+        "changes": [
+            {
+                "id": reminder_id,
+                "action": "create",
+                "data": {
+                    "id": reminder_id,
+                    "text": "Created with extra fields",
+                    "distance": 42.0,
+                    "created_at": now,
+                    "updated_at": now
+                },
+                "updated_at": now
+            }
+        ]
+    }
+
+    response = client.post("/api/sync", headers=auth_headers, json=sync_request)
+
+    assert response.status_code == 200
+    assert response.json()["applied_count"] == 1
+    assert db.get_reminder_by_id(reminder_id)["text"] == "Created with extra fields"
+
+
+@pytest.mark.sync
+def test_sync_change_data_rejects_wrong_types(client, auth_headers):
+    """Test change data fields are type-checked"""
+    sync_request = {
+        "client_id": "test-device-123",
+        "last_sync": None,
+        "changes": [
+            {
+                "id": "bad-types",
+                "action": "update",
+                "data": {"location_lat": "not-a-number"},
+                "updated_at": get_iso_timestamp()
+            }
+        ]
+    }
+
+    response = client.post("/api/sync", headers=auth_headers, json=sync_request)
+    assert response.status_code == 422
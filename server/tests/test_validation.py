@@ -13,7 +13,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from pydantic import ValidationError
-from server.models import ReminderCreate, ReminderUpdate
+from server.models import ReminderCreate, ReminderUpdate, ReminderResponse
 
 
 class TestDateValidation:
@@ -726,3 +726,34 @@ class TestCombinedValidation:
         assert reminder.location_name is None
         assert reminder.priority == "chill"
         assert reminder.status == "pending"
+
+
+class TestReminderResponseFromRow:
+    """Test building responses from trusted database rows."""
+
+    def test_from_row_matches_validated_model(self):
+        """from_row should produce the same data as the validating constructor."""
+        row = {
+            "id": "550e8400-e29b-41d4-a716-446655440000",
+            "text": "Test",
+            "due_date": "2025-12-25",
+            "time_required": 1,
+            "location_radius": 100,
+            "priority": "urgent",
+            "status": "pending",
+            "source": "manual",
+            "created_at": "2025-11-02T10:00:00Z",
+            "updated_at": "2025-11-02T10:00:00Z",
+        }
+        assert ReminderResponse.from_row(row).model_dump() == ReminderResponse(**row).model_dump()
+
+    def test_from_row_converts_time_required(self):
+        """SQLite 0/1 time_required should become a bool."""
+        row = {
+            "id": "1",
+            "text": "Test",
+            "time_required": 0,
+            "created_at": "2025-11-02T10:00:00Z",
+            "updated_at": "2025-11-02T10:00:00Z",
+        }
+        assert ReminderResponse.from_row(row).time_required is False
@@ -21,14 +21,23 @@ Date: 2025-11-04
 
 import json
 import os
-from datetime import datetime, timedelta
-from typing import Dict, Optional, Any
+from datetime import date, timedelta
+from typing import Dict, Optional, Any, Tuple
 
 import httpx
+import orjson
 from pydantic import BaseModel, Field, ValidationError
 
 from server.voice.prompts import get_reminder_parse_prompt, get_user_message
 from server.voice.date_utils import parse_natural_date, parse_natural_time
+from server.voice.parser import (
+    cache_parse,
+    extract_json,
+    get_cached_parse,
+    get_shared_client,
+    normalize_choices,
+    parse_cache_key
+)
 
 
 class CloudflareAIParser:
@@ -55,7 +64,9 @@ class CloudflareAIParser:
         api_token: Optional[str] = None,
         model_name: str = "@cf/meta/llama-3-8b-instruct",
         timeout: float = 10.0,
-        max_retries: int = 2
+        max_retries: int = 2,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        pool_size: int = 20
     ):
         """
         Initialize CloudflareAIParser.
@@ -66,6 +77,10 @@ class CloudflareAIParser:
             model_name: Model identifier on Cloudflare Workers AI
             timeout: HTTP request timeout in seconds
             max_retries: Number of retry attempts for transient errors
+            transport: Optional httpx transport (e.g. httpx.MockTransport in tests);
+                gets its own client instead of the shared connection pool
+            pool_size: Connections kept in the shared pool (over HTTP/2 each one
+                multiplexes concurrent parses, so a few are usually enough)
 
         Raises:
             ValueError: If credentials are not provided and not found in secrets.json
@@ -88,15 +103,30 @@ class CloudflareAIParser:
         self.timeout = timeout
         self.max_retries = max_retries
 
-        # Create async HTTP client
-        self.client = httpx.AsyncClient(
-            base_url=self.CF_API_BASE,
-            timeout=httpx.Timeout(timeout),
-            headers={
-                "Authorization": f"Bearer {self.api_token}",
-                "Content-Type": "application/json"
-            }
-        )
+        headers = {
+            "Authorization": f"Bearer {self.api_token}",
+            "Content-Type": "application/json"
+        }
+
+        # Shared connection pool (per API token) unless a custom transport is given
+        if transport is None:
+            # Cloudflare speaks HTTP/2: concurrent parses share one TLS connection
+            self._shared_client = get_shared_client(
+                self.CF_API_BASE,
+                timeout,
+                headers=headers,
+                pool_size=pool_size,
+                http2=True
+            )
+            self.client = self._shared_client
+        else:
+            self._shared_client = None
+            self.client = httpx.AsyncClient(
+                base_url=self.CF_API_BASE,
+                timeout=httpx.Timeout(timeout),
+                headers=headers,
+                transport=transport
+            )
 
     def _load_secrets(self) -> Dict[str, str]:
         """
@@ -120,15 +150,17 @@ class CloudflareAIParser:
         return {}
 
     async def close(self):
-        """Close the HTTP client (cleanup)."""
-        await self.client.aclose()
+        """Close the HTTP client (cleanup). The shared pool stays open."""
+        if self.client is not self._shared_client:
+            await self.client.aclose()
 
-    async def parse_reminder_text(self, text: str) -> Dict[str, Any]:
+    async def parse_reminder_text(self, text: str, use_cache: bool = True) -> Dict[str, Any]:
         """
         Parse reminder text using Cloudflare Workers AI.
 
         Args:
             text: Natural language reminder text
+            use_cache: Return (and store) cached parses of the same text
 
         Returns:
             Dictionary with parsed metadata (same format as LocalLLMParser)
@@ -139,11 +171,17 @@ class CloudflareAIParser:
         if not text or not text.strip():
             return self._empty_parse(text or "", 0.0)
 
+        cache_key = self._cache_key(text)
+        if use_cache:
+            cached = get_cached_parse(cache_key)
+            if cached is not None:
+                return cached
+
         # Retry logic for transient errors
         last_error = None
         for attempt in range(self.max_retries + 1):
             try:
-                result = await self._parse_attempt(text)
+                result = await self._parse_attempt(text, cache_key if use_cache else None)
                 return result
 
             except httpx.HTTPStatusError as e:
@@ -178,19 +216,21 @@ class CloudflareAIParser:
         print(f"[CloudflareAIParser] All retry attempts failed: {last_error}")
         return self._empty_parse(text, 0.1)
 
-    async def _parse_attempt(self, text: str) -> Dict[str, Any]:
+    async def _parse_attempt(self, text: str, cache_key: Optional[Tuple] = None) -> Dict[str, Any]:
         """
         Single parse attempt (called by retry logic).
 
         Args:
             text: Reminder text to parse
+            cache_key: Parse cache key to store a successful result under
 
         Returns:
             Parsed metadata dictionary
         """
         # Get current date for prompt context
-        current_date = datetime.now().strftime('%Y-%m-%d')
-        tomorrow_date = (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
+        today = date.today()
+        current_date = today.isoformat()
+        tomorrow_date = (today + timedelta(days=1)).isoformat()
 
         # Use streamlined prompt for Cloudflare AI (smaller model needs concise instructions)
         system_prompt = f"""Extract reminder metadata as JSON. Current date: {current_date}.
@@ -232,10 +272,10 @@ Rules:
         }
 
         # Call Cloudflare Workers AI
-        response = await self.client.post(endpoint, json=request_body)
+        response = await self.client.post(endpoint, content=orjson.dumps(request_body))
         response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
 
         # Cloudflare response format: { "result": { "response": "..." }, "success": true }
         if not data.get("success"):
@@ -258,8 +298,15 @@ Rules:
         # Add parse mode
         validated["parse_mode"] = "cloud"
 
+        if cache_key is not None:
+            cache_parse(cache_key, validated)
+
         return validated
 
+    def _cache_key(self, text: str) -> Tuple:
+        """Parse cache key for text with this parser's model and account."""
+        return parse_cache_key(text, "cloud", self.account_id, self.model_name)
+
     def _extract_json(self, llm_response: str) -> Optional[Dict]:
         """
         Extract JSON from LLM response (same logic as LocalLLMParser).
@@ -270,31 +317,7 @@ Rules:
         Returns:
             Parsed JSON dict or None
         """
-        try:
-            return json.loads(llm_response.strip())
-        except json.JSONDecodeError:
-            pass
-
-        # Try code blocks
-        if "```json" in llm_response:
-            start = llm_response.find("```json") + 7
-            end = llm_response.find("```", start)
-            if end != -1:
-                try:
-                    return json.loads(llm_response[start:end].strip())
-                except json.JSONDecodeError:
-                    pass
-
-        # Try brace extraction
-        start = llm_response.find('{')
-        end = llm_response.rfind('}')
-        if start != -1 and end != -1 and end > start:
-            try:
-                return json.loads(llm_response[start:end+1])
-            except json.JSONDecodeError:
-                pass
-
-        return None
+        return extract_json(llm_response)
 
     def _validate_and_normalize(self, parsed_json: Dict, original_text: str) -> Dict[str, Any]:
         """
@@ -320,25 +343,8 @@ Rules:
             "confidence": parsed_json.get("confidence", 0.5)
         }
 
-        # Validate priority
-        valid_priorities = {"urgent", "important", "chill", "someday", "waiting"}
-        if result.get("priority") and result["priority"].lower() not in valid_priorities:
-            result["priority"] = None
-            result["confidence"] *= 0.9
-
-        # Validate category
-        valid_categories = {
-            "Personal", "Work", "Errands", "Home",
-            "Health", "Calls", "Shopping", "Projects"
-        }
-        if result.get("category") and result["category"] not in valid_categories:
-            result["category"] = None
-            result["confidence"] *= 0.9
-
-        # Clamp confidence
-        result["confidence"] = max(0.0, min(1.0, result["confidence"]))
-
-        return result
+        # Validate priority/category, clamp confidence
+        return normalize_choices(result)
 
     def _empty_parse(self, text: str, confidence: float) -> Dict[str, Any]:
         """
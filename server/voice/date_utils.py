@@ -18,10 +18,12 @@ Date: 2025-11-04
 
 import re
 from datetime import datetime, time as dt_time, timedelta
+from functools import lru_cache
 from typing import Optional, Tuple
 from zoneinfo import ZoneInfo
 
 import dateparser
+from dateparser.date import DateDataParser
 from dateutil import parser as dateutil_parser
 
 
@@ -44,6 +46,54 @@ def get_system_timezone() -> ZoneInfo:
 
 SYSTEM_TZ = get_system_timezone()
 
+# Input is English voice/typed text. Pinning the language skips dateparser's
+# per-call language detection across every installed locale, which otherwise
+# dominates parse time.
+DATEPARSER_LANGUAGES = ['en']
+
+# Reused parser for time extraction: its settings never change, so the
+# language pipeline is built once instead of on every call
+_TIME_FALLBACK_PARSER = DateDataParser(
+    languages=DATEPARSER_LANGUAGES,
+    settings={
+        'PREFER_DATES_FROM': 'future',
+        'TIMEZONE': str(SYSTEM_TZ),
+        'RETURN_AS_TIMEZONE_AWARE': True
+    }
+)
+
+# Named time mappings (specific times)
+SPECIFIC_NAMED_TIMES = {
+    'noon': '12:00:00',
+    'midnight': '00:00:00',
+    '12pm': '12:00:00',
+    '12am': '00:00:00',
+}
+
+# Vague time mappings (approximate times)
+VAGUE_NAMED_TIMES = {
+    'morning': '09:00:00',
+    'afternoon': '14:00:00',
+    'evening': '20:00:00',
+    'tonight': '20:00:00',
+    'night': '21:00:00',
+}
+
+# Time patterns, tried in order
+# Match patterns like: 3pm, 3:30pm, 15:00, 1500, 3 o'clock
+TIME_PATTERNS = [
+    # 12-hour format with minutes: "3:30pm", "11:45am"
+    re.compile(r'\b(\d{1,2}):(\d{2})\s*(am|pm)\b'),
+    # 12-hour format without minutes: "3pm", "11am"
+    re.compile(r'\b(\d{1,2})\s*(am|pm)\b'),
+    # 24-hour format with colon: "15:00", "09:30"
+    re.compile(r'\b(\d{1,2}):(\d{2})\b'),
+    # 24-hour format without colon: "1500", "0930"
+    re.compile(r'\b(\d{4})\b'),
+    # "o'clock" format: "3 o'clock"
+    re.compile(r"\b(\d{1,2})\s*o[\\'\\']?clock\b"),
+]
+
 
 def parse_natural_date(text: str, reference_date: Optional[datetime] = None) -> Optional[str]:
     """
@@ -86,6 +136,7 @@ def parse_natural_date(text: str, reference_date: Optional[datetime] = None) ->
         # Parse with dateparser using future-preference for ambiguous dates
         parsed_date = dateparser.parse(
             text,
+            languages=DATEPARSER_LANGUAGES,
             settings={
                 'PREFER_DATES_FROM': 'future',  # "Monday" means next Monday
                 'RELATIVE_BASE': reference_date,
@@ -96,7 +147,7 @@ def parse_natural_date(text: str, reference_date: Optional[datetime] = None) ->
 
         if parsed_date:
             # Return ISO 8601 date string (YYYY-MM-DD)
-            return parsed_date.strftime('%Y-%m-%d')
+            return parsed_date.date().isoformat()
 
         return None
 
@@ -106,83 +157,33 @@ def parse_natural_date(text: str, reference_date: Optional[datetime] = None) ->
         return None
 
 
-def parse_natural_time(text: str) -> Optional[Tuple[str, bool]]:
+@lru_cache(maxsize=4096)
+def _match_time_expression(text_lower: str) -> Optional[Tuple[str, bool]]:
     """
-    Parse natural language time expression to HH:MM:SS format.
+    Match named times and explicit time patterns in lowercased text.
+
+    Pure function of the text (no clock dependence), so results are cached;
+    time phrases in reminders repeat heavily.
 
     Args:
-        text: Natural language text containing a time (e.g., "3pm", "noon", "morning")
+        text_lower: Lowercased input text
 
     Returns:
-        Tuple of (time_string, is_specific) or None if no time found.
-        - time_string: ISO 8601 time (HH:MM:SS)
-        - is_specific: True if exact time (3pm), False if vague (morning)
-
-    Examples:
-        >>> parse_natural_time("3pm")
-        ('15:00:00', True)
-
-        >>> parse_natural_time("3:30pm")
-        ('15:30:00', True)
-
-        >>> parse_natural_time("noon")
-        ('12:00:00', True)
-
-        >>> parse_natural_time("morning")
-        ('09:00:00', False)  # Vague time
-
-        >>> parse_natural_time("no time here")
-        None
+        Tuple of (time_string, is_specific) or None if nothing matched.
     """
-    if not text or not text.strip():
-        return None
-
-    text_lower = text.lower()
-
-    # Named time mappings (specific times)
-    specific_named_times = {
-        'noon': '12:00:00',
-        'midnight': '00:00:00',
-        '12pm': '12:00:00',
-        '12am': '00:00:00',
-    }
-
-    # Vague time mappings (approximate times)
-    vague_named_times = {
-        'morning': '09:00:00',
-        'afternoon': '14:00:00',
-        'evening': '20:00:00',
-        'tonight': '20:00:00',
-        'night': '21:00:00',
-    }
-
     # Check for specific named times first
-    for keyword, time_str in specific_named_times.items():
+    for keyword, time_str in SPECIFIC_NAMED_TIMES.items():
         if keyword in text_lower:
             return (time_str, True)
 
     # Check for vague named times
-    for keyword, time_str in vague_named_times.items():
+    for keyword, time_str in VAGUE_NAMED_TIMES.items():
         if keyword in text_lower:
             return (time_str, False)
 
     # Try to extract time patterns with regex
-    # Match patterns like: 3pm, 3:30pm, 15:00, 1500, 3 o'clock
-    time_patterns = [
-        # 12-hour format with minutes: "3:30pm", "11:45am"
-        r'\b(\d{1,2}):(\d{2})\s*(am|pm)\b',
-        # 12-hour format without minutes: "3pm", "11am"
-        r'\b(\d{1,2})\s*(am|pm)\b',
-        # 24-hour format with colon: "15:00", "09:30"
-        r'\b(\d{1,2}):(\d{2})\b',
-        # 24-hour format without colon: "1500", "0930"
-        r'\b(\d{4})\b',
-        # "o'clock" format: "3 o'clock"
-        r"\b(\d{1,2})\s*o[\\'\\']?clock\b",
-    ]
-
-    for pattern in time_patterns:
-        match = re.search(pattern, text_lower)
+    for pattern in TIME_PATTERNS:
+        match = pattern.search(text_lower)
         if match:
             groups = match.groups()
 
@@ -238,21 +239,53 @@ def parse_natural_time(text: str) -> Optional[Tuple[str, bool]]:
                 if 0 <= hour <= 23:
                     return (f"{hour:02d}:00:00", True)
 
+    return None
+
+
+def parse_natural_time(text: str) -> Optional[Tuple[str, bool]]:
+    """
+    Parse natural language time expression to HH:MM:SS format.
+
+    Args:
+        text: Natural language text containing a time (e.g., "3pm", "noon", "morning")
+
+    Returns:
+        Tuple of (time_string, is_specific) or None if no time found.
+        - time_string: ISO 8601 time (HH:MM:SS)
+        - is_specific: True if exact time (3pm), False if vague (morning)
+
+    Examples:
+        >>> parse_natural_time("3pm")
+        ('15:00:00', True)
+
+        >>> parse_natural_time("3:30pm")
+        ('15:30:00', True)
+
+        >>> parse_natural_time("noon")
+        ('12:00:00', True)
+
+        >>> parse_natural_time("morning")
+        ('09:00:00', False)  # Vague time
+
+        >>> parse_natural_time("no time here")
+        None
+    """
+    if not text or not text.strip():
+        return None
+
+    # Keyword/pattern matches depend only on the text, so they are memoized
+    result = _match_time_expression(text.lower())
+    if result is not None:
+        return result
+
     # Try dateparser as fallback for complex expressions like "in 2 hours"
     try:
-        parsed_datetime = dateparser.parse(
-            text,
-            settings={
-                'PREFER_DATES_FROM': 'future',
-                'TIMEZONE': str(SYSTEM_TZ),
-                'RETURN_AS_TIMEZONE_AWARE': True
-            }
-        )
+        parsed_datetime = _TIME_FALLBACK_PARSER.get_date_data(text).date_obj
 
         if parsed_datetime:
             # Only return if the parsed time is different from the reference time
             # (i.e., actual time information was extracted)
-            time_str = parsed_datetime.strftime('%H:%M:%S')
+            time_str = parsed_datetime.time().isoformat(timespec='seconds')
             return (time_str, True)
 
     except Exception:
@@ -324,7 +357,7 @@ def get_relative_date(days_offset: int, reference_date: Optional[datetime] = Non
         reference_date = reference_date.replace(tzinfo=SYSTEM_TZ)
 
     target_date = reference_date + timedelta(days=days_offset)
-    return target_date.strftime('%Y-%m-%d')
+    return target_date.date().isoformat()
 
 
 def is_past_date(date_str: str, reference_date: Optional[datetime] = None) -> bool:
@@ -17,12 +17,20 @@ Date: 2025-11-04
 """
 
 import json
-from datetime import datetime
-from typing import Dict, Optional, Any
-from enum import Enum
+from collections import OrderedDict
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Dict, Optional, Any, Tuple
 
 import httpx
-from pydantic import BaseModel, Field, ValidationError
+import orjson
+
+try:
+    import h2  # noqa: F401  (enables httpx's HTTP/2 support)
+    HTTP2_AVAILABLE = True
+except ImportError:  # Optional: falls back to HTTP/1.1 keep-alive
+    HTTP2_AVAILABLE = False
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
 from server.voice.prompts import get_reminder_parse_prompt, get_user_message
 from server.voice.date_utils import (
@@ -31,17 +39,298 @@ from server.voice.date_utils import (
     is_past_date,
     get_relative_date
 )
+from server.models import PRIORITIES, Confidence
+
+# Values accepted from LLM output; anything else is dropped during normalization
+VALID_PRIORITIES = PRIORITIES
+VALID_CATEGORIES = frozenset({
+    "Personal", "Work", "Errands", "Home",
+    "Health", "Calls", "Shopping", "Projects"
+})
+
+
+
+def normalize_choices(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Drop out-of-vocabulary priority/category values and clamp confidence.
+
+    Each dropped value costs 10% confidence. Shared by both parsers so local
+    and cloud parses follow the same rules; the fields are read once into
+    locals and the allowed values are frozensets, so this is a single pass.
+
+    Args:
+        result: Parse result dict (modified in place)
+
+    Returns:
+        The same dict
+    """
+    confidence = result.get("confidence", 0.5)
+
+    priority = result.get("priority")
+    if priority and priority.lower() not in VALID_PRIORITIES:
+        result["priority"] = None
+        confidence *= 0.9
+
+    category = result.get("category")
+    if category and category not in VALID_CATEGORIES:
+        result["category"] = None
+        confidence *= 0.9
+
+    result["confidence"] = max(0.0, min(1.0, confidence))
+    return result
+
+# HTTP clients shared by all parser instances, keyed by base URL and client
+# settings. The parse endpoint builds parsers per request; sharing the client
+# keeps keep-alive connections to LM Studio / Cloudflare open between calls.
+_SHARED_CLIENTS: Dict[Tuple, httpx.AsyncClient] = {}
+
+
+def get_shared_client(
+    base_url: str,
+    timeout: float,
+    headers: Optional[Dict[str, str]] = None,
+    pool_size: int = 20,
+    http2: bool = False
+) -> httpx.AsyncClient:
+    """
+    Get the shared AsyncClient for these settings, creating it on first use.
+
+    Args:
+        base_url: Base URL for all requests
+        timeout: Request timeout in seconds
+        headers: Default headers (e.g. Authorization)
+        pool_size: Maximum (and keep-alive) connections in the pool. With
+            HTTP/1.1 this caps concurrent requests; with HTTP/2 each
+            connection multiplexes many requests, so it can stay small
+        http2: Negotiate HTTP/2 (ignored when the h2 package is missing)
+
+    Returns:
+        Open httpx.AsyncClient; callers must not close it
+    """
+    http2 = http2 and HTTP2_AVAILABLE
+    key = (base_url, timeout, tuple(sorted((headers or {}).items())), pool_size, http2)
+    client = _SHARED_CLIENTS.get(key)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=httpx.Timeout(timeout),
+            headers=headers,
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+            http2=http2
+        )
+        _SHARED_CLIENTS[key] = client
+    return client
+
+
+async def close_shared_clients():
+    """Close every shared parser client (application shutdown)."""
+    clients = list(_SHARED_CLIENTS.values())
+    _SHARED_CLIENTS.clear()
+    for client in clients:
+        await client.aclose()
+
+
+# Successful LLM parses shared by all parser instances, least recently used
+# first. At the low sampling temperature used here the same text parses the
+# same way on a given day, so re-entering it skips the LLM round trip.
+_PARSE_CACHE: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+PARSE_CACHE_SIZE = 2048
+
+
+def parse_cache_key(text: str, *settings: Any) -> Tuple:
+    """
+    Build a parse cache key.
+
+    The text is case- and whitespace-normalized ("Call  Mom" == "call mom").
+    Today's date is included because relative dates ("tomorrow") resolve
+    against it; settings identify the parser/model that produced the result.
+    """
+    return (" ".join(text.split()).casefold(), date.today().isoformat()) + settings
 
 
-class ParseMode(str, Enum):
-    """Parsing mode for reminder text."""
-    LOCAL = "local"
-    CLOUD = "cloud"
-    AUTO = "auto"
+def get_cached_parse(key: Tuple) -> Optional[Dict[str, Any]]:
+    """Return a copy of the cached parse for key, or None on a miss."""
+    result = _PARSE_CACHE.get(key)
+    if result is None:
+        return None
+    _PARSE_CACHE.move_to_end(key)
+    return dict(result)
+
+
+def cache_parse(key: Tuple, result: Dict[str, Any]):
+    """Store a successful parse, evicting the least recently used entry when full."""
+    _PARSE_CACHE[key] = dict(result)
+    _PARSE_CACHE.move_to_end(key)
+    if len(_PARSE_CACHE) > PARSE_CACHE_SIZE:
+        _PARSE_CACHE.popitem(last=False)
+
+
+def clear_parse_cache():
+    """Drop every cached parse."""
+    _PARSE_CACHE.clear()
+
+
+# Placeholder for the user message while a chat body template is serialized;
+# a NUL escape cannot come out of the prompt text itself
+_USER_SLOT = "\x00user\x00"
+
+
+@lru_cache(maxsize=16)
+def chat_body_template(
+    current_date: str,
+    model_name: str,
+    temperature: float,
+    max_tokens: int
+) -> Tuple[bytes, bytes]:
+    """
+    Serialized LM Studio request body, split around the user message.
+
+    Everything but the user message (the few-shot system prompt included)
+    only changes with the date and parser settings, so it is built and
+    encoded once; a request is then prefix + orjson.dumps(message) + suffix.
 
+    Args:
+        current_date: ISO date for the system prompt
+        model_name: Model identifier in LM Studio
+        temperature: LLM sampling temperature
+        max_tokens: Maximum tokens for completion
+
+    Returns:
+        (prefix, suffix) JSON bytes
+    """
+    body = orjson.dumps({
+        "model": model_name,
+        "messages": [
+            {"role": "system", "content": get_reminder_parse_prompt(current_date)},
+            {"role": "user", "content": _USER_SLOT}
+        ],
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "stream": True
+    })
+    prefix, _, suffix = body.partition(orjson.dumps(_USER_SLOT))
+    return prefix, suffix
+
+
+# raw_decode() decodes one value starting at an offset and reports where it ended
+_JSON_DECODER = json.JSONDecoder()
+
+
+def extract_json(llm_response: str) -> Optional[Dict]:
+    """
+    Extract the JSON object from LLM response text.
+
+    Candidates, in order: the whole response, a ```json fenced block, the span
+    from the first '{' to the last '}', then the first complete object from
+    that '{'. Each is located with a single str.find/rfind (or the json
+    module's C scanner) and decoded with orjson, which skips surrounding
+    whitespace, so no extra strip copies are made.
+
+    Args:
+        llm_response: Raw text response from LLM
+
+    Returns:
+        Parsed JSON or None if extraction fails
+    """
+    try:
+        return orjson.loads(llm_response)
+    except orjson.JSONDecodeError:
+        pass
+
+    # JSON in a code block (```json ... ```)
+    fence = llm_response.find("```json")
+    if fence != -1:
+        start = fence + 7
+        end = llm_response.find("```", start)
+        if end != -1:
+            try:
+                return orjson.loads(llm_response[start:end])
+            except orjson.JSONDecodeError:
+                pass
+
+    # First { to last }
+    start = llm_response.find('{')
+    end = llm_response.rfind('}')
+    if start != -1 and end > start:
+        try:
+            return orjson.loads(llm_response[start:end + 1])
+        except orjson.JSONDecodeError:
+            pass
+
+        # Trailing text contains braces too: take the first complete object,
+        # letting the C scanner behind raw_decode find its closing brace
+        try:
+            return _JSON_DECODER.raw_decode(llm_response, start)[0]
+        except ValueError:
+            pass
+
+    return None
+
+
+def _has_complete_object(text: str) -> bool:
+    """True once text holds a complete JSON object after its first '{'."""
+    start = text.find('{')
+    if start == -1:
+        return False
+    try:
+        _JSON_DECODER.raw_decode(text, start)
+        return True
+    except ValueError:
+        return False
+
+
+async def read_chat_content(response: httpx.Response) -> str:
+    """
+    Read the assistant message from a chat completion response.
+
+    Streamed (text/event-stream) replies are consumed frame by frame and
+    reading stops as soon as the message holds a complete JSON object, so
+    the caller can close the stream before the model writes any trailing
+    explanation. Plain JSON replies (servers that ignore "stream") are read
+    whole.
+
+    Args:
+        response: Open response from AsyncClient.stream()
+
+    Returns:
+        Assistant message text (possibly cut after the first JSON object)
+
+    Raises:
+        ValueError: If the reply has no choices
+    """
+    if not response.headers.get("content-type", "").startswith("text/event-stream"):
+        data = orjson.loads(await response.aread())
+        if "choices" not in data or len(data["choices"]) == 0:
+            raise ValueError("No response from LLM")
+        return data["choices"][0]["message"]["content"]
+
+    parts = []
+    async for line in response.aiter_lines():
+        if not line.startswith("data:"):
+            continue
+        payload = line[5:].strip()
+        if payload == "[DONE]":
+            break
+
+        choices = orjson.loads(payload).get("choices") or []
+        delta = choices[0].get("delta", {}).get("content") if choices else None
+        if not delta:
+            continue
+        parts.append(delta)
+
+        # Only a closing brace can complete the object
+        if '}' in delta and _has_complete_object("".join(parts)):
+            break
+
+    if not parts:
+        raise ValueError("No response from LLM")
+    return "".join(parts)
 
 class ParsedReminder(BaseModel):
     """Validated parsed reminder metadata from LLM."""
+    # LLMs often add stray keys; drop them rather than fail the whole parse
+    model_config = ConfigDict(extra="ignore")
+
     text: str = Field(..., description="Core reminder text")
     due_date: Optional[str] = Field(None, description="ISO date (YYYY-MM-DD)")
     due_time: Optional[str] = Field(None, description="ISO time (HH:MM:SS)")
@@ -49,7 +338,7 @@ class ParsedReminder(BaseModel):
     priority: Optional[str] = Field(None, description="Priority level")
     category: Optional[str] = Field(None, description="Category")
     location: Optional[str] = Field(None, description="Location name/address")
-    confidence: float = Field(0.0, ge=0.0, le=1.0, description="Overall confidence")
+    confidence: Confidence = Field(0.0, description="Overall confidence")
 
 
 class LocalLLMParser:
@@ -73,7 +362,9 @@ class LocalLLMParser:
         model_name: str = "llama-3.2-1b-instruct",
         timeout: float = 10.0,
         temperature: float = 0.3,
-        max_tokens: int = 400
+        max_tokens: int = 400,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        pool_size: int = 20
     ):
         """
         Initialize the LocalLLMParser.
@@ -84,6 +375,9 @@ class LocalLLMParser:
             timeout: HTTP request timeout in seconds
             temperature: LLM sampling temperature (0.0-1.0)
             max_tokens: Maximum tokens for completion
+            transport: Optional httpx transport (e.g. httpx.MockTransport in tests);
+                gets its own client instead of the shared connection pool
+            pool_size: Connections kept in the shared pool
         """
         self.lm_studio_url = lm_studio_url.rstrip('/')
         self.model_name = model_name
@@ -91,22 +385,30 @@ class LocalLLMParser:
         self.temperature = temperature
         self.max_tokens = max_tokens
 
-        # Create async HTTP client
-        self.client = httpx.AsyncClient(
-            base_url=self.lm_studio_url,
-            timeout=httpx.Timeout(timeout)
-        )
+        # Reuse the shared connection pool unless a custom transport is given
+        if transport is None:
+            self._shared_client = get_shared_client(self.lm_studio_url, timeout, pool_size=pool_size)
+            self.client = self._shared_client
+        else:
+            self._shared_client = None
+            self.client = httpx.AsyncClient(
+                base_url=self.lm_studio_url,
+                timeout=httpx.Timeout(timeout),
+                transport=transport
+            )
 
     async def close(self):
-        """Close the HTTP client (cleanup)."""
-        await self.client.aclose()
+        """Close the HTTP client (cleanup). The shared pool stays open."""
+        if self.client is not self._shared_client:
+            await self.client.aclose()
 
-    async def parse_reminder_text(self, text: str) -> Dict[str, Any]:
+    async def parse_reminder_text(self, text: str, use_cache: bool = True) -> Dict[str, Any]:
         """
         Parse reminder text into structured metadata using local LLM.
 
         Args:
             text: Natural language reminder text from voice or typing
+            use_cache: Return (and store) cached parses of the same text
 
         Returns:
             Dictionary with parsed metadata:
@@ -128,36 +430,30 @@ class LocalLLMParser:
         if not text or not text.strip():
             return self._empty_parse(text or "", 0.0)
 
-        try:
-            # Get current date for prompt context
-            current_date = datetime.now().strftime('%Y-%m-%d')
+        cache_key = self._cache_key(text)
+        if use_cache:
+            cached = get_cached_parse(cache_key)
+            if cached is not None:
+                return cached
 
-            # Generate system prompt with few-shot examples
-            system_prompt = get_reminder_parse_prompt(current_date)
+        try:
+            # System prompt (with few-shot examples) for today's date, pre-encoded
+            prefix, suffix = chat_body_template(
+                date.today().isoformat(), self.model_name, self.temperature, self.max_tokens
+            )
             user_message = get_user_message(text)
 
-            # Call LM Studio API (OpenAI-compatible)
-            response = await self.client.post(
+            # Call LM Studio API (OpenAI-compatible, streamed). Leaving the
+            # block closes the stream, which stops generation once the JSON
+            # object is complete.
+            async with self.client.stream(
+                "POST",
                 "/v1/chat/completions",
-                json={
-                    "model": self.model_name,
-                    "messages": [
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_message}
-                    ],
-                    "temperature": self.temperature,
-                    "max_tokens": self.max_tokens
-                }
-            )
-
-            response.raise_for_status()
-            data = response.json()
-
-            # Extract LLM response
-            if "choices" not in data or len(data["choices"]) == 0:
-                raise ValueError("No response from LLM")
-
-            llm_response = data["choices"][0]["message"]["content"]
+                content=prefix + orjson.dumps(user_message) + suffix,
+                headers={"Content-Type": "application/json"}
+            ) as response:
+                response.raise_for_status()
+                llm_response = await read_chat_content(response)
 
             # Parse JSON response
             parsed_json = self._extract_json(llm_response)
@@ -173,6 +469,9 @@ class LocalLLMParser:
             # Add parse mode
             validated["parse_mode"] = "local"
 
+            if use_cache:
+                cache_parse(cache_key, validated)
+
             return validated
 
         except httpx.ConnectError:
@@ -184,12 +483,18 @@ class LocalLLMParser:
             # Return empty parse with low confidence on errors
             return self._empty_parse(text, 0.1)
 
+    def _cache_key(self, text: str) -> Tuple:
+        """Parse cache key for text with this parser's model settings."""
+        return parse_cache_key(
+            text, "local", self.lm_studio_url, self.model_name, self.temperature, self.max_tokens
+        )
+
     def _extract_json(self, llm_response: str) -> Optional[Dict]:
         """
         Extract JSON object from LLM response text.
 
         The LLM might return JSON with extra text or markdown formatting.
-        This function attempts to extract the JSON cleanly.
+        See extract_json().
 
         Args:
             llm_response: Raw text response from LLM
@@ -197,32 +502,7 @@ class LocalLLMParser:
         Returns:
             Parsed JSON dict or None if extraction fails
         """
-        try:
-            # Try direct JSON parse first
-            return json.loads(llm_response.strip())
-        except json.JSONDecodeError:
-            pass
-
-        # Try to find JSON in code blocks (```json ... ```)
-        if "```json" in llm_response:
-            start = llm_response.find("```json") + 7
-            end = llm_response.find("```", start)
-            if end != -1:
-                try:
-                    return json.loads(llm_response[start:end].strip())
-                except json.JSONDecodeError:
-                    pass
-
-        # Try to find first { and last }
-        start = llm_response.find('{')
-        end = llm_response.rfind('}')
-        if start != -1 and end != -1 and end > start:
-            try:
-                return json.loads(llm_response[start:end+1])
-            except json.JSONDecodeError:
-                pass
-
-        return None
+        return extract_json(llm_response)
 
     def _validate_and_normalize(self, parsed_json: Dict, original_text: str) -> Dict[str, Any]:
         """
@@ -236,8 +516,8 @@ class LocalLLMParser:
             Validated and normalized dictionary
         """
         try:
-            # Use Pydantic for validation
-            validated = ParsedReminder(**parsed_json)
+            # Validate the decoded dict directly (no **kwargs repacking)
+            validated = ParsedReminder.model_validate(parsed_json)
             result = validated.model_dump()
 
         except ValidationError as e:
@@ -282,25 +562,8 @@ class LocalLLMParser:
                 result["due_time"] = None
                 result["confidence"] *= 0.9
 
-        # Validate priority values
-        valid_priorities = {"urgent", "important", "chill", "someday", "waiting"}
-        if result.get("priority") and result["priority"].lower() not in valid_priorities:
-            result["priority"] = None
-            result["confidence"] *= 0.9
-
-        # Validate category values
-        valid_categories = {
-            "Personal", "Work", "Errands", "Home",
-            "Health", "Calls", "Shopping", "Projects"
-        }
-        if result.get("category") and result["category"] not in valid_categories:
-            result["category"] = None
-            result["confidence"] *= 0.9
-
-        # Ensure confidence is in [0.0, 1.0]
-        result["confidence"] = max(0.0, min(1.0, result.get("confidence", 0.5)))
-
-        return result
+        # Validate priority/category values, keep confidence in [0.0, 1.0]
+        return normalize_choices(result)
 
     def _empty_parse(self, text: str, confidence: float) -> Dict[str, Any]:
         """
@@ -24,7 +24,7 @@ Author: Claude Sonnet 4.5 (Phase 8.2)
 Date: 2025-11-09
 """
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import Dict
 
 
@@ -43,7 +43,7 @@ def get_reminder_parse_prompt(current_date: str = None) -> str:
         Prompt is ~1200 tokens. Designed for models with 8K+ context window.
     """
     if current_date is None:
-        current_date = datetime.now().strftime("%Y-%m-%d")
+        current_date = date.today().isoformat()
 
     prompt = f"""You are an AI assistant that extracts structured reminder metadata from natural language text.
 